@@ -0,0 +1,165 @@
+"""Export of businesses' orders as CSV or NDJSON lines.
+
+Orders are read with values() and iterator(), so only one chunk of rows is
+kept in memory, and every row is converted to a line of text as soon as it
+is read. Lines are produced by generators which can be streamed to a
+response or written to a file.
+"""
+
+import csv
+import json
+from datetime import date, datetime, time, timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from api.models import Order
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = {
+    "id": "id",
+    "start_time": "start_time",
+    "end_time": "end_time",
+    "status": "status",
+    "service": "service__name",
+    "price": "service__price",
+    "specialist_first_name": "specialist__first_name",
+    "specialist_last_name": "specialist__last_name",
+    "specialist_email": "specialist__email",
+    "customer_first_name": "customer__first_name",
+    "customer_last_name": "customer__last_name",
+    "customer_email": "customer__email",
+}
+
+STATUS_NAMES = {
+    status_str.lower(): status_int
+    for status_str, status_int in Order.StatusChoices.__members__.items()
+}
+
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Echo:
+    """File-like object which returns written value instead of storing it."""
+
+    def write(self, value):
+        """Return the written value."""
+        return value
+
+
+def parse_export_filters(params):
+    """Return filters of exported orders from request parameters.
+
+    Args:
+        params (QueryDict): optional from and to dates in ISO format and
+            status names, status may be repeated
+
+    Returns:
+        dict: date_from, date_to and statuses, None for missing filters
+
+    Raises:
+        ValueError: if parameters are invalid
+    """
+    try:
+        date_from, date_to = (
+            date.fromisoformat(params[name]) if params.get(name) else None
+            for name in ("from", "to")
+        )
+    except ValueError:
+        raise ValueError("from and to values should be dates in YYYY-MM-DD format")
+
+    if date_from and date_to and date_from > date_to:
+        raise ValueError("from value should not be later than to value")
+
+    statuses = params.getlist("status")
+    unknown = set(statuses) - set(STATUS_NAMES)
+    if unknown:
+        raise ValueError(f"status values should be some of: {', '.join(STATUS_NAMES)}")
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "statuses": [STATUS_NAMES[status] for status in statuses] or None,
+    }
+
+
+def get_orders_for_export(businesses, date_from=None, date_to=None, statuses=None):
+    """Return values of orders of the businesses ordered by start time.
+
+    Args:
+        businesses (QuerySet[Business] | list): businesses or their ids
+        date_from (date, optional): first local day of orders
+        date_to (date, optional): last local day of orders
+        statuses (list, optional): statuses of orders
+
+    Returns:
+        QuerySet: dicts with EXPORT_FIELDS values
+    """
+    orders = Order.objects.filter(service__position__business__in=businesses)
+
+    if date_from:
+        orders = orders.filter(
+            start_time__gte=timezone.make_aware(datetime.combine(date_from, time.min)),
+        )
+    if date_to:
+        orders = orders.filter(
+            start_time__lt=timezone.make_aware(
+                datetime.combine(date_to + timedelta(days=1), time.min),
+            ),
+        )
+    if statuses is not None:
+        orders = orders.filter(status__in=statuses)
+
+    return orders.order_by("start_time", "id").values(*EXPORT_FIELDS.values())
+
+
+def format_row(row):
+    """Return exported row with local times and status name."""
+    result = {name: row[field] for name, field in EXPORT_FIELDS.items()}
+    result["start_time"] = timezone.localtime(row["start_time"]).isoformat()
+    result["end_time"] = timezone.localtime(row["end_time"]).isoformat()
+    result["status"] = Order.StatusChoices(row["status"]).name.lower()
+
+    return result
+
+
+def escape_csv_row(row):
+    """Return row with text values which spreadsheets run as formulas quoted.
+
+    Names and emails are entered by users, so such values are prefixed with
+    an apostrophe and shown as plain text when the CSV file is opened.
+    """
+    return {
+        name: f"'{value}" if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES)
+        else value
+        for name, value in row.items()
+    }
+
+
+def iter_rows(orders):
+    """Yield formatted rows reading orders by chunks."""
+    for row in orders.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield format_row(row)
+
+
+def iter_csv(orders):
+    """Yield CSV lines of the orders starting with a header."""
+    writer = csv.DictWriter(Echo(), fieldnames=list(EXPORT_FIELDS))
+
+    yield writer.writeheader()
+    for row in iter_rows(orders):
+        yield writer.writerow(escape_csv_row(row))
+
+
+def iter_ndjson(orders):
+    """Yield JSON line for every order."""
+    for row in iter_rows(orders):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
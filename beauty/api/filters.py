@@ -2,7 +2,7 @@
 
 from django_filters import rest_framework as filters
 
-from .models import Service
+from .models import Order, Service
 
 
 class ServiceFilter(filters.FilterSet):
@@ -18,3 +18,20 @@ class ServiceFilter(filters.FilterSet):
         model = Service
         fields = ["name", "price", "min_price", "max_price", "duration", "min_duration",
                   "max_duration"]
+
+
+class OrderFilter(filters.FilterSet):
+    """Filter orders by status, `exist` leaves orders which are not cancelled or declined."""
+
+    exist = filters.BooleanFilter(method="filter_exist")
+
+    class Meta:
+        """Meta class for OrderFilter."""
+        model = Order
+        fields = ["status", "exist"]
+
+    def filter_exist(self, queryset, name, value):
+        """Leave existing orders if value is true, otherwise cancelled and declined ones."""
+        if value:
+            return queryset.exclude(status__in=Order.RELEASED_STATUSES)
+        return queryset.filter(status__in=Order.RELEASED_STATUSES)
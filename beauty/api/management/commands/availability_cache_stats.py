@@ -0,0 +1,37 @@
+"""This module provides a custom command 'availability_cache_stats'."""
+
+from django.core.management.base import BaseCommand
+
+from api.scheduling import cache as availability_cache
+
+
+class Command(BaseCommand):
+    """This class represents an 'availability_cache_stats' custom command.
+
+    Command prints amount of hits and misses of availability cache.
+    """
+
+    help = "Shows hits and misses of the availability cache."   # noqa
+
+    def add_arguments(self, parser):
+        """This method adds optional arguments to the command."""
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Resets counters after showing them",
+        )
+
+    def handle(self, *args, **options):
+        """This method prints cache counters."""
+        stats = availability_cache.get_stats()
+        total = stats["hits"] + stats["misses"]
+        hit_ratio = stats["hits"] / total * 100 if total else 0
+
+        self.stdout.write(
+            f"Hits: {stats['hits']}, misses: {stats['misses']}, "
+            f"hit ratio: {hit_ratio:.1f}%",
+        )
+
+        if options["reset"]:
+            availability_cache.reset_stats()
+            self.stdout.write("Counters were reset.")
@@ -0,0 +1,22 @@
+"""This module provides a custom command 'rebuild_rollups'."""
+
+from django.core.management.base import BaseCommand
+
+from api.models import OrderDailyStat
+
+
+class Command(BaseCommand):
+    """This class represents a 'rebuild_rollups' custom command.
+
+    Command recalculates daily rollups of orders from scratch, it runs on
+    every deploy, so history of orders created before rollups or changed
+    bypassing signals is always included in statistic.
+    """
+
+    help = "Rebuilds daily rollups of orders used by statistic."   # noqa
+
+    def handle(self, *args, **options):
+        """This method replaces all rollups with ones calculated from orders."""
+        created = OrderDailyStat.objects.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f"{created} order rollups were rebuilt"))
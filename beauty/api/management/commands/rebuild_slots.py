@@ -0,0 +1,22 @@
+"""This module provides a custom command 'rebuild_slots'."""
+
+from django.core.management.base import BaseCommand
+
+from api.models import SpecialistSlot
+
+
+class Command(BaseCommand):
+    """This class represents a 'rebuild_slots' custom command.
+
+    Command reserves slots of specialists for all unfinished orders which
+    hold their time and deletes slots of past orders, it is run on deploy
+    and after changing orders bypassing OrderSerializer.
+    """
+
+    help = "Rebuilds reserved slots of specialists from orders."   # noqa
+
+    def handle(self, *args, **options):
+        """This method replaces all slots with ones reserved for orders."""
+        reserved = SpecialistSlot.objects.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f"{reserved} specialist slots were reserved"))
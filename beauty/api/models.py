@@ -1,15 +1,21 @@
 """This module provides all needed models."""
 
+import hashlib
+import json
 import logging
+from django.conf import settings
 from django.contrib.auth.base_user import (AbstractBaseUser, BaseUserManager)
 from django.contrib.auth.models import PermissionsMixin
 from django.core.validators import (validate_email, MinValueValidator, MaxValueValidator)
 from phonenumber_field.modelfields import PhoneNumberField
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
-from beauty.utils import (ModelsUtils, validate_rounded_minutes_seconds,
+from beauty.utils import (ModelsUtils, WeeklyHours, validate_rounded_minutes_seconds,
                           validate_working_time_json)
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 from beauty.settings import TIME_ZONE
 
@@ -66,6 +72,32 @@ class MyUserManager(BaseUserManager):
 
         return user
 
+    def with_orders_count(self):
+        """Return users annotated with amounts of their orders.
+
+        Every amount is a subquery, so users with long order history don't
+        multiply rows of each other. Annotations are named after relations
+        and properties of orders with `_count` suffix.
+        """
+        return self.annotate(**{
+            f"{orders}_count": Coalesce(
+                models.Subquery(
+                    Order.objects.filter(**{user_field: models.OuterRef("pk")}).exclude(
+                        status__in=excluded_statuses,
+                    ).order_by().values(user_field).annotate(
+                        count=models.Count("pk"),
+                    ).values("count"),
+                ),
+                0,
+            )
+            for orders, user_field, excluded_statuses in (
+                ("specialist_orders", "specialist", ()),
+                ("customer_orders", "customer", ()),
+                ("specialist_exist_orders", "specialist", Order.RELEASED_STATUSES),
+                ("customer_exist_orders", "customer", Order.RELEASED_STATUSES),
+            )
+        })
+
 
 class CustomUser(PermissionsMixin, AbstractBaseUser):
     """This class represents a custom User model.
@@ -90,6 +122,7 @@ class CustomUser(PermissionsMixin, AbstractBaseUser):
     Properties:
 
         is_staff (bool): Returns true if user is admin
+        roles (frozenset): Names of groups of the user
 
     """
 
@@ -157,20 +190,38 @@ class CustomUser(PermissionsMixin, AbstractBaseUser):
         """Determines whether user is admin."""
         return self.is_admin
 
+    @cached_property
+    def roles(self):
+        """frozenset: Names of groups of the user.
+
+        Groups are loaded with one query (or taken from prefetched groups) and
+        cached on the instance, so all role checks of a request share them.
+        """
+        return frozenset(group.name for group in self.groups.all())
+
+    def forget_roles(self):
+        """Drop cached roles, they are loaded again on the next check."""
+        self.__dict__.pop("roles", None)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload the user from database together with its roles."""
+        self.forget_roles()
+        super().refresh_from_db(*args, **kwargs)
+
     @property
     def is_specialist(self):
         """Determines whether user is specialist."""
-        return self.groups.filter(name="Specialist").exists()
+        return "Specialist" in self.roles
 
     @property
     def is_customer(self):
         """Determines whether user is customer."""
-        return self.groups.filter(name="Customer").exists()
+        return "Customer" in self.roles
 
     @property
     def is_owner(self):
         """Determines whether user is an owner."""
-        return self.groups.filter(name="Owner").exists()
+        return "Owner" in self.roles
 
     @property
     def specialist_exist_orders(self):
@@ -222,6 +273,13 @@ class Location(models.Model):
         blank=True,
     )
 
+    class Meta:
+        """This meta class stores indexes."""
+
+        indexes = [
+            models.Index(fields=["latitude", "longitude"], name="location_coordinates_idx"),
+        ]
+
     def __str__(self):
         """str: Returns a verbose address of the business."""
         return self.address
@@ -288,8 +346,16 @@ class Business(models.Model):
     )
 
     class Meta:
-        """This meta class stores verbose names."""
-
+        """This meta class stores indexes and verbose names."""
+
+        indexes = [
+            # Lists of businesses show only active ones
+            models.Index(
+                fields=["business_type"],
+                condition=models.Q(is_active=True),
+                name="business_active_type_idx",
+            ),
+        ]
         ordering = ["business_type"]
         verbose_name = _("Business")
         verbose_name_plural = _("Businesses")
@@ -298,6 +364,11 @@ class Business(models.Model):
         """str: Returns a verbose title of the business."""
         return str(self.name)
 
+    @property
+    def weekly_hours(self):
+        """WeeklyHours: Compiled working time of the business."""
+        return WeeklyHours.compile(self.working_time)
+
     def create_position(self, name, specialist, working_time):
         """Creates Position for specific Business."""
         position = Position.objects.create(name=name, business=self,
@@ -341,6 +412,23 @@ class Business(models.Model):
 
         return orders
 
+    def get_daily_stats(self, date, date_to=None):
+        """Get daily rollups of orders of current business starting from the date.
+
+        Args:
+            date (date): first day of rollups
+            date_to (date, optional): last day of rollups, not limited by default
+        """
+        stats = OrderDailyStat.objects.filter(
+            business=self, date__gte=date, orders_count__gt=0,
+            specialist__in=self.get_all_specialists(),
+        )
+
+        if date_to:
+            stats = stats.filter(date__lte=date_to)
+
+        return stats
+
 
 class Position(models.Model):
     """This class represents position in Business.
@@ -380,6 +468,11 @@ class Position(models.Model):
         """str: Returns name of Position."""
         return self.name
 
+    @property
+    def weekly_hours(self):
+        """WeeklyHours: Compiled working time of the position."""
+        return WeeklyHours.compile(self.working_time)
+
     class Meta:
         """This meta class stores verbose names and ordering data."""
 
@@ -434,8 +527,13 @@ class Review(models.Model):
         return self.text_body
 
     class Meta:
-        """This meta class stores verbose names and permissions data."""
+        """This meta class stores indexes, verbose names and permissions data."""
 
+        indexes = [
+            models.Index(
+                fields=["to_user", "date_of_publication"], name="review_to_user_published_idx",
+            ),
+        ]
         ordering = ["date_of_publication"]
         verbose_name = _("Review")
         verbose_name_plural = _("Reviews")
@@ -477,10 +575,23 @@ class Order(models.Model):
         DECLINED = 4, _("Declined")
 
     class Meta:
-        """This meta class stores ordering and permissions data."""
+        """This meta class stores ordering, indexes and permissions data."""
 
         ordering = ["id"]
         get_latest_by = "created_at"
+        indexes = [
+            models.Index(
+                fields=["specialist", "status", "start_time"],
+                name="order_specialist_status_idx",
+            ),
+            # Only active orders of a service are checked on its update
+            models.Index(
+                fields=["service"],
+                condition=models.Q(status=0),
+                name="order_service_active_idx",
+            ),
+            models.Index(fields=["customer", "start_time"], name="order_customer_start_idx"),
+        ]
         permissions = [
             ("can_add_order", "Can add an order"),
             ("can_change_order", "Can change an order"),
@@ -488,6 +599,8 @@ class Order(models.Model):
             ("can_view_order", "Can view an order"),
         ]
 
+    RELEASED_STATUSES = (StatusChoices.CANCELLED, StatusChoices.DECLINED)
+
     status = models.IntegerField(
         choices=StatusChoices.choices,
         default=StatusChoices.ACTIVE,
@@ -540,6 +653,11 @@ class Order(models.Model):
         editable=False,
         null=True,
     )
+    token_expires_at = models.DateTimeField(
+        editable=False,
+        null=True,
+        verbose_name=_("Token expiration time"),
+    )
 
     note = models.TextField(
         max_length=300,
@@ -548,6 +666,31 @@ class Order(models.Model):
         verbose_name=_("Additional note"),
     )
 
+    ROLLUP_FIELDS = ("specialist_id", "service_id", "start_time", "status")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember values which define rollup row of the loaded order."""
+        instance = super().from_db(db, field_names, values)
+        instance.rollup_state = instance.get_rollup_state()
+        return instance
+
+    def get_rollup_state(self):
+        """Return values which define rollup row of the order.
+
+        Returns:
+            tuple: specialist id, service id, start time and status or None
+            if some of them were deferred
+        """
+        try:
+            return tuple(self.__dict__[field] for field in self.ROLLUP_FIELDS)
+        except KeyError:
+            return None
+
+    def get_stored_rollup_state(self):
+        """Return values which define rollup row of the order stored in database."""
+        return Order.objects.filter(pk=self.pk).values_list(*self.ROLLUP_FIELDS).first()
+
     def save(self, *args, **kwargs):
         """Reimplemented save method for end_time calculation."""
         self.end_time = self.start_time + self.service.duration
@@ -555,6 +698,10 @@ class Order(models.Model):
         logger.info(f"Added end time({self.end_time}) for order")
 
         super(Order, self).save(*args, **kwargs)
+
+        if self.status in self.RELEASED_STATUSES:
+            SpecialistSlot.objects.release(self)
+
         return self
 
     @property
@@ -572,6 +719,16 @@ class Order(models.Model):
         """bool: Returns true if order"s status is declined."""
         return self.status == self.StatusChoices.DECLINED
 
+    @property
+    def has_valid_token(self) -> bool:
+        """bool: Returns true if approving links of the order can be sent.
+
+        Decided by stored status and token expiration time without hashing,
+        the token itself is checked when a link is followed.
+        """
+        expires_at = self.token_expires_at
+        return bool(self.is_active and self.token and expires_at and expires_at > timezone.now())
+
     def mark_as_approved(self):
         """Marks order as approved."""
         self.status = self.StatusChoices.APPROVED
@@ -610,6 +767,332 @@ class Order(models.Model):
         return f"Order #{self.id} ({self.status})"
 
 
+class SpecialistSlotManager(models.Manager):
+    """Manager for reserving and releasing specialists' time slots."""
+
+    def get_slots_starts(self, start_time, end_time):
+        """Return starts of all slots covering the time range."""
+        slot_duration = self.model.SLOT_DURATION
+        slot_start = start_time.replace(
+            minute=start_time.minute - start_time.minute % 5, second=0, microsecond=0,
+        )
+        starts = []
+
+        while slot_start < end_time:
+            starts.append(slot_start)
+            slot_start += slot_duration
+
+        return starts
+
+    def reserve(self, order):
+        """Reserve all slots of the order's time range for its specialist.
+
+        Slots are inserted with a single statement inside a savepoint, so
+        either all of them are reserved or none of them, and concurrent
+        bookings for different slots don't wait for each other. Orders
+        which hold their time without slots (created before slots were
+        rebuilt or bypassing OrderSerializer) are checked with a query.
+
+        Args:
+            order (Order): saved order
+
+        Returns:
+            bool: True if slots were reserved, False if any of them is taken
+        """
+        overlapping_orders = Order.objects.filter(
+            specialist_id=order.specialist_id,
+            start_time__lt=order.end_time,
+            end_time__gt=order.start_time,
+        ).exclude(pk=order.pk).exclude(status__in=Order.RELEASED_STATUSES)
+
+        if overlapping_orders.exists():
+            logger.info(f"Time of {order} is already taken by another order")
+            return False
+
+        self.prune(order.specialist_id)
+        slots = [
+            self.model(specialist_id=order.specialist_id, order=order, start=start)
+            for start in self.get_slots_starts(order.start_time, order.end_time)
+        ]
+
+        try:
+            with transaction.atomic():
+                self.bulk_create(slots)
+        except IntegrityError:
+            logger.info(f"Slots of {order} are already reserved")
+            return False
+
+        logger.info(f"{len(slots)} slots were reserved for {order}")
+
+        return True
+
+    def prune(self, specialist_id):
+        """Delete slots of the specialist which have already passed.
+
+        Past time can't be booked, so slots are needed only for orders
+        which haven't finished yet and the ledger doesn't grow with history.
+        """
+        self.filter(
+            specialist_id=specialist_id,
+            start__lte=timezone.now() - self.model.SLOT_DURATION,
+        ).delete()
+
+    def rebuild(self):
+        """Reserve slots of all unfinished orders which hold their time from scratch.
+
+        Orders are processed by id, so if orders created before slots
+        overlap, only the first of them gets the shared slots.
+
+        Returns:
+            int: amount of reserved slots
+        """
+        orders = Order.objects.filter(end_time__gt=timezone.now()).exclude(
+            status__in=Order.RELEASED_STATUSES,
+        ).order_by("id").only("id", "specialist_id", "start_time", "end_time")
+
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(
+                (
+                    self.model(specialist_id=order.specialist_id, order=order, start=start)
+                    for order in orders.iterator()
+                    for start in self.get_slots_starts(order.start_time, order.end_time)
+                ),
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+
+        return self.count()
+
+    def release(self, order):
+        """Release all slots of the order."""
+        deleted = self.filter(order=order).delete()[0]
+
+        if deleted:
+            logger.info(f"{deleted} slots of {order} were released")
+
+
+class SpecialistSlot(models.Model):
+    """This class represents a reserved 5 minutes slot of a specialist.
+
+    Unique constraint on specialist and slot start guarantees that orders
+    of a specialist never overlap, even if they are created concurrently.
+
+    Attributes:
+        specialist (CustomUser): Specialist whose time is reserved
+        order (Order): Order that reserved the slot
+        start (datetime): Start of the slot
+    """
+
+    SLOT_DURATION = timedelta(minutes=5)
+
+    specialist = models.ForeignKey(
+        "CustomUser",
+        on_delete=models.CASCADE,
+        related_name="slots",
+        verbose_name=_("Specialist"),
+    )
+    order = models.ForeignKey(
+        "Order",
+        on_delete=models.CASCADE,
+        related_name="slots",
+        verbose_name=_("Order"),
+    )
+    start = models.DateTimeField(
+        verbose_name=_("Slot start"),
+    )
+
+    objects = SpecialistSlotManager()
+
+    class Meta:
+        """This meta class stores constraints and verbose names."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["specialist", "start"], name="unique_specialist_slot",
+            ),
+        ]
+        verbose_name = _("Specialist slot")
+        verbose_name_plural = _("Specialist slots")
+
+    def __str__(self) -> str:
+        """str: Returns a verbose title of the slot."""
+        return f"Slot {self.start} of specialist {self.specialist_id}"
+
+
+class OrderDailyStatManager(models.Manager):
+    """Manager for maintaining daily rollups of orders."""
+
+    def get_state_key(self, state):
+        """Return rollup key of the order state.
+
+        Args:
+            state (tuple): specialist id, service id, start time and status
+
+        Returns:
+            tuple: service and rollup lookups or (None, None) if service doesn't exist
+        """
+        specialist_id, service_id, start_time, status = state
+        service = Service.objects.select_related("position").only(
+            "price", "position__business_id",
+        ).filter(id=service_id).first()
+
+        if not service:
+            return None, None
+
+        return service, {
+            "business_id": service.position.business_id,
+            "specialist_id": specialist_id,
+            "service_id": service_id,
+            "date": timezone.localtime(start_time).date(),
+            "status": status,
+        }
+
+    def add_order(self, state, delta=1):
+        """Add order with the state to its rollup row or subtract it for negative delta."""
+        service, key = self.get_state_key(state)
+        if not key:
+            return
+
+        changes = {
+            "orders_count": models.F("orders_count") + delta,
+            "revenue": models.F("revenue") + service.price * delta,
+        }
+
+        if self.filter(**key).update(**changes) or delta < 0:
+            return
+
+        try:
+            with transaction.atomic():
+                self.create(**key, orders_count=delta, revenue=service.price * delta)
+        except IntegrityError:
+            # Row was created by a concurrent transaction
+            self.filter(**key).update(**changes)
+
+    def apply_order_change(self, previous_state, state):
+        """Move order from rollup row of its previous state to the current one."""
+        if previous_state == state:
+            return
+
+        if previous_state:
+            self.add_order(previous_state, -1)
+        if state:
+            self.add_order(state)
+
+    def update_service_revenue(self, service):
+        """Recalculate revenue of the service rows after its price change."""
+        self.filter(service=service).update(
+            revenue=models.F("orders_count") * service.price,
+        )
+
+    def rebuild(self):
+        """Recalculate all rollups from orders.
+
+        Returns:
+            int: amount of created rows
+        """
+        rows = Order.objects.order_by().annotate(
+            date=TruncDate("start_time", tzinfo=timezone.get_current_timezone()),
+        ).values(
+            "service__position__business", "specialist", "service", "date", "status",
+        ).annotate(
+            orders_count=models.Count("id"),
+            revenue=models.Sum("service__price"),
+        )
+
+        with transaction.atomic():
+            self.all().delete()
+            created = self.bulk_create(
+                (
+                    self.model(
+                        business_id=row["service__position__business"],
+                        specialist_id=row["specialist"],
+                        service_id=row["service"],
+                        date=row["date"],
+                        status=row["status"],
+                        orders_count=row["orders_count"],
+                        revenue=row["revenue"],
+                    )
+                    for row in rows.iterator()
+                ),
+                batch_size=1000,
+            )
+
+        logger.info(f"{len(created)} order rollups were rebuilt")
+
+        return len(created)
+
+
+class OrderDailyStat(models.Model):
+    """This class represents daily rollup of orders.
+
+    Every row keeps amount and revenue of orders of a specialist for a
+    service with the same status, which start on the same local day.
+    Rows are maintained on every order change, so statistic is read without
+    scanning orders.
+
+    Attributes:
+        business (Business): Business of the service
+        specialist (CustomUser): Specialist of orders
+        service (Service): Service of orders
+        date (date): Local day of orders start
+        status (int): Status of orders
+        orders_count (int): Amount of orders
+        revenue (decimal): Sum of service prices of orders
+    """
+
+    business = models.ForeignKey(
+        "Business",
+        on_delete=models.CASCADE,
+        verbose_name=_("Business"),
+    )
+    specialist = models.ForeignKey(
+        "CustomUser",
+        on_delete=models.CASCADE,
+        verbose_name=_("Specialist"),
+    )
+    service = models.ForeignKey(
+        "Service",
+        on_delete=models.CASCADE,
+        verbose_name=_("Service"),
+    )
+    date = models.DateField(
+        verbose_name=_("Date"),
+    )
+    status = models.IntegerField(
+        choices=Order.StatusChoices.choices,
+        verbose_name=_("Status"),
+    )
+    orders_count = models.IntegerField(
+        default=0,
+        verbose_name=_("Orders count"),
+    )
+    revenue = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Revenue"),
+    )
+
+    objects = OrderDailyStatManager()
+
+    class Meta:
+        """This meta class stores constraints and verbose names."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business", "specialist", "service", "date", "status"],
+                name="unique_order_daily_stat",
+            ),
+        ]
+        verbose_name = _("Order daily statistic")
+        verbose_name_plural = _("Order daily statistics")
+
+    def __str__(self) -> str:
+        """str: Returns a verbose title of the rollup row."""
+        return f"{self.date}: {self.orders_count} orders of service {self.service_id}"
+
+
 class Service(models.Model):
     """This class represents a Service that can be provided by Specialist.
 
@@ -698,3 +1181,245 @@ class Invitation(models.Model):
     def __str__(self) -> str:
         """This method changes representation of the Invite in the admin panel."""
         return f"Invite for {self.email} on {self.position}"
+
+
+class ReportJobManager(models.Manager):
+    """Manager for creating report jobs without duplicates."""
+
+    def get_digest(self, kind, business_id, params):
+        """Return digest identifying the report by its kind, business and params."""
+        source = json.dumps([kind, business_id, params], sort_keys=True, default=str)
+        return hashlib.sha256(source.encode()).hexdigest()
+
+    def fail_stale_jobs(self, **lookups):
+        """Mark jobs pending or running longer than REPORT_JOB_TIMEOUT as failed.
+
+        Running time is counted from the start of the job, so a job which
+        waited in the queue is not failed while its task is still running.
+        Such jobs were lost by a dead worker or broker, so they must not
+        block requesting the same report again.
+
+        Args:
+            **lookups: filters of jobs to check, all jobs by default
+
+        Returns:
+            int: amount of failed jobs
+        """
+        now = timezone.now()
+        deadline = now - timedelta(seconds=settings.REPORT_JOB_TIMEOUT)
+        stale_pending = models.Q(status=ReportJob.StatusChoices.PENDING, created_at__lt=deadline)
+        stale_running = models.Q(status=ReportJob.StatusChoices.RUNNING, started_at__lt=deadline)
+        failed = self.filter(stale_pending | stale_running, **lookups).update(
+            status=ReportJob.StatusChoices.FAILED,
+            error="Report job timed out",
+            finished_at=now,
+        )
+
+        if failed:
+            logger.warning(f"{failed} stale report jobs were failed")
+
+        return failed
+
+    def get_or_create_job(self, requested_by, kind, business=None, params=None):
+        """Return in-flight job of the same report or create a new one.
+
+        Stale in-flight jobs are failed first, so they are never returned.
+
+        Args:
+            requested_by (CustomUser): user who requested the report
+            kind (str): kind of the report
+            business (Business, optional): business of the report
+            params (dict, optional): JSON serializable parameters of the report
+
+        Returns:
+            tuple: job and True if it was created
+        """
+        params = params or {}
+        digest = self.get_digest(kind, business and business.id, params)
+        self.fail_stale_jobs(requested_by=requested_by, digest=digest)
+        in_flight = self.filter(
+            requested_by=requested_by,
+            digest=digest,
+            status__in=ReportJob.IN_FLIGHT_STATUSES,
+        )
+
+        job = in_flight.first()
+        if job:
+            return job, False
+
+        try:
+            with transaction.atomic():
+                return self.create(
+                    requested_by=requested_by,
+                    kind=kind,
+                    business=business,
+                    params=params,
+                    digest=digest,
+                ), True
+        except IntegrityError:
+            # The same job was created by a concurrent request
+            return in_flight.get(), False
+
+
+class ReportJob(models.Model):
+    """This class represents a job generating a heavy report file.
+
+    Attributes:
+        requested_by (CustomUser): User who requested the report
+        kind (str): Kind of the report
+        business (Business, optional): Business of the report
+        params (dict): Parameters of the report
+        digest (str): Hash of kind, business and params, used for deduplication
+        status (int): Status of the job
+        progress (int): Percent of processed rows
+        file (File): Compressed report file
+        error (str): Error of the failed job
+        created_at (datetime): Time of creation of the job
+        started_at (datetime): Time when the job started running
+        finished_at (datetime): Time when the job was done or failed
+    """
+
+    class KindChoices(models.TextChoices):
+        """This class is used for kinds of reports."""
+
+        ORDERS = "orders", _("Orders of a business")
+        SPECIALISTS = "specialists", _("Monthly statistic of business specialists")
+        BUSINESSES = "businesses", _("Monthly statistic of all businesses")
+
+    class StatusChoices(models.IntegerChoices):
+        """This class is used for status codes."""
+
+        PENDING = 0, _("Pending")
+        RUNNING = 1, _("Running")
+        DONE = 2, _("Done")
+        FAILED = 3, _("Failed")
+
+    IN_FLIGHT_STATUSES = (StatusChoices.PENDING, StatusChoices.RUNNING)
+
+    requested_by = models.ForeignKey(
+        "CustomUser",
+        related_name="report_jobs",
+        on_delete=models.CASCADE,
+        verbose_name=_("Requested by"),
+    )
+    kind = models.CharField(
+        max_length=20,
+        choices=KindChoices.choices,
+        verbose_name=_("Kind"),
+    )
+    business = models.ForeignKey(
+        "Business",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("Business"),
+    )
+    params = models.JSONField(
+        default=dict,
+        verbose_name=_("Parameters"),
+    )
+    digest = models.CharField(
+        max_length=64,
+        editable=False,
+        verbose_name=_("Digest"),
+    )
+    status = models.IntegerField(
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+        verbose_name=_("Status"),
+    )
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("Progress"),
+    )
+    file = models.FileField(
+        upload_to="reports/",
+        blank=True,
+        verbose_name=_("File"),
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name=_("Error"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created at"),
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Started at"),
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Finished at"),
+    )
+
+    objects = ReportJobManager()
+
+    class Meta:
+        """This meta class stores constraints, ordering and verbose names."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["requested_by", "digest"],
+                # Pending and running jobs
+                condition=models.Q(status__in=[0, 1]),
+                name="unique_in_flight_report_job",
+            ),
+        ]
+        ordering = ["-created_at"]
+        verbose_name = _("Report job")
+        verbose_name_plural = _("Report jobs")
+
+    def __str__(self) -> str:
+        """str: Returns a verbose title of the report job."""
+        return f"Report {self.kind} #{self.id} ({self.get_status_display()})"
+
+    def set_progress(self, progress):
+        """Save progress of the running job."""
+        self.progress = progress
+        self.save(update_fields=["progress"])
+
+    def start(self):
+        """Save the pending job as running.
+
+        Returns:
+            bool: False if the job is not pending anymore, e.g. it was failed as stale
+        """
+        started_at = timezone.now()
+        started = ReportJob.objects.filter(
+            id=self.id, status=self.StatusChoices.PENDING,
+        ).update(status=self.StatusChoices.RUNNING, started_at=started_at)
+
+        if started:
+            self.status = self.StatusChoices.RUNNING
+            self.started_at = started_at
+
+        return bool(started)
+
+    def finish(self, status, error=""):
+        """Save the running job as done or failed.
+
+        Job which was failed as stale meanwhile is left failed, because the
+        same report may have been requested again already.
+
+        Returns:
+            bool: False if the job is not running anymore
+        """
+        self.status = status
+        self.error = error
+        self.finished_at = timezone.now()
+        if status == self.StatusChoices.DONE:
+            self.progress = 100
+
+        return bool(ReportJob.objects.filter(
+            id=self.id, status=self.StatusChoices.RUNNING,
+        ).update(
+            status=self.status,
+            error=self.error,
+            finished_at=self.finished_at,
+            progress=self.progress,
+            file=self.file.name,
+        ))
@@ -0,0 +1,252 @@
+"""Platform-wide statistic of all businesses for admins.
+
+Statistic of every business (its partition) is read from daily order rollups
+with one grouped query. Businesses which have orders but no rollups yet are
+aggregated from orders, every such partition in a separate process of a
+pool. Partitions are merged into platform totals and top-N rankings, time
+of every stage is measured.
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, time as day_time, timedelta
+
+import django
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Exists, OuterRef, Q, Sum
+from django.utils import timezone
+
+from api.models import Business, Order, OrderDailyStat
+
+
+logger = logging.getLogger(__name__)
+
+STATUS_FIELDS = {
+    status_str.lower(): status_int
+    for status_str, status_int in Order.StatusChoices.__members__.items()
+}
+PARTITION_FIELDS = ("orders_count", "revenue", "profit", *STATUS_FIELDS)
+RANKINGS = {"top_by_orders": "orders_count", "top_by_revenue": "revenue"}
+
+
+class StageTimer:
+    """Measures duration of named stages in milliseconds."""
+
+    def __init__(self):
+        """Create timer without measured stages."""
+        self.timings = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Measure duration of the code inside the context as the stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - started) * 1000, 1)
+            logger.info(f"Platform statistic stage {name} took {self.timings[name]} ms")
+
+    def as_header(self):
+        """Return timings as a value of Server-Timing header."""
+        return ", ".join(f"{name};dur={duration}" for name, duration in self.timings.items())
+
+
+def get_workers_amount():
+    """Return amount of processes computing missing partitions."""
+    return getattr(settings, "PLATFORM_STATISTIC_WORKERS", 4)
+
+
+def get_rollup_partitions(date_from, date_to):
+    """Return statistic of every business with rollups using one grouped query.
+
+    Returns:
+        dict: business ids as keys and dicts with PARTITION_FIELDS as values
+    """
+    stats = OrderDailyStat.objects.filter(
+        date__gte=date_from, date__lte=date_to, orders_count__gt=0,
+    ).order_by().values("business").annotate(
+        total_orders=Sum("orders_count"),
+        total_revenue=Sum("revenue"),
+        profit=Sum("revenue", filter=Q(status=Order.StatusChoices.COMPLETED)),
+        **{
+            name: Sum("orders_count", filter=Q(status=status_int))
+            for name, status_int in STATUS_FIELDS.items()
+        },
+    )
+
+    return {
+        row.pop("business"): clean_partition({
+            **row,
+            "orders_count": row.pop("total_orders"),
+            "revenue": row.pop("total_revenue"),
+        })
+        for row in stats
+    }
+
+
+def get_businesses_without_rollups():
+    """Return ids of businesses which have orders but no rollups.
+
+    Rollups of existing orders are rebuilt on deploy, so only businesses
+    changed bypassing signals since then are computed from orders.
+    """
+    return list(
+        Business.objects.annotate(
+            has_orders=Exists(
+                Order.objects.filter(service__position__business=OuterRef("pk")),
+            ),
+            has_rollups=Exists(OrderDailyStat.objects.filter(business=OuterRef("pk"))),
+        ).filter(has_orders=True, has_rollups=False).values_list("id", flat=True),
+    )
+
+
+def compute_order_partition(business_id, date_from, date_to):
+    """Return statistic of the business aggregated from its orders.
+
+    It is executed in a process of the pool, so it gets only ids and dates.
+    """
+    orders = Order.objects.filter(
+        service__position__business=business_id,
+        start_time__gte=timezone.make_aware(datetime.combine(date_from, day_time.min)),
+        start_time__lt=timezone.make_aware(
+            datetime.combine(date_to + timedelta(days=1), day_time.min),
+        ),
+    )
+
+    return clean_partition(orders.aggregate(
+        orders_count=Count("id"),
+        revenue=Sum("service__price"),
+        profit=Sum("service__price", filter=Q(status=Order.StatusChoices.COMPLETED)),
+        **{
+            name: Count("id", filter=Q(status=status_int))
+            for name, status_int in STATUS_FIELDS.items()
+        },
+    ))
+
+
+def clean_partition(partition):
+    """Return partition with zeros instead of missing sums."""
+    return {field: partition[field] or 0 for field in PARTITION_FIELDS}
+
+
+def initialize_worker():
+    """Prepare Django in a process of the pool, it opens its own connections."""
+    django.setup()
+    connections.close_all()
+
+
+def compute_order_partitions(business_ids, date_from, date_to):
+    """Return statistic of every business aggregated from orders.
+
+    Partitions are computed concurrently in a process pool if there are
+    several of them and workers are allowed by settings.
+
+    Returns:
+        dict: business ids as keys and dicts with PARTITION_FIELDS as values
+    """
+    workers = min(get_workers_amount(), len(business_ids))
+
+    if workers <= 1:
+        return {
+            business_id: compute_order_partition(business_id, date_from, date_to)
+            for business_id in business_ids
+        }
+
+    # Forked processes must not share connections of the parent
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker) as pool:
+        partitions = pool.map(
+            compute_order_partition,
+            business_ids,
+            [date_from] * len(business_ids),
+            [date_to] * len(business_ids),
+        )
+        return dict(zip(business_ids, partitions))
+
+
+def merge_partitions(partitions, top):
+    """Return platform totals and top businesses by orders and revenue.
+
+    Args:
+        partitions (dict): business ids as keys and partitions as values
+        top (int): amount of businesses in rankings
+
+    Returns:
+        dict: totals, businesses_count, top_by_orders and top_by_revenue
+    """
+    totals = dict.fromkeys(PARTITION_FIELDS, 0)
+    for partition in partitions.values():
+        for field in PARTITION_FIELDS:
+            totals[field] += partition[field]
+
+    rankings = {
+        ranking: sorted(
+            partitions,
+            key=lambda business_id, field=field: partitions[business_id][field],
+            reverse=True,
+        )[:top]
+        for ranking, field in RANKINGS.items()
+    }
+    names = dict(Business.objects.filter(
+        id__in={business_id for ids in rankings.values() for business_id in ids},
+    ).values_list("id", "name"))
+
+    result = {
+        "totals": {
+            "orders_count": totals["orders_count"],
+            "revenue": totals["revenue"],
+            "profit": totals["profit"],
+            "statuses": {name: totals[name] for name in STATUS_FIELDS},
+        },
+        "businesses_count": len(partitions),
+    }
+    for ranking, business_ids in rankings.items():
+        result[ranking] = [
+            {
+                "id": business_id,
+                "name": names.get(business_id),
+                "orders_count": partitions[business_id]["orders_count"],
+                "revenue": partitions[business_id]["revenue"],
+            }
+            for business_id in business_ids
+        ]
+
+    return result
+
+
+def get_platform_statistic(date_from, date_to, top=5):
+    """Return platform statistic of the period and durations of its stages.
+
+    Args:
+        date_from (date): first day of the period
+        date_to (date): last day of the period
+        top (int): amount of businesses in rankings
+
+    Returns:
+        tuple: statistic dict and StageTimer
+    """
+    timer = StageTimer()
+
+    with timer.stage("rollups"):
+        partitions = get_rollup_partitions(date_from, date_to)
+
+    with timer.stage("missing"):
+        missing = get_businesses_without_rollups()
+
+    with timer.stage("partitions"):
+        partitions.update(
+            (business_id, partition)
+            for business_id, partition in
+            compute_order_partitions(missing, date_from, date_to).items()
+            if partition["orders_count"]
+        )
+
+    with timer.stage("merge"):
+        statistic = merge_partitions(partitions, top)
+
+    statistic["computed_from_orders"] = len(missing)
+
+    return statistic, timer
@@ -0,0 +1,139 @@
+"""Generation of heavy reports as gzip compressed CSV files.
+
+Every kind of report is a values() queryset and a function formatting its
+rows. Rows are read by chunks and written to a temporary file, progress of
+the job is saved after every chunk, so memory usage doesn't depend on the
+size of the report.
+"""
+
+import csv
+import gzip
+import tempfile
+from datetime import date
+
+from django.core.files import File
+from django.db.models import Q, Sum
+from django.db.models.functions import TruncMonth
+
+from api.exports import EXPORT_FIELDS, escape_csv_row, format_row, get_orders_for_export
+from api.models import Order, OrderDailyStat, ReportJob
+
+
+REPORT_CHUNK_SIZE = 2000
+
+STATUS_FIELDS = [status_str.lower() for status_str in Order.StatusChoices.names]
+
+
+def get_period_filters(params):
+    """Return date_from and date_to from job parameters."""
+    return {
+        name: date.fromisoformat(params[name]) if params.get(name) else None
+        for name in ("date_from", "date_to")
+    }
+
+
+def get_monthly_stats(stats, params, group_fields):
+    """Return monthly rollups of the period grouped by the fields.
+
+    Args:
+        stats (QuerySet[OrderDailyStat])
+        params (dict): job parameters with date_from and date_to
+        group_fields (list): fields identifying the rows
+
+    Returns:
+        QuerySet: dicts with group fields, month, total_orders, total_revenue,
+        profit and amount of orders of every status
+    """
+    period = get_period_filters(params)
+    if period["date_from"]:
+        stats = stats.filter(date__gte=period["date_from"])
+    if period["date_to"]:
+        stats = stats.filter(date__lte=period["date_to"])
+
+    return stats.annotate(month=TruncMonth("date")).values(
+        *group_fields, "month",
+    ).annotate(
+        total_orders=Sum("orders_count"),
+        total_revenue=Sum("revenue"),
+        profit=Sum("revenue", filter=Q(status=Order.StatusChoices.COMPLETED)),
+        **{
+            status_str.lower(): Sum("orders_count", filter=Q(status=status_int))
+            for status_str, status_int in Order.StatusChoices.__members__.items()
+        },
+    ).order_by(*group_fields, "month")
+
+
+def format_monthly_row(row):
+    """Return monthly row with zeros instead of missing sums."""
+    return {
+        field: value if value is not None else 0
+        for field, value in row.items()
+    }
+
+
+def orders_report(job):
+    """Return columns, rows and formatter of all orders of the business."""
+    orders = get_orders_for_export(
+        [job.business_id],
+        statuses=job.params.get("statuses"),
+        **get_period_filters(job.params),
+    )
+
+    return list(EXPORT_FIELDS), orders, format_row
+
+
+def specialists_report(job):
+    """Return columns, rows and formatter of monthly statistic of every specialist."""
+    group_fields = ["specialist", "specialist__first_name", "specialist__last_name"]
+    stats = get_monthly_stats(
+        OrderDailyStat.objects.filter(business=job.business_id), job.params, group_fields,
+    )
+
+    return (
+        [*group_fields, "month", "total_orders", "total_revenue", "profit", *STATUS_FIELDS],
+        stats,
+        format_monthly_row,
+    )
+
+
+def businesses_report(job):
+    """Return columns, rows and formatter of monthly statistic of every business."""
+    group_fields = ["business", "business__name"]
+    stats = get_monthly_stats(OrderDailyStat.objects.all(), job.params, group_fields)
+
+    return (
+        [*group_fields, "month", "total_orders", "total_revenue", "profit", *STATUS_FIELDS],
+        stats,
+        format_monthly_row,
+    )
+
+
+REPORTS = {
+    ReportJob.KindChoices.ORDERS: orders_report,
+    ReportJob.KindChoices.SPECIALISTS: specialists_report,
+    ReportJob.KindChoices.BUSINESSES: businesses_report,
+}
+
+
+def build_report(job):
+    """Write the report file of the job, saving progress after every chunk.
+
+    Args:
+        job (ReportJob): running job, its file is set but not saved
+    """
+    fieldnames, rows, format_report_row = REPORTS[job.kind](job)
+    total = rows.count()
+
+    with tempfile.TemporaryFile() as temporary_file:
+        with gzip.open(temporary_file, "wt", newline="") as report:
+            writer = csv.DictWriter(report, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for index, row in enumerate(rows.iterator(chunk_size=REPORT_CHUNK_SIZE), 1):
+                writer.writerow(escape_csv_row(format_report_row(row)))
+
+                if index % REPORT_CHUNK_SIZE == 0:
+                    job.set_progress(min(index * 100 // total, 99))
+
+        temporary_file.seek(0)
+        job.file.save(f"report_{job.id}_{job.kind}.csv.gz", File(temporary_file), save=False)
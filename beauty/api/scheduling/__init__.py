@@ -0,0 +1 @@
+"""Package with tools for calculating specialists' availability."""
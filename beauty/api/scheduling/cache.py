@@ -0,0 +1,152 @@
+"""Cache of specialists' free intervals with versioned keys.
+
+Free intervals are stored per (specialist, position, day). Every stored value
+is keyed with two versions: a version of the position (bumped when working
+time of the position changes) and a version of the specialist's day (bumped
+when an order of the specialist for that day changes in any position, because
+orders of all positions take time of the specialist). Bumping a version is a
+single atomic increment, see api.versioned_cache.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.timezone import localtime
+
+from api import versioned_cache
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "availability"
+HITS_KEY = f"{KEY_PREFIX}:stats:hits"
+MISSES_KEY = f"{KEY_PREFIX}:stats:misses"
+
+
+def get_timeout():
+    """Return timeout of cached free intervals in seconds."""
+    return getattr(settings, "AVAILABILITY_CACHE_TIMEOUT", 60 * 60 * 24)
+
+
+def position_version_key(position_id):
+    """Return key of the position version."""
+    return f"{KEY_PREFIX}:version:position:{position_id}"
+
+
+def day_version_key(specialist_id, day):
+    """Return key of the specialist's day version, shared by all positions."""
+    return f"{KEY_PREFIX}:version:day:{specialist_id}:{day.isoformat()}"
+
+
+def _increment(key, delta=1):
+    """Increment value in cache, initialize it if it is missing."""
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def get_many_free_intervals(specialist_id, position_id, days, compute):
+    """Return free intervals for every day, using cached values when possible.
+
+    Args:
+        specialist_id (int): id of the specialist
+        position_id (int): id of the position
+        days (list): list of dates
+        compute (callable): receives list of missing days and returns dict
+            with free intervals for each of them
+
+    Returns:
+        dict: dates as keys and lists of free intervals as values
+    """
+    position_key = position_version_key(position_id)
+    day_keys = {day: day_version_key(specialist_id, day) for day in days}
+    versions = versioned_cache.get_versions([position_key, *day_keys.values()])
+
+    data_keys = {
+        day: f"{KEY_PREFIX}:{specialist_id}:{position_id}:{day.isoformat()}:"
+             f"{versions.get(position_key)}:{versions.get(day_keys[day])}"
+        for day in days
+    }
+    cached = cache.get_many(data_keys.values())
+
+    result = {
+        day: cached[key]
+        for day, key in data_keys.items()
+        if key in cached
+    }
+    missing = [day for day in days if day not in result]
+
+    if result:
+        _increment(HITS_KEY, len(result))
+
+    if missing:
+        _increment(MISSES_KEY, len(missing))
+        computed = compute(missing)
+        cache.set_many(
+            {data_keys[day]: computed[day] for day in missing},
+            timeout=get_timeout(),
+        )
+        result.update(computed)
+
+    logger.debug(f"Availability cache: {len(days) - len(missing)} hits, "
+                 f"{len(missing)} misses for specialist {specialist_id}")
+
+    return result
+
+
+def get_free_intervals(specialist_id, position_id, day, compute):
+    """Return free intervals for one day, using cached value when possible.
+
+    Args:
+        specialist_id (int): id of the specialist
+        position_id (int): id of the position
+        day (date): day of the schedule
+        compute (callable): returns free intervals of the day
+    """
+    return get_many_free_intervals(
+        specialist_id, position_id, [day], lambda days: {day: compute()},
+    )[day]
+
+
+def invalidate_day(specialist_id, day):
+    """Invalidate cached free intervals of the specialist's day in all positions."""
+    versioned_cache.bump(day_version_key(specialist_id, day))
+
+
+def invalidate_order(order):
+    """Invalidate cached free intervals of every day the order intersects."""
+    day = localtime(order.start_time).date()
+    last_day = localtime(order.end_time - timedelta(microseconds=1)).date()
+
+    while day <= last_day:
+        invalidate_day(order.specialist_id, day)
+        day += timedelta(days=1)
+
+
+def invalidate_position(position_id):
+    """Invalidate cached free intervals of all specialists of the position."""
+    versioned_cache.bump(position_version_key(position_id))
+
+
+def invalidate_positions(position_ids):
+    """Invalidate cached free intervals of all specialists of the positions."""
+    for position_id in position_ids:
+        invalidate_position(position_id)
+
+
+def get_stats():
+    """Return amount of cache hits and misses."""
+    stats = cache.get_many([HITS_KEY, MISSES_KEY])
+    return {
+        "hits": stats.get(HITS_KEY, 0),
+        "misses": stats.get(MISSES_KEY, 0),
+    }
+
+
+def reset_stats():
+    """Reset amount of cache hits and misses."""
+    cache.delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,221 @@
+"""Availability engine based on interval arithmetic.
+
+A day is represented as a list of half-open ``(start, end)`` intervals,
+where values are minutes passed since midnight. All the functions expect
+and return intervals sorted by start and not overlapping each other, so
+subtraction of booked time from working time is a single linear sweep
+after sorting.
+"""
+
+from datetime import datetime, time, timedelta
+from typing import Iterable, List, Tuple
+
+from django.utils import timezone
+
+
+MINUTES_IN_DAY = 24 * 60
+TIME_BLOCK_MINUTES = 15
+ORDER_STEP_MINUTES = 5
+
+Interval = Tuple[int, int]
+
+
+def time_to_minutes(value: time) -> int:
+    """Return amount of minutes passed since midnight."""
+    return value.hour * 60 + value.minute
+
+
+def minutes_to_time(minutes: int) -> time:
+    """Return time object for the given amount of minutes since midnight.
+
+    The end of the day (24:00) can not be represented by time object,
+    so it is returned as the last minute of the day.
+    """
+    minutes = min(minutes, MINUTES_IN_DAY - 1)
+    return time(hour=minutes // 60, minute=minutes % 60)
+
+
+def duration_to_minutes(duration: timedelta) -> int:
+    """Return amount of whole minutes in the duration."""
+    return int(duration.total_seconds() // 60)
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """Sort intervals and merge overlapping or touching ones.
+
+    Empty intervals (start >= end) are dropped.
+
+    Args:
+        intervals: intervals in any order
+
+    Returns:
+        list: sorted non-overlapping intervals
+    """
+    merged = []
+
+    for start, end in sorted(interval for interval in intervals
+                             if interval[0] < interval[1]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def subtract_intervals(base: Iterable[Interval],
+                       booked: Iterable[Interval]) -> List[Interval]:
+    """Return parts of base intervals which are not covered by booked ones.
+
+    Args:
+        base: intervals of available time, e.g. working hours
+        booked: intervals of busy time, e.g. orders
+
+    Returns:
+        list: sorted non-overlapping free intervals
+    """
+    base = merge_intervals(base)
+    booked = merge_intervals(booked)
+
+    free = []
+    index = 0
+
+    for start, end in base:
+        # Skip booked intervals which are finished before this one starts.
+        while index < len(booked) and booked[index][1] <= start:
+            index += 1
+
+        cursor = start
+        current = index
+        while current < len(booked) and booked[current][0] < end:
+            booked_start, booked_end = booked[current]
+            if booked_start > cursor:
+                free.append((cursor, booked_start))
+            cursor = max(cursor, booked_end)
+            current += 1
+
+        if cursor < end:
+            free.append((cursor, end))
+
+    return free
+
+
+def intersect_intervals(first: Iterable[Interval],
+                        second: Iterable[Interval]) -> List[Interval]:
+    """Return parts of time covered by both lists of intervals."""
+    first = merge_intervals(first)
+    second = merge_intervals(second)
+
+    common = []
+    first_index = second_index = 0
+
+    while first_index < len(first) and second_index < len(second):
+        start = max(first[first_index][0], second[second_index][0])
+        end = min(first[first_index][1], second[second_index][1])
+        if start < end:
+            common.append((start, end))
+
+        if first[first_index][1] < second[second_index][1]:
+            first_index += 1
+        else:
+            second_index += 1
+
+    return common
+
+
+def fit_intervals(free: Iterable[Interval], duration: int) -> List[Interval]:
+    """Return ranges of possible start moments for a service.
+
+    Args:
+        free: free intervals
+        duration: service duration in minutes
+
+    Returns:
+        list: (first start, last start) pairs, both ends inclusive
+    """
+    return [
+        (start, end - duration)
+        for start, end in free
+        if end - start >= duration
+    ]
+
+
+def split_interval(start: int, end: int,
+                   step: int = TIME_BLOCK_MINUTES) -> List[int]:
+    """Divide range in blocks by step minutes, both ends inclusive.
+
+    If end is less than start, range is considered to pass midnight.
+    """
+    if end < start:
+        end += MINUTES_IN_DAY
+
+    return [minute % MINUTES_IN_DAY for minute in range(start, end + 1, step)]
+
+
+def day_start(day) -> datetime:
+    """Return aware datetime of the local midnight of the given day."""
+    if isinstance(day, datetime):
+        day = day.date()
+
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def round_up_datetime(moment: datetime, step: int = ORDER_STEP_MINUTES) -> datetime:
+    """Return the closest moment not earlier than given one with minutes multiple of step."""
+    rounded = moment.replace(second=0, microsecond=0)
+    if rounded < moment:
+        rounded += timedelta(minutes=1)
+
+    return rounded + timedelta(minutes=-rounded.minute % step)
+
+
+def datetime_to_day_minutes(moment: datetime, day, round_up: bool = False) -> int:
+    """Return local wall-clock minutes of the moment, clipped to the day.
+
+    Working hours are wall-clock time, so minutes are not counted as elapsed
+    time since midnight, which differs by an hour on DST change days.
+    """
+    moment = timezone.localtime(moment)
+    days = (moment.date() - day).days
+
+    if days < 0:
+        return 0
+    if days > 0:
+        return MINUTES_IN_DAY
+
+    minutes = time_to_minutes(moment.time())
+    if round_up and (moment.second or moment.microsecond):
+        minutes += 1
+
+    return minutes
+
+
+def datetime_range_to_interval(start: datetime, end: datetime,
+                               midnight: datetime) -> Interval:
+    """Return interval of the day, which begins at midnight, covered by range.
+
+    Parts of the range which are outside of that day are clipped.
+    """
+    day = timezone.localtime(midnight).date()
+
+    return (
+        datetime_to_day_minutes(start, day),
+        datetime_to_day_minutes(end, day, round_up=True),
+    )
+
+
+def orders_to_intervals(orders, midnight: datetime) -> List[Interval]:
+    """Return intervals of the day booked by orders.
+
+    Args:
+        orders: iterable of Order instances
+        midnight: aware datetime of the day beginning
+
+    Returns:
+        list: sorted non-overlapping booked intervals
+    """
+    return merge_intervals(
+        datetime_range_to_interval(order.start_time, order.end_time, midnight)
+        for order in orders
+    )
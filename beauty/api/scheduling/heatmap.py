@@ -0,0 +1,113 @@
+"""Business-wide availability heatmap built with NumPy.
+
+A week is divided into 672 blocks of 15 minutes. Availability of every
+specialist is a boolean row of the matrix (specialists x blocks), so counts
+of free specialists and utilisation are reductions along the matrix axes.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from django.utils.timezone import localtime
+
+from api.scheduling import engine
+
+
+BLOCKS_IN_DAY = engine.MINUTES_IN_DAY // engine.TIME_BLOCK_MINUTES
+DAYS_IN_WEEK = 7
+BLOCKS_IN_WEEK = BLOCKS_IN_DAY * DAYS_IN_WEEK
+
+
+def working_time_mask(weekly_hours):
+    """Return boolean array of blocks fully covered by working hours.
+
+    Args:
+        weekly_hours (WeeklyHours): compiled working time
+    """
+    mask = np.zeros(BLOCKS_IN_WEEK, dtype=bool)
+
+    for start, end in weekly_hours.intervals:
+        mask[-(-start // engine.TIME_BLOCK_MINUTES):end // engine.TIME_BLOCK_MINUTES] = True
+
+    return mask
+
+
+def moment_to_week_minutes(moment, week_start):
+    """Return minutes since local midnight of week_start, clipped to the week."""
+    moment = localtime(moment)
+    days = (moment.date() - week_start).days
+
+    if days < 0:
+        return 0
+    if days >= DAYS_IN_WEEK:
+        return DAYS_IN_WEEK * engine.MINUTES_IN_DAY
+
+    return days * engine.MINUTES_IN_DAY + moment.hour * 60 + moment.minute
+
+
+def busy_matrix(rows_amount, orders, week_start):
+    """Return boolean matrix of blocks intersected by orders.
+
+    Args:
+        rows_amount (int): amount of rows in the matrix
+        orders (list): (row, start_time, end_time) tuples
+        week_start (date): first day of the week
+    """
+    # Every order adds 1 at its first block and -1 after its last block,
+    # so cumulative sum along the row is positive for busy blocks
+    changes = np.zeros((rows_amount, BLOCKS_IN_WEEK + 1), dtype=np.int16)
+
+    if orders:
+        rows, starts, ends = (np.array(column) for column in zip(*(
+            (
+                row,
+                moment_to_week_minutes(start_time, week_start),
+                moment_to_week_minutes(end_time, week_start),
+            )
+            for row, start_time, end_time in orders
+        )))
+        block_starts = starts // engine.TIME_BLOCK_MINUTES
+        block_ends = -(-ends // engine.TIME_BLOCK_MINUTES)
+        not_empty = block_starts < block_ends
+
+        np.add.at(changes, (rows[not_empty], block_starts[not_empty]), 1)
+        np.add.at(changes, (rows[not_empty], block_ends[not_empty]), -1)
+
+    return np.cumsum(changes, axis=1)[:, :BLOCKS_IN_WEEK] > 0
+
+
+def percentage(part, whole):
+    """Return part of whole in percents rounded to one digit, 0 for empty whole."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(whole > 0, part / np.maximum(whole, 1) * 100, 0)
+
+    return np.round(result, 1).tolist()
+
+
+def build_heatmap(working, busy, week_start):
+    """Return heatmap of free specialists and utilisation.
+
+    Args:
+        working (ndarray): specialists x blocks matrix of working hours
+        busy (ndarray): specialists x blocks matrix of booked blocks
+        week_start (date): first day of the week
+
+    Returns:
+        dict: free specialists count for every block of every day,
+        utilisation of the business, of every day and of every specialist
+    """
+    free = working & ~busy
+    booked = working & busy
+
+    working_by_day = working.sum(axis=0).reshape(DAYS_IN_WEEK, BLOCKS_IN_DAY).sum(axis=1)
+    booked_by_day = booked.sum(axis=0).reshape(DAYS_IN_WEEK, BLOCKS_IN_DAY).sum(axis=1)
+
+    return {
+        "week_start": week_start,
+        "block_minutes": engine.TIME_BLOCK_MINUTES,
+        "days": [week_start + timedelta(days=day) for day in range(DAYS_IN_WEEK)],
+        "free_specialists": free.sum(axis=0).reshape(DAYS_IN_WEEK, BLOCKS_IN_DAY).tolist(),
+        "utilisation": percentage(np.array(booked.sum()), np.array(working.sum())),
+        "utilisation_by_day": percentage(booked_by_day, working_by_day),
+        "utilisation_by_specialist": percentage(booked.sum(axis=1), working.sum(axis=1)),
+    }
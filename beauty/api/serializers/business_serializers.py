@@ -8,7 +8,7 @@ from rest_framework import serializers
 from beauty.utils import (Geolocator,
                           get_working_time_from_dict)
 
-from api.models import (Business, CustomUser, Location)
+from api.models import (Business, Location)
 from api.serializers.location_serializer import LocationSerializer
 
 
@@ -178,11 +178,14 @@ class BaseBusinessSerializer(WorkingTimeSerializer):
             raise serializers.ValidationError({"location": "The address is in the wrong format"})
 
     def to_representation(self, instance):
-        """Display owner full name."""
+        """Display owner full name.
+
+        The owner is taken from the business, so views should select it
+        with the business to avoid a query per row.
+        """
         data = super().to_representation(instance)
         if "owner" in data:
-            owner = CustomUser.objects.get(id=data["owner"])
-            data["owner"] = owner.get_full_name()
+            data["owner"] = instance.owner.get_full_name()
         return data
 
 
@@ -4,12 +4,14 @@ import logging
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
 from django.contrib.auth.password_validation import validate_password
+from django.utils.functional import cached_property
+from django.utils.http import urlencode
 from rest_framework import serializers
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.reverse import reverse
 
 from api.models import CustomUser
-from beauty.tokens import OrderApprovingTokenGenerator
-from beauty.utils import order_approve_decline_urls
+from beauty.utils import get_order_approving_url_template, order_approve_decline_urls
 
 logger = logging.getLogger(__name__)
 
@@ -62,12 +64,85 @@ class OrderUserHyperlink(serializers.HyperlinkedRelatedField):
         """
         url = super().to_representation(order)
         request = self.context.get("request")
-        valid_token = OrderApprovingTokenGenerator().check_token(order, order.token)
-        if all([request.user.is_authenticated, request.user == order.specialist, valid_token,
-                self.url_user_id == "specialist_id"]):
-            return {"url": url} | order_approve_decline_urls(order, request=request)
+        if all([request.user.is_authenticated, request.user.pk == order.specialist_id,
+                order.has_valid_token, self.url_user_id == "specialist_id"]):
+            return {"url": url} | order_approve_decline_urls(
+                order, url_template=self.approving_url_template,
+            )
         return url
 
+    @cached_property
+    def approving_url_template(self) -> str:
+        """str: Template of approving URLs built once for all rendered orders."""
+        return get_order_approving_url_template(self.context.get("request"))
+
+
+class ExpandedOrdersPagination(LimitOffsetPagination):
+    """Limit of order links expanded in user profiles."""
+
+    max_limit = 50
+
+
+class OrderLinksField(serializers.Field):
+    """Amount of user orders and URL of their paginated list.
+
+    Links of the first orders are added only with `?expand=orders` query
+    param, their amount is set by `limit` query param. So size of a profile
+    doesn't depend on order history of the user.
+    """
+
+    def __init__(self, orders, view_name, url_user_id="specialist_id", filters=None, **kwargs):
+        """Init for OrderLinksField.
+
+        Args:
+            orders (str): relation or property of the user with its orders,
+                amount is taken from `<orders>_count` annotation if it exists
+            view_name (str): name of the view with paginated list of the orders
+            url_user_id (str): order attribute with the user for order links
+            filters (dict, optional): query params filtering the list
+        """
+        self.orders = orders
+        self.view_name = view_name
+        self.filters = filters
+        self.order_link = OrderUserHyperlink(read_only=True, url_user_id=url_user_id)
+        kwargs.update(source="*", read_only=True)
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        """Bind the field and its order links to the serializer."""
+        super().bind(field_name, parent)
+        self.order_link.bind(field_name, self)
+
+    def to_representation(self, user):
+        """Get amount of orders, URL of their list and expanded order links.
+
+        Args:
+            user (CustomUser): instance of the user
+
+        Returns:
+            data (dict): count, url and results if orders are expanded
+        """
+        request = self.context.get("request")
+        orders = getattr(user, self.orders).all()
+
+        count = getattr(user, f"{self.orders}_count", None)
+        url = reverse(self.view_name, kwargs={"pk": user.pk}, request=request)
+        if self.filters:
+            url = f"{url}?{urlencode(self.filters)}"
+
+        data = {
+            "count": orders.count() if count is None else count,
+            "url": url,
+        }
+
+        if request and "orders" in request.GET.get("expand", "").split(","):
+            limit = ExpandedOrdersPagination().get_limit(request)
+            data["results"] = [
+                self.order_link.to_representation(order) for order in orders[:limit]
+            ]
+
+        return data
+
 
 class PasswordsValidation(serializers.Serializer):
     """Validator for passwords."""
@@ -160,10 +235,10 @@ class CustomUserSerializer(PasswordsValidation,
         required=False,
         queryset=group_queryset,
     )
-    specialist_orders = OrderUserHyperlink(many=True, read_only=True)
-    customer_orders = OrderUserHyperlink(
-        many=True,
-        read_only=True,
+    specialist_orders = OrderLinksField("specialist_orders", "api:specialist-orders-list")
+    customer_orders = OrderLinksField(
+        "customer_orders",
+        "api:customer-orders-list",
         url_user_id="customer_id",
     )
 
@@ -229,10 +304,11 @@ class CustomUserDetailSerializer(PasswordsValidation,
             "placeholder": "Confirmation Password",
         },
     )
-    customer_exist_orders = OrderUserHyperlink(
-        many=True,
-        read_only=True,
+    customer_exist_orders = OrderLinksField(
+        "customer_exist_orders",
+        "api:customer-orders-list",
         url_user_id="customer_id",
+        filters={"exist": "true"},
     )
     customer_reviews = serializers.HyperlinkedRelatedField(
         many=True,
@@ -275,7 +351,11 @@ class CustomUserDetailSerializer(PasswordsValidation,
 class SpecialistInformationSerializer(CustomUserDetailSerializer):
     """Class for serializing specialist's information for specialist."""
 
-    specialist_exist_orders = OrderUserHyperlink(many=True, read_only=True)
+    specialist_exist_orders = OrderLinksField(
+        "specialist_exist_orders",
+        "api:specialist-orders-list",
+        filters={"exist": "true"},
+    )
     specialist_reviews = serializers.URLField(
         default="",
     )
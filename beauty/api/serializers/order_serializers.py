@@ -2,11 +2,11 @@
 
 import logging
 from rest_framework.exceptions import ValidationError
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
-from api.models import (Order, CustomUser, Service, Position)
+from api.models import (Order, CustomUser, Service, Position, SpecialistSlot)
 
-from beauty.utils import string_to_time
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +68,7 @@ class OrderSerializer(serializers.HyperlinkedModelSerializer):
 
             errors.update({"users": "Customer and specialist are the same person!"})
 
-        working_hours = service.position.working_time[start_time.strftime("%a")]
+        working_hours = service.position.weekly_hours.day_times(start_time.weekday())
 
         if not working_hours and start_time < timezone.now():
             logger.info(f"{specialist} does not work {start_time.date()}")
@@ -76,8 +76,7 @@ class OrderSerializer(serializers.HyperlinkedModelSerializer):
             errors.update({"start_date": f"{specialist} does not work {start_time.date()}."})
 
         if working_hours:
-            start_hour = string_to_time(working_hours[0])
-            end_hour = string_to_time(working_hours[1])
+            start_hour, end_hour = working_hours
             if start_hour > start_time.time() or start_time.time() > end_hour:
                 logger.info(f"Specialist {specialist.get_full_name()} "
                             f"does not work at {start_time.time()}")
@@ -93,6 +92,25 @@ class OrderSerializer(serializers.HyperlinkedModelSerializer):
             raise ValidationError(errors)
         return super().validate(attrs)
 
+    def create(self, validated_data):
+        """Create an order and reserve its time slots.
+
+        Order is rolled back if any of its slots is already reserved by
+        another order of the specialist.
+        """
+        with transaction.atomic():
+            order = super().create(validated_data)
+
+            if not SpecialistSlot.objects.reserve(order):
+                logger.info(f"{order.specialist} is busy at {order.start_time}")
+
+                raise ValidationError(
+                    {"start_time": f"Specialist is already booked at "
+                                   f"{timezone.localtime(order.start_time).time()}."},
+                )
+
+        return order
+
 
 class OrderDeleteSerializer(serializers.ModelSerializer):
     """Serializer for order cancellation."""
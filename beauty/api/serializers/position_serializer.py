@@ -4,7 +4,7 @@ import logging
 import calendar
 
 from rest_framework import serializers
-from beauty.utils import (is_inside_interval, string_to_time)
+from beauty.utils import WeeklyHours
 from api.serializers.business_serializers import WorkingTimeSerializer
 from api.models import Position
 
@@ -13,28 +13,22 @@ logger = logging.getLogger(__name__)
 
 
 def is_valid_position_time(business_time, data):
-    """Return True if position time within business time."""
-    week_days = [day.capitalize() for day in calendar.HTMLCalendar.cssclasses]
-
-    for time in week_days:
-        if len(business_time[time]) < len(data[time]):
-            return False
-        if len(business_time[time]) > len(data[time]):
-            continue
-        if len(business_time[time]) == len(data[time]) == 0:
+    """Return True if position time within business time.
+
+    Args:
+        business_time (dict or WeeklyHours): working time of the business
+        data (dict): validated data with working time of the position
+    """
+    business_hours = WeeklyHours.compile(business_time)
+    position_hours = WeeklyHours.compile(
+        {day: data[day] for day in WeeklyHours.DAYS},
+    )
+
+    for weekday in range(len(WeeklyHours.DAYS)):
+        hours = position_hours.day(weekday)
+        if hours is None:
             continue
-
-        inner_interval = (
-            string_to_time(data[time][0]),
-            string_to_time(data[time][1]),
-        )
-
-        main_interval = (
-            string_to_time(business_time[time][0]),
-            string_to_time(business_time[time][1]),
-        )
-
-        if not is_inside_interval(main_interval, inner_interval):
+        if not business_hours.contains(weekday, *hours):
             return False
     return True
 
@@ -71,7 +65,7 @@ class PositionSerializer(WorkingTimeSerializer):
 
         """
         business = data.get("business")
-        business_time = business.working_time
+        business_time = business.weekly_hours
 
         if business and business.owner != self.context["request"].user:
             raise serializers.ValidationError(
@@ -0,0 +1,120 @@
+"""The module includes serializers for ReportJob model."""
+
+import logging
+
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from api.exports import STATUS_NAMES
+from api.models import Business, ReportJob
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReportJobSerializer(serializers.HyperlinkedModelSerializer):
+    """Serializer for requesting a report and polling its status.
+
+    Report parameters are accepted as write only fields and stored in
+    params of the job.
+    """
+
+    url = serializers.HyperlinkedIdentityField(
+        view_name="api:report-job-detail", lookup_field="pk",
+    )
+    business = serializers.PrimaryKeyRelatedField(
+        queryset=Business.objects.all(), required=False, allow_null=True,
+    )
+    date_from = serializers.DateField(write_only=True, required=False)
+    date_to = serializers.DateField(write_only=True, required=False)
+    statuses = serializers.ListField(
+        child=serializers.ChoiceField(choices=list(STATUS_NAMES)),
+        write_only=True,
+        required=False,
+    )
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        """Class with a model and model fields for serialization."""
+
+        model = ReportJob
+        fields = (
+            "id", "url", "kind", "business", "params", "status", "progress", "error",
+            "created_at", "started_at", "finished_at", "download_url",
+            "date_from", "date_to", "statuses",
+        )
+        read_only_fields = (
+            "params", "status", "progress", "error", "created_at", "started_at",
+            "finished_at",
+        )
+
+    def get_download_url(self, job):
+        """Return url of the report file if the job is done."""
+        if job.status != ReportJob.StatusChoices.DONE:
+            return None
+
+        return reverse(
+            "api:report-job-download", kwargs={"pk": job.pk},
+            request=self.context.get("request"),
+        )
+
+    def validate(self, attrs):
+        """Validate data.
+
+        Business reports are available for owner of the business and admins,
+        reports about all businesses only for admins.
+
+        Args:
+            attrs: data from fields
+
+        Returns: validated data
+        """
+        user = self.context["request"].user
+        business = attrs.get("business")
+
+        if attrs["kind"] == ReportJob.KindChoices.BUSINESSES:
+            if not user.is_admin:
+                raise serializers.ValidationError(
+                    {"kind": "Only admins can request reports about all businesses."},
+                )
+            attrs["business"] = None
+
+        elif not business:
+            raise serializers.ValidationError({"business": "This field is required."})
+
+        elif not (user.is_admin or business.owner_id == user.id):
+            logger.info(f"User {user} requested report of foreign business {business}")
+            raise serializers.ValidationError(
+                {"business": "You can request reports only about your business."},
+            )
+
+        if attrs.get("date_from") and attrs.get("date_to") \
+                and attrs["date_from"] > attrs["date_to"]:
+            raise serializers.ValidationError(
+                {"date_to": "date_to should not be earlier than date_from."},
+            )
+
+        return attrs
+
+    def create(self, validated_data):
+        """Return in-flight job of the same report or create a new one.
+
+        created attribute of the serializer shows if the job was created.
+        """
+        params = {
+            name: validated_data[name].isoformat()
+            for name in ("date_from", "date_to") if validated_data.get(name)
+        }
+        if validated_data.get("statuses"):
+            params["statuses"] = sorted(
+                {STATUS_NAMES[status] for status in validated_data["statuses"]},
+            )
+
+        job, self.created = ReportJob.objects.get_or_create_job(
+            requested_by=self.context["request"].user,
+            kind=validated_data["kind"],
+            business=validated_data.get("business"),
+            params=params,
+        )
+
+        return job
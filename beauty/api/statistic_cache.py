@@ -0,0 +1,64 @@
+"""Cache of businesses' statistic with versioned keys.
+
+Statistic is stored per (business, interval, version). The version of a
+business is bumped when any of its orders, services or specialists
+changes, see api.versioned_cache.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from api import versioned_cache
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "statistic"
+
+
+def get_timeout():
+    """Return timeout of cached statistic in seconds."""
+    return getattr(settings, "STATISTIC_CACHE_TIMEOUT", 60 * 60)
+
+
+def business_version_key(business_id):
+    """Return key of the business version."""
+    return f"{KEY_PREFIX}:version:business:{business_id}"
+
+
+def get_version(business_id):
+    """Return version of the business statistic, initialize it if it is missing."""
+    return versioned_cache.get_version(business_version_key(business_id))
+
+
+def get_statistic(business_id, interval, compute):
+    """Return statistic of the business, using cached value when possible.
+
+    Args:
+        business_id (int): id of the business
+        interval (str): period of the statistic
+        compute (callable): returns statistic of the business
+
+    Returns:
+        tuple: statistic and its age in seconds
+    """
+    key = f"{KEY_PREFIX}:{business_id}:{interval}:{get_version(business_id)}"
+    cached = cache.get(key)
+
+    if cached is not None:
+        created_at, statistic = cached
+        logger.debug(f"Statistic cache hit for business {business_id}")
+        return statistic, max(int(time.time() - created_at), 0)
+
+    statistic = compute()
+    cache.set(key, (time.time(), statistic), timeout=get_timeout())
+
+    return statistic, 0
+
+
+def invalidate_business(business_id):
+    """Invalidate all cached statistic of the business."""
+    versioned_cache.bump(business_version_key(business_id))
@@ -2,9 +2,11 @@
 
 import logging
 import smtplib
+from django.conf import settings
 from beauty.celery import app
 from functools import wraps
-from api.models import Order
+from api.models import Order, ReportJob
+from api.reports import build_report
 from beauty.utils import (AutoDeclineOrderEmail, RemindAboutOrderEmail, ApprovingOrderEmail)
 
 
@@ -106,3 +108,37 @@ def send_message_for_specialist_consideration(self, order_id, site_name, is_secu
 
     logger.info(f"{order}: approving email was sent to the specialist "
                 f"{order.specialist.get_full_name()}")
+
+
+@app.task(bind=True, soft_time_limit=settings.REPORT_JOB_TIMEOUT)
+def generate_report(self, job_id):
+    """Generate file of the pending report job.
+
+    Failures are saved to the job instead of retrying, user can request
+    the report again. The time limit counts from the start of the task,
+    as running time of the job does, so the job fails by time limit before
+    it's considered stale by ReportJobManager.
+
+    Args:
+        self (object): current object
+        job_id (int): report job id
+    """
+    job = ReportJob.objects.filter(
+        id=job_id, status=ReportJob.StatusChoices.PENDING,
+    ).first()
+    if not job or not job.start():
+        logger.info(f"Pending report job with id={job_id} does not exist")
+        return
+
+    try:
+        build_report(job)
+    except Exception as ex:
+        logger.exception(f"{job} failed")
+        job.finish(ReportJob.StatusChoices.FAILED, error=str(ex))
+        return
+
+    if job.finish(ReportJob.StatusChoices.DONE):
+        logger.info(f"{job} was generated")
+    else:
+        logger.warning(f"{job} was failed as stale before it was generated")
+        job.file.delete(save=False)
@@ -0,0 +1,199 @@
+"""This module is for testing availability cache.
+
+Tests for availability cache:
+- Set up all required objects for the tests;
+- Test if repeated schedule request is served from cache;
+- Test if new order invalidates cached day;
+- Test if order status change invalidates cached day;
+- Test if position change invalidates all cached days;
+- Test if order of another position of the specialist takes the cached day;
+- Test if cached day is invalidated only when the order is committed;
+- Test if range schedule computes only days missing in cache;
+- Test if single day schedule caches orders of the local day.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from api.scheduling import cache as availability_cache
+from api.tests.factories import (CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from api.tests.test_customer_schedule import get_next_desired_day
+from beauty.utils import generate_working_time
+
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "availability-tests",
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestAvailabilityCache(TestCase):
+    """TestCase for availability cache and its invalidation."""
+
+    def setUp(self) -> None:
+        """Set up all required objects for the tests."""
+        cache.clear()
+
+        self.position = PositionFactory.create(
+            working_time=generate_working_time("10:00", "12:00"),
+        )
+        self.service = ServiceFactory.create(
+            position=self.position, duration=timedelta(minutes=30),
+        )
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+        self.day = get_next_desired_day(0) + timedelta(days=7)
+        self.url = reverse(
+            "api:specialist-schedule",
+            kwargs={
+                "position_id": self.position.id,
+                "specialist_id": self.specialist.id,
+                "service_id": self.service.id,
+                "order_date": self.day,
+            },
+        )
+        availability_cache.reset_stats()
+
+    def create_order(self, hour):
+        """Create order of the specialist on the schedule day and commit it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return OrderFactory.create(
+                start_time=timezone.make_aware(datetime.combine(self.day, time(hour))),
+                specialist=self.specialist,
+                service=self.service,
+            )
+
+    def test_repeated_request_is_cached(self):
+        """Test if repeated schedule request is served from cache."""
+        with CaptureQueriesContext(connection) as first:
+            first_response = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as second:
+            second_response = self.client.get(self.url)
+
+        self.assertEqual(first_response.data, second_response.data)
+        self.assertEqual(len(first) - 1, len(second))
+        self.assertEqual(availability_cache.get_stats(), {"hits": 1, "misses": 1})
+
+    def test_new_order_invalidates_day(self):
+        """Test if new order invalidates cached day."""
+        response = self.client.get(self.url)
+        self.create_order(10)
+
+        self.assertNotEqual(self.client.get(self.url).data, response.data)
+        self.assertEqual(availability_cache.get_stats(), {"hits": 0, "misses": 2})
+
+    def test_order_status_change_invalidates_day(self):
+        """Test if order status change invalidates cached day."""
+        order = self.create_order(10)
+        response = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            order.mark_as_cancelled()
+
+        self.assertNotEqual(self.client.get(self.url).data, response.data)
+        self.assertEqual(availability_cache.get_stats(), {"hits": 0, "misses": 2})
+
+    def test_position_change_invalidates_days(self):
+        """Test if position change invalidates all cached days."""
+        response = self.client.get(self.url)
+        self.position.working_time = generate_working_time("10:00", "11:00")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.position.save()
+
+        self.assertNotEqual(self.client.get(self.url).data, response.data)
+        self.assertEqual(availability_cache.get_stats(), {"hits": 0, "misses": 2})
+
+    def test_order_of_another_position(self):
+        """Test if order of another position of the specialist takes the cached day."""
+        other_position = PositionFactory.create(
+            working_time=generate_working_time("10:00", "12:00"),
+        )
+        other_position.specialist.add(self.specialist)
+        other_service = ServiceFactory.create(
+            position=other_position, duration=timedelta(minutes=30),
+        )
+        response = self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            OrderFactory.create(
+                start_time=timezone.make_aware(datetime.combine(self.day, time(10))),
+                specialist=self.specialist,
+                service=other_service,
+            )
+
+        self.assertEqual(response.data[0][0], time(10))
+        self.assertEqual(self.client.get(self.url).data[0][0], time(10, 30))
+
+    def test_invalidation_after_commit(self):
+        """Test if cached day is invalidated only when the order is committed."""
+        response = self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            OrderFactory.create(
+                start_time=timezone.make_aware(datetime.combine(self.day, time(10))),
+                specialist=self.specialist,
+                service=self.service,
+            )
+
+        self.assertEqual(self.client.get(self.url).data, response.data)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertNotEqual(self.client.get(self.url).data, response.data)
+        self.assertEqual(availability_cache.get_stats(), {"hits": 1, "misses": 2})
+
+    def test_range_uses_cached_days(self):
+        """Test if range schedule computes only days missing in cache."""
+        self.client.get(self.url)
+        response = self.client.get(
+            reverse(
+                "api:specialist-schedule-range",
+                kwargs={
+                    "position_id": self.position.id,
+                    "specialist_id": self.specialist.id,
+                    "service_id": self.service.id,
+                },
+            ),
+            {"from": self.day, "to": self.day + timedelta(days=6)},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 7)
+        self.assertEqual(availability_cache.get_stats(), {"hits": 1, "misses": 7})
+
+    def test_single_day_caches_local_day(self):
+        """Test if single day schedule caches orders of the local day."""
+        self.position.working_time = generate_working_time("00:00", "02:00")
+        self.position.save()
+        # Local 01:00 is the previous day in UTC
+        self.create_order(1)
+
+        self.client.get(self.url)
+        response = self.client.get(
+            reverse(
+                "api:specialist-schedule-range",
+                kwargs={
+                    "position_id": self.position.id,
+                    "specialist_id": self.specialist.id,
+                    "service_id": self.service.id,
+                },
+            ),
+            {"from": self.day, "to": self.day},
+        )
+
+        self.assertEqual(
+            response.data[self.day.isoformat()],
+            [[time(0), time(0, 15), time(0, 30)], [time(1, 30)]],
+        )
+        self.assertEqual(availability_cache.get_stats(), {"hits": 1, "misses": 1})
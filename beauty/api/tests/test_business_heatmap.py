@@ -0,0 +1,128 @@
+"""This module is for testing availability heatmap of a business.
+
+Tests for BusinessHeatmapView:
+- Set up all required objects for the tests;
+- Test if free specialists are counted for every block;
+- Test if utilisation is calculated for business, days and specialists;
+- Test if only business owner can get the heatmap;
+- Test if endpoint returns 400 response for invalid week;
+- Test if amount of queries doesn't depend on amount of specialists.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.scheduling.heatmap import BLOCKS_IN_DAY
+from api.tests.factories import (BusinessFactory, CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+
+
+MONDAY = date(2030, 7, 1)
+
+
+def block(hour, minute=0):
+    """Return index of 15 minutes block of the day."""
+    return (hour * 60 + minute) // 15
+
+
+class TestBusinessHeatmap(TestCase):
+    """TestCase for BusinessHeatmapView."""
+
+    def setUp(self) -> None:
+        """Set up business with two positions working on Mondays."""
+        self.owner = CustomUserFactory.create()
+        self.business = BusinessFactory.create(owner=self.owner)
+
+        self.first_position = PositionFactory.create(
+            business=self.business, working_time={"Mon": ["10:00", "12:00"]},
+        )
+        self.second_position = PositionFactory.create(
+            business=self.business, working_time={"Mon": ["11:00", "13:00"]},
+        )
+        self.service = ServiceFactory.create(
+            position=self.first_position, duration=timedelta(hours=1),
+        )
+
+        self.first, self.second, self.third = CustomUserFactory.create_batch(3)
+        self.first_position.specialist.add(self.first, self.second)
+        self.second_position.specialist.add(self.second, self.third)
+
+        self.url = reverse("api:business-heatmap", kwargs={"business_id": self.business.id})
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def order(self, specialist, hour):
+        """Create order of the specialist on MONDAY."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(datetime.combine(MONDAY, time(hour))),
+            specialist=specialist,
+            service=self.service,
+        )
+
+    def get_heatmap(self, week=MONDAY + timedelta(days=3)):
+        """Return response for the week."""
+        return self.client.get(self.url, {"week": week})
+
+    def test_free_specialists(self):
+        """Test if free specialists are counted for every block."""
+        self.order(self.first, 10)
+
+        response = self.get_heatmap()
+        monday = response.data["free_specialists"][0]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["week_start"], MONDAY)
+        self.assertEqual(len(response.data["free_specialists"]), 7)
+        self.assertEqual(len(monday), BLOCKS_IN_DAY)
+        self.assertEqual(monday[block(9, 45)], 0)
+        self.assertEqual(monday[block(10)], 1)
+        self.assertEqual(monday[block(11)], 3)
+        self.assertEqual(monday[block(12)], 2)
+        self.assertEqual(monday[block(13)], 0)
+        self.assertEqual(sum(response.data["free_specialists"][1]), 0)
+
+    def test_utilisation(self):
+        """Test if utilisation is calculated for business, days and specialists."""
+        self.order(self.first, 10)
+        self.order(self.second, 12)
+
+        response = self.get_heatmap()
+
+        self.assertEqual(response.data["utilisation"], 28.6)
+        self.assertEqual(response.data["utilisation_by_day"], [28.6] + [0] * 6)
+        self.assertEqual(
+            {item["id"]: item["utilisation"]
+             for item in response.data["utilisation_by_specialist"]},
+            {self.first.id: 50.0, self.second.id: 33.3, self.third.id: 0},
+        )
+
+    def test_not_owner(self):
+        """Test if only business owner can get the heatmap."""
+        self.client.force_authenticate(user=self.first)
+
+        self.assertEqual(self.get_heatmap().status_code, 400)
+
+    def test_invalid_week(self):
+        """Test if endpoint returns 400 response for invalid week."""
+        self.assertEqual(self.get_heatmap("next week").status_code, 400)
+
+    def test_queries_count(self):
+        """Test if amount of queries doesn't depend on amount of specialists."""
+        with CaptureQueriesContext(connection) as few_specialists:
+            self.get_heatmap()
+
+        for specialist in CustomUserFactory.create_batch(20):
+            self.first_position.specialist.add(specialist)
+            self.order(specialist, 11)
+
+        with CaptureQueriesContext(connection) as many_specialists:
+            response = self.get_heatmap()
+
+        self.assertEqual(response.data["free_specialists"][0][block(11)], 3)
+        self.assertEqual(len(few_specialists), len(many_specialists))
@@ -26,9 +26,15 @@ BusinessDetailRUDView tests:
     *   Test that The owner cannot use a business description that is too long.
     *   Test that Owner can edit changeable business info fields.
 
+Queries count tests:
+    *   Test that Amount of queries of business lists doesn't depend on amount of businesses.
+    *   Test that Owner full name is rendered from the business row.
+
 """
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework.test import APIClient
@@ -267,3 +273,60 @@ class BusinessDetailRUDView(TestCase):
         self.client.force_authenticate(user=self.business.owner)
         response = self.client.patch(path=self.path, data=self.valid_business_info)
         self.assertEqual(response.status_code, 200)
+
+
+class BusinessesQueriesCount(TestCase):
+    """Class for testing amount of queries of business views."""
+
+    def setUp(self):
+        """Create owner with a business and URLs of business lists."""
+        self.client = APIClient()
+        self.groups = GroupFactory.groups_for_test()
+        self.owner = CustomUserFactory(groups=[self.groups.owner])
+        self.create_businesses(1)
+        self.client.force_authenticate(user=self.owner)
+
+        self.urls = [
+            reverse("api:businesses-list-create"),
+            reverse("api:businesses-list-active"),
+            reverse("api:businesses-list-nearest", args=[50.0, 30.0, 1.0]),
+        ]
+
+    def create_businesses(self, amount):
+        """Create businesses of the owner next to the same point."""
+        return BusinessFactory.create_batch(
+            amount, owner=self.owner, location__latitude=50.0, location__longitude=30.0,
+        )
+
+    def count_queries(self, url):
+        """Get response of the URL and amount of its queries."""
+        self.owner.forget_roles()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        return response, len(queries)
+
+    def test_lists_queries_count(self):
+        """Amount of queries of business lists doesn't depend on amount of businesses."""
+        few_businesses = [self.count_queries(url)[1] for url in self.urls]
+
+        self.create_businesses(10)
+
+        for url, expected in zip(self.urls, few_businesses):
+            with self.subTest(url=url):
+                response, queries_count = self.count_queries(url)
+
+                self.assertEqual(response.data["count"], 11)
+                self.assertEqual(queries_count, expected)
+
+    def test_owner_full_name(self):
+        """Owner full name is rendered from the business row."""
+        business = self.owner.businesses.get()
+
+        response, queries_count = self.count_queries(
+            reverse("api:business-detail", args=[business.id]),
+        )
+
+        self.assertEqual(response.data["owner"], self.owner.get_full_name())
+        self.assertEqual(queries_count, 3)
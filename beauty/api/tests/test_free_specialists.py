@@ -0,0 +1,98 @@
+"""This module is for testing search of free specialists.
+
+Tests for FreeSpecialistsView:
+- Set up all required objects for the tests;
+- Test if only specialists who can fit the service are returned;
+- Test if window outside of working hours returns empty list;
+- Test if endpoint returns 400 response for invalid window;
+- Test if amount of queries doesn't depend on amount of specialists.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from api.tests.factories import (CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from api.tests.test_customer_schedule import get_next_desired_day
+from beauty.utils import generate_working_time
+
+
+class TestFreeSpecialists(TestCase):
+    """TestCase for FreeSpecialistsView."""
+
+    def setUp(self) -> None:
+        """Set up all required objects for the tests."""
+        self.position = PositionFactory.create(
+            working_time=generate_working_time("10:00", "12:00"),
+        )
+        self.service = ServiceFactory.create(
+            position=self.position, duration=timedelta(minutes=30),
+        )
+        self.specialists = CustomUserFactory.create_batch(3)
+        self.position.specialist.add(*self.specialists)
+
+        self.monday = get_next_desired_day(0) + timedelta(days=7)
+        self.url = reverse(
+            "api:service-free-specialists",
+            kwargs={"service_id": self.service.id},
+        )
+
+    def at(self, hour, minute=0):
+        """Return aware datetime of the next monday."""
+        return timezone.make_aware(datetime.combine(self.monday, time(hour, minute)))
+
+    def get_free(self, start, end):
+        """Return response for the given window."""
+        return self.client.get(self.url, {"start": start.isoformat(), "end": end.isoformat()})
+
+    def test_free_specialists(self):
+        """Test if only specialists who can fit the service are returned."""
+        first, second, third = self.specialists
+        OrderFactory.create(start_time=self.at(10), specialist=first, service=self.service)
+        OrderFactory.create(start_time=self.at(10, 15), specialist=second, service=self.service)
+
+        response = self.get_free(self.at(10), self.at(11))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(item["id"], item["free_from"]) for item in response.data],
+            [(first.id, self.at(10, 30)), (third.id, self.at(10))],
+        )
+
+    def test_window_outside_working_hours(self):
+        """Test if window outside of working hours returns empty list."""
+        response = self.get_free(self.at(13), self.at(15))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
+
+    def test_invalid_window(self):
+        """Test if endpoint returns 400 response for invalid window."""
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.get_free(self.at(11), self.at(10)).status_code, 400)
+        self.assertEqual(
+            self.get_free(self.at(10), self.at(10) + timedelta(days=60)).status_code,
+            400,
+        )
+
+    def test_queries_count(self):
+        """Test if amount of queries doesn't depend on amount of specialists."""
+        with CaptureQueriesContext(connection) as few_specialists:
+            self.get_free(self.at(10), self.at(12))
+
+        specialists = CustomUserFactory.create_batch(10)
+        self.position.specialist.add(*specialists)
+        for specialist in specialists:
+            OrderFactory.create(start_time=self.at(10), specialist=specialist,
+                                service=self.service)
+
+        with CaptureQueriesContext(connection) as many_specialists:
+            response = self.get_free(self.at(10), self.at(12))
+
+        self.assertEqual(len(response.data), 13)
+        self.assertEqual(len(few_specialists), len(many_specialists))
@@ -0,0 +1,130 @@
+"""This module is for testing search of the next available slot.
+
+Tests for NextAvailableSlotView:
+- Set up all required objects for the tests;
+- Test if the first slot of today is found;
+- Test if search starts from now rounded up to 5 minutes;
+- Test if busy days are skipped;
+- Test if search stops at the horizon;
+- Test if endpoint returns 400 response for invalid horizon;
+- Test if amount of queries is bounded by the horizon, not by amount of busy days.
+"""
+
+from datetime import datetime, time, timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from api.tests.factories import (CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from beauty.utils import generate_working_time
+
+
+MONDAY = datetime(2030, 7, 1)
+
+
+class TestNextAvailableSlot(TestCase):
+    """TestCase for NextAvailableSlotView."""
+
+    def setUp(self) -> None:
+        """Set up position which works on Mondays and Wednesdays."""
+        working_time = generate_working_time("10:00", "12:00")
+        for day in ("Tue", "Thu", "Fri", "Sat", "Sun"):
+            working_time[day] = []
+
+        self.position = PositionFactory.create(working_time=working_time)
+        self.service = ServiceFactory.create(
+            position=self.position, duration=timedelta(hours=1),
+        )
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+        self.url = reverse(
+            "api:specialist-next-available",
+            kwargs={
+                "position_id": self.position.id,
+                "specialist_id": self.specialist.id,
+                "service_id": self.service.id,
+            },
+        )
+
+    def at(self, days, hour, minute=0):
+        """Return aware datetime of the day after MONDAY."""
+        return timezone.make_aware(
+            datetime.combine(MONDAY.date() + timedelta(days=days), time(hour, minute)),
+        )
+
+    def get_next(self, now, **params):
+        """Return response of the view as if it was requested at the given moment."""
+        with patch("django.utils.timezone.now", return_value=now):
+            return self.client.get(self.url, params)
+
+    def book_day(self, days):
+        """Book all working hours of the day."""
+        for hour in (10, 11):
+            OrderFactory.create(
+                start_time=self.at(days, hour),
+                specialist=self.specialist,
+                service=self.service,
+            )
+
+    def test_first_slot_today(self):
+        """Test if the first slot of today is found."""
+        response = self.get_next(self.at(0, 9))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["start"], self.at(0, 10))
+        self.assertEqual(response.data["end"], self.at(0, 11))
+
+    def test_start_from_now(self):
+        """Test if search starts from now rounded up to 5 minutes."""
+        response = self.get_next(self.at(0, 10, 7))
+
+        self.assertEqual(response.data["start"], self.at(0, 10, 10))
+
+    def test_busy_days_are_skipped(self):
+        """Test if busy days are skipped."""
+        self.book_day(0)
+        self.book_day(2)
+
+        response = self.get_next(self.at(0, 9))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["start"], self.at(7, 10))
+
+    def test_horizon(self):
+        """Test if search stops at the horizon."""
+        self.book_day(0)
+
+        self.assertEqual(self.get_next(self.at(0, 9), horizon=2).status_code, 404)
+        self.assertEqual(
+            self.get_next(self.at(0, 9), horizon=3).data["start"], self.at(2, 10),
+        )
+
+    def test_invalid_horizon(self):
+        """Test if endpoint returns 400 response for invalid horizon."""
+        for horizon in (0, "week", 1000):
+            self.assertEqual(
+                self.get_next(self.at(0, 9), horizon=horizon).status_code, 400,
+            )
+
+    def test_queries_count(self):
+        """Test if amount of queries is bounded by the horizon, not by busy days."""
+        for week in range(14):
+            self.book_day(week * 7)
+            self.book_day(week * 7 + 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_next(self.at(0, 9), horizon=92)
+
+        orders_queries = [
+            query for query in queries.captured_queries
+            if 'FROM "api_order"' in query["sql"]
+        ]
+
+        self.assertEqual(response.status_code, 404)
+        self.assertLessEqual(len(orders_queries), 7)
@@ -0,0 +1,145 @@
+"""This module is for testing daily rollups of orders.
+
+Tests for OrderDailyStat:
+- Set up all required objects for the tests;
+- Created orders are counted in the row of their local day;
+- Status transition moves order to the row of the new status;
+- Cancellation of several orders one by one is counted;
+- Deleted order is removed from its row;
+- Order loaded with deferred fields is moved correctly;
+- Price change of the service recalculates revenue;
+- Rebuild command restores rollups changed bypassing signals.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from api.models import Order, OrderDailyStat
+from api.tests.factories import (BusinessFactory, CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+
+
+DAY = date(2030, 7, 1)
+
+
+class TestOrderDailyStat(TestCase):
+    """TestCase for maintaining daily rollups of orders."""
+
+    def setUp(self) -> None:
+        """Set up business with a service and a specialist."""
+        self.business = BusinessFactory.create()
+        self.position = PositionFactory.create(business=self.business)
+        self.service = ServiceFactory.create(position=self.position, price=Decimal("10"))
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+    def order(self, hour, day=DAY):
+        """Create order of the specialist starting at the local hour of the day."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(datetime(day.year, day.month, day.day, hour)),
+            specialist=self.specialist,
+            service=self.service,
+        )
+
+    def rollups(self):
+        """Return not empty rollups as (date, status, count, revenue) tuples."""
+        return set(
+            OrderDailyStat.objects.filter(orders_count__gt=0).values_list(
+                "date", "status", "orders_count", "revenue",
+            ),
+        )
+
+    def test_created_orders(self):
+        """Created orders are counted in the row of their local day."""
+        self.order(0)
+        self.order(23)
+        self.order(10, DAY + timedelta(days=1))
+
+        self.assertEqual(
+            self.rollups(),
+            {
+                (DAY, Order.StatusChoices.ACTIVE, 2, Decimal("20")),
+                (DAY + timedelta(days=1), Order.StatusChoices.ACTIVE, 1, Decimal("10")),
+            },
+        )
+        self.assertEqual(OrderDailyStat.objects.get(date=DAY).business, self.business)
+
+    def test_status_transition(self):
+        """Status transition moves order to the row of the new status."""
+        order = self.order(10)
+        self.order(11)
+
+        order.mark_as_completed()
+
+        self.assertEqual(
+            self.rollups(),
+            {
+                (DAY, Order.StatusChoices.ACTIVE, 1, Decimal("10")),
+                (DAY, Order.StatusChoices.COMPLETED, 1, Decimal("10")),
+            },
+        )
+
+    def test_bulk_cancellation(self):
+        """Cancellation of several orders one by one is counted."""
+        for hour in (10, 11, 12):
+            self.order(hour)
+
+        for order in Order.objects.filter(specialist=self.specialist):
+            order.mark_as_cancelled()
+
+        self.assertEqual(
+            self.rollups(), {(DAY, Order.StatusChoices.CANCELLED, 3, Decimal("30"))},
+        )
+
+    def test_deleted_order(self):
+        """Deleted order is removed from its row."""
+        order = self.order(10)
+        self.order(11)
+
+        order.delete()
+
+        self.assertEqual(
+            self.rollups(), {(DAY, Order.StatusChoices.ACTIVE, 1, Decimal("10"))},
+        )
+
+    def test_deferred_order(self):
+        """Order loaded with deferred fields is moved correctly."""
+        order = Order.objects.only("id", "status").get(id=self.order(10).id)
+
+        order.mark_as_approved()
+
+        self.assertEqual(
+            self.rollups(), {(DAY, Order.StatusChoices.APPROVED, 1, Decimal("10"))},
+        )
+
+    def test_service_price_change(self):
+        """Price change of the service recalculates revenue."""
+        self.order(10)
+        self.order(11)
+
+        self.service.price = Decimal("15")
+        self.service.save()
+
+        self.assertEqual(
+            self.rollups(), {(DAY, Order.StatusChoices.ACTIVE, 2, Decimal("30"))},
+        )
+
+    def test_rebuild_command(self):
+        """Rebuild command restores rollups changed bypassing signals."""
+        self.order(10)
+        order = self.order(11)
+
+        Order.objects.filter(id=order.id).update(status=Order.StatusChoices.DECLINED)
+        OrderDailyStat.objects.update(orders_count=100)
+        call_command("rebuild_rollups", stdout=StringIO())
+
+        expected = {
+            (DAY, Order.StatusChoices.ACTIVE, 1, Decimal("10")),
+            (DAY, Order.StatusChoices.DECLINED, 1, Decimal("10")),
+        }
+        self.assertEqual(self.rollups(), expected)
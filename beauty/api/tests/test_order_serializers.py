@@ -23,8 +23,6 @@ from api.serializers.order_serializers import OrderSerializer
 from api.tests.factories import (GroupFactory, CustomUserFactory, ServiceFactory, PositionFactory)
 from rest_framework.test import APIRequestFactory
 
-from api.views.schedule import get_working_day
-from beauty.utils import string_to_time
 
 CET = pytz.timezone("Europe/Kiev")
 
@@ -53,9 +51,8 @@ class TestOrderSerializer(TestCase):
         self.request = self.factory.get("/")
         self.request.user = self.customer
         working_day = timezone.now() + timedelta(days=1)
-        working_hours = get_working_day(self.position, working_day)
-        self.start_time = timezone.datetime.combine(working_day.date(),
-                                                    string_to_time(working_hours[0]))
+        working_hours = self.position.weekly_hours.day_times(working_day.weekday())
+        self.start_time = timezone.datetime.combine(working_day.date(), working_hours[0])
 
     def test_valid_serializer(self):
         """Check serializer with valid data."""
@@ -68,8 +68,6 @@ from .factories import (GroupFactory,
                         ServiceFactory,
                         OrderFactory)
 from api.models import Order
-from beauty.utils import string_to_time
-from api.views.schedule import get_working_day
 
 
 class TestOrderCreateView(TestCase):
@@ -96,9 +94,8 @@ class TestOrderCreateView(TestCase):
         self.client = APIClient()
         self.client.force_authenticate(user=self.customer)
         working_day = timezone.now() + timedelta(days=1)
-        working_hours = get_working_day(self.position, working_day)
-        self.start_time = timezone.datetime.combine(working_day.date(),
-                                                    string_to_time(working_hours[0]))
+        working_hours = self.position.weekly_hours.day_times(working_day.weekday())
+        self.start_time = timezone.datetime.combine(working_day.date(), working_hours[0])
 
         self.data = [{"start_time": self.start_time,
                       "specialist": self.specialist.id,
@@ -0,0 +1,187 @@
+"""This module is for testing export of business orders.
+
+Tests for BusinessOrdersExportView:
+- Set up all required objects for the tests;
+- Test if orders of the business are streamed as CSV;
+- Test if orders are streamed as NDJSON;
+- Test if formula values are escaped only in CSV;
+- Test if orders are filtered by dates and statuses;
+- Test if only business owner can export orders;
+- Test if endpoint returns 400 response for invalid parameters;
+- Test if orders are read with a constant amount of queries.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.models import Order
+from api.tests.factories import (BusinessFactory, CustomUserFactory, GroupFactory,
+                                 OrderFactory, PositionFactory, ServiceFactory)
+
+
+DAY = date(2030, 7, 1)
+
+
+class TestBusinessOrdersExport(TestCase):
+    """TestCase for BusinessOrdersExportView."""
+
+    def setUp(self) -> None:
+        """Set up business of the owner with one specialist."""
+        self.groups = GroupFactory.groups_for_test()
+        self.owner = CustomUserFactory.create()
+        self.groups.owner.user_set.add(self.owner)
+
+        self.business = BusinessFactory.create(owner=self.owner)
+        self.position = PositionFactory.create(business=self.business)
+        self.service = ServiceFactory.create(position=self.position, price=Decimal("10"))
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse(
+            "api:business-orders-export", kwargs={"business_id": self.business.id},
+        )
+
+    def order(self, day, hour, order_status=Order.StatusChoices.ACTIVE):
+        """Create order of the specialist."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(datetime.combine(day, time(hour))),
+            specialist=self.specialist,
+            service=self.service,
+            status=order_status,
+        )
+
+    def export(self, **params):
+        """Return response of the view and its content as text."""
+        response = self.client.get(self.url, params)
+        content = (
+            b"".join(response.streaming_content).decode()
+            if response.status_code == 200 else None
+        )
+
+        return response, content
+
+    def test_csv(self):
+        """Test if orders of the business are streamed as CSV."""
+        order = self.order(DAY, 10)
+        other_position = PositionFactory.create()
+        OrderFactory.create(service=ServiceFactory.create(position=other_position))
+
+        response, content = self.export()
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id"], str(order.id))
+        self.assertEqual(rows[0]["start_time"], "2030-07-01T10:00:00+03:00")
+        self.assertEqual(rows[0]["status"], "active")
+        self.assertEqual(rows[0]["service"], self.service.name)
+        self.assertEqual(rows[0]["price"], "10.00")
+        self.assertEqual(rows[0]["specialist_email"], self.specialist.email)
+        self.assertEqual(rows[0]["customer_email"], order.customer.email)
+
+    def test_ndjson(self):
+        """Test if orders are streamed as NDJSON."""
+        first = self.order(DAY, 11)
+        second = self.order(DAY, 10)
+
+        response, content = self.export(file_format="ndjson")
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([row["id"] for row in rows], [second.id, first.id])
+        self.assertEqual(rows[0]["price"], "10.00")
+
+    def test_formula_values(self):
+        """Test if formula values are escaped only in CSV."""
+        order = self.order(DAY, 10)
+        order.customer.first_name = "=HYPERLINK(1)"
+        order.customer.last_name = "-1+1"
+        order.customer.save()
+        self.specialist.first_name = "\t=1+1"
+        self.specialist.last_name = "\r=1+1"
+        self.specialist.save()
+
+        _, csv_content = self.export()
+        _, ndjson_content = self.export(file_format="ndjson")
+        csv_row = next(csv.DictReader(io.StringIO(csv_content)))
+        ndjson_row = json.loads(ndjson_content)
+
+        self.assertEqual(csv_row["customer_first_name"], "'=HYPERLINK(1)")
+        self.assertEqual(csv_row["customer_last_name"], "'-1+1")
+        self.assertEqual(csv_row["specialist_first_name"], "'\t=1+1")
+        self.assertEqual(csv_row["specialist_last_name"], "'\r=1+1")
+        self.assertEqual(csv_row["specialist_email"], self.specialist.email)
+        self.assertEqual(ndjson_row["customer_first_name"], "=HYPERLINK(1)")
+        self.assertEqual(ndjson_row["customer_last_name"], "-1+1")
+
+    def test_filters(self):
+        """Test if orders are filtered by dates and statuses."""
+        self.order(date(2030, 6, 30), 23)
+        completed = self.order(DAY, 10, Order.StatusChoices.COMPLETED)
+        cancelled = self.order(date(2030, 7, 2), 10, Order.StatusChoices.CANCELLED)
+        self.order(date(2030, 7, 2), 12)
+        self.order(date(2030, 7, 3), 0, Order.StatusChoices.COMPLETED)
+
+        period = {"from": "2030-07-01", "to": "2030-07-02"}
+        _, content = self.export(**period, status=["completed", "cancelled"])
+        _, completed_content = self.export(**period, status="completed")
+
+        self.assertEqual(
+            [int(row["id"]) for row in csv.DictReader(io.StringIO(content))],
+            [completed.id, cancelled.id],
+        )
+        self.assertEqual(
+            [int(row["id"]) for row in csv.DictReader(io.StringIO(completed_content))],
+            [completed.id],
+        )
+
+    def test_not_owner(self):
+        """Test if only business owner can export orders."""
+        other_owner = CustomUserFactory.create()
+        self.groups.owner.user_set.add(other_owner)
+        self.client.force_authenticate(user=other_owner)
+
+        self.assertEqual(self.export()[0].status_code, 403)
+
+    def test_invalid_parameters(self):
+        """Test if endpoint returns 400 response for invalid parameters."""
+        for params in (
+            {"file_format": "xlsx"},
+            {"from": "yesterday"},
+            {"from": "2030-07-02", "to": "2030-07-01"},
+            {"status": "lost"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.export(**params)[0].status_code, 400)
+
+    def test_queries_count(self):
+        """Test if orders are read with a constant amount of queries."""
+        self.order(DAY, 10)
+
+        with CaptureQueriesContext(connection) as few_orders:
+            self.export()
+
+        for hour in range(11, 20):
+            self.order(DAY, hour)
+
+        # Roles cached by the first request are loaded again by a new request
+        self.owner.forget_roles()
+        with CaptureQueriesContext(connection) as many_orders:
+            _, content = self.export()
+
+        self.assertEqual(len(content.splitlines()), 11)
+        self.assertEqual(len(few_orders), len(many_orders))
@@ -0,0 +1,139 @@
+"""This module is for testing schedule of all specialists of a business.
+
+Tests for OwnerBusinessScheduleView:
+- Set up all required objects for the tests;
+- Test if timelines of all positions and specialists are returned;
+- Test if orders of other positions take time of the specialist;
+- Test if only business owner can get the schedule;
+- Test if amount of queries doesn't depend on amount of positions and specialists.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.reverse import reverse as drf_reverse
+from rest_framework.test import APIClient
+
+from api.tests.factories import (BusinessFactory, CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from beauty.utils import generate_working_time
+
+
+MONDAY = date(2030, 7, 1)
+
+
+class TestOwnerBusinessSchedule(TestCase):
+    """TestCase for OwnerBusinessScheduleView."""
+
+    def setUp(self) -> None:
+        """Set up business with two positions."""
+        self.owner = CustomUserFactory.create()
+        self.business = BusinessFactory.create(owner=self.owner)
+        self.specialist = CustomUserFactory.create()
+
+        self.first_position = self.create_position([self.specialist])
+        self.second_position = self.create_position([self.specialist])
+        self.first_service = self.first_position.service_set.get()
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse(
+            "api:owner-business-schedule",
+            kwargs={"business_id": self.business.id, "order_date": MONDAY},
+        )
+
+    def create_position(self, specialists):
+        """Create position working from 10 to 12 with one service."""
+        position = PositionFactory.create(
+            business=self.business,
+            working_time=generate_working_time("10:00", "12:00"),
+        )
+        position.specialist.add(*specialists)
+        ServiceFactory.create(position=position, duration=timedelta(minutes=30))
+
+        return position
+
+    def order(self, specialist, service, hour):
+        """Create order of the specialist on MONDAY."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(datetime.combine(MONDAY, time(hour))),
+            specialist=specialist,
+            service=service,
+        )
+
+    def test_get_schedule(self):
+        """Test if timelines of all positions and specialists are returned."""
+        order = self.order(self.specialist, self.first_service, 10)
+
+        response = self.client.get(self.url)
+        first = next(
+            position for position in response.data
+            if position["id"] == self.first_position.id
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(
+            first["services"],
+            [{"id": self.first_service.id, "name": self.first_service.name,
+              "duration": timedelta(minutes=30)}],
+        )
+        self.assertEqual(first["specialists"][0]["id"], self.specialist.id)
+        self.assertEqual(
+            first["specialists"][0]["schedule"],
+            [
+                {"order": drf_reverse(
+                    "api:order-detail", kwargs={"pk": order.pk},
+                    request=response.wsgi_request,
+                )},
+                {"free": [time(10, 30), time(12)]},
+            ],
+        )
+
+    def test_other_position_orders(self):
+        """Test if orders of other positions take time of the specialist."""
+        order = self.order(self.specialist, self.first_service, 10)
+
+        response = self.client.get(self.url)
+        second = next(
+            position for position in response.data
+            if position["id"] == self.second_position.id
+        )
+
+        self.assertEqual(
+            second["specialists"][0]["schedule"],
+            [
+                {"order": drf_reverse(
+                    "api:order-detail", kwargs={"pk": order.pk},
+                    request=response.wsgi_request,
+                )},
+                {"free": [time(10, 30), time(12)]},
+            ],
+        )
+
+    def test_not_owner(self):
+        """Test if only business owner can get the schedule."""
+        self.client.force_authenticate(user=self.specialist)
+
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+
+    def test_queries_count(self):
+        """Test if amount of queries doesn't depend on amount of positions and specialists."""
+        with CaptureQueriesContext(connection) as small_business:
+            self.client.get(self.url)
+
+        for _ in range(3):
+            specialists = CustomUserFactory.create_batch(3)
+            position = self.create_position(specialists)
+            for specialist in specialists:
+                self.order(specialist, position.service_set.get(), 11)
+
+        with CaptureQueriesContext(connection) as big_business:
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len(small_business), len(big_business))
@@ -0,0 +1,164 @@
+"""This module is for testing statistic of all businesses for admins.
+
+Tests for PlatformStatisticView:
+- Set up all required objects for the tests;
+- Totals and rankings are merged from all businesses;
+- Businesses without rollups are aggregated from orders;
+- Durations of stages are returned;
+- Only admins can get the statistic;
+- Invalid parameters;
+- Amount of queries doesn't depend on amount of businesses;
+- Partitions are computed in a process pool.
+"""
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.test import (TestCase, TransactionTestCase, override_settings,
+                         skipUnlessDBFeature)
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.models import Order, OrderDailyStat
+from api.platform_statistic import get_platform_statistic
+from api.tests.factories import (BusinessFactory, CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+
+
+DAY = date(2030, 7, 1)
+
+
+class PlatformSetUpMixin:
+    """Mixin with businesses and orders required for the tests."""
+
+    def create_business(self, price, statuses):
+        """Create business with a service and orders of the statuses on DAY."""
+        business = BusinessFactory.create()
+        position = PositionFactory.create(business=business)
+        service = ServiceFactory.create(position=position, price=Decimal(price))
+
+        for hour, order_status in enumerate(statuses, 10):
+            OrderFactory.create(
+                start_time=timezone.make_aware(datetime.combine(DAY, time(hour))),
+                service=service,
+                status=order_status,
+            )
+
+        return business
+
+
+@override_settings(PLATFORM_STATISTIC_WORKERS=1)
+class TestPlatformStatistic(PlatformSetUpMixin, TestCase):
+    """TestCase for PlatformStatisticView."""
+
+    def setUp(self) -> None:
+        """Set up three businesses and admin."""
+        completed = Order.StatusChoices.COMPLETED
+        active = Order.StatusChoices.ACTIVE
+
+        self.small = self.create_business("100", [completed])
+        self.middle = self.create_business("10", [completed, active])
+        self.big = self.create_business("1", [active, active, active])
+
+        self.admin = CustomUserFactory.create(is_admin=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse("api:platform-statistic")
+
+    def get_statistic(self, **params):
+        """Return response of the view for the week of DAY."""
+        return self.client.get(
+            self.url, {"from": DAY.isoformat(), "to": DAY + timedelta(days=6), **params},
+        )
+
+    def test_totals_and_rankings(self):
+        """Totals and rankings are merged from all businesses."""
+        response = self.get_statistic(top=2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["totals"],
+            {
+                "orders_count": 6,
+                "revenue": Decimal("123"),
+                "profit": Decimal("110"),
+                "statuses": {
+                    "active": 4, "completed": 2, "cancelled": 0, "approved": 0, "declined": 0,
+                },
+            },
+        )
+        self.assertEqual(response.data["businesses_count"], 3)
+        self.assertEqual(
+            [business["id"] for business in response.data["top_by_orders"]],
+            [self.big.id, self.middle.id],
+        )
+        self.assertEqual(
+            [business["id"] for business in response.data["top_by_revenue"]],
+            [self.small.id, self.middle.id],
+        )
+        self.assertEqual(response.data["top_by_revenue"][0]["name"], self.small.name)
+        self.assertEqual(response.data["computed_from_orders"], 0)
+
+    def test_missing_rollups(self):
+        """Businesses without rollups are aggregated from orders."""
+        expected = self.get_statistic().data
+
+        OrderDailyStat.objects.filter(business=self.middle).delete()
+        response = self.get_statistic()
+
+        self.assertEqual(response.data["computed_from_orders"], 1)
+        for field in ("totals", "businesses_count", "top_by_orders", "top_by_revenue"):
+            self.assertEqual(response.data[field], expected[field])
+
+    def test_timings(self):
+        """Durations of stages are returned."""
+        response = self.get_statistic()
+        stages = ["rollups", "missing", "partitions", "merge"]
+
+        self.assertEqual(list(response.data["timings"]), stages)
+        for stage in stages:
+            self.assertIn(f"{stage};dur=", response["Server-Timing"])
+
+    def test_only_admin(self):
+        """Only admins can get the statistic."""
+        self.client.force_authenticate(user=self.small.owner)
+
+        self.assertEqual(self.get_statistic().status_code, 403)
+
+    def test_invalid_parameters(self):
+        """Invalid parameters."""
+        for params in ({"top": 0}, {"top": "all"}, {"top": 51}, {"from": "today"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.get_statistic(**params).status_code, 400)
+
+    def test_queries_count(self):
+        """Amount of queries doesn't depend on amount of businesses."""
+        with self.assertNumQueries(3):
+            get_platform_statistic(DAY, DAY)
+
+        for price in range(1, 10):
+            self.create_business(price, [Order.StatusChoices.COMPLETED])
+
+        with self.assertNumQueries(3):
+            statistic, _ = get_platform_statistic(DAY, DAY)
+
+        self.assertEqual(statistic["businesses_count"], 12)
+
+
+@skipUnlessDBFeature("test_db_allows_multiple_connections")
+@override_settings(PLATFORM_STATISTIC_WORKERS=2)
+class TestPlatformStatisticPool(PlatformSetUpMixin, TransactionTestCase):
+    """TestCase for computing partitions in a process pool."""
+
+    def test_process_pool(self):
+        """Partitions are computed in a process pool."""
+        for price in ("1", "2", "3"):
+            self.create_business(price, [Order.StatusChoices.COMPLETED])
+        OrderDailyStat.objects.all().delete()
+
+        statistic, _ = get_platform_statistic(DAY, DAY)
+
+        self.assertEqual(statistic["computed_from_orders"], 3)
+        self.assertEqual(statistic["totals"]["orders_count"], 3)
+        self.assertEqual(statistic["totals"]["revenue"], Decimal("6"))
@@ -0,0 +1,426 @@
+"""This module is for testing budgets of queries of every endpoint.
+
+Every GET endpoint of api/urls.py and beauty/urls.py declares the maximal
+amount of queries it may run as `query_budget` attribute of its view. The
+endpoints are requested with a small fixture, with a scaled fixture and with
+a bigger page, amount of queries must fit the budget and must not grow. A
+report of the endpoints running most queries is printed.
+
+Tests for query budgets:
+- Set up objects of the small fixture;
+- Every GET endpoint declares its query budget;
+- Amount of queries fits the budget and doesn't grow with fixture or page size.
+"""
+
+import shutil
+import tempfile
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from djoser.utils import encode_uid
+from rest_framework.test import APIClient
+
+from api.models import Invitation, ReportJob
+from api.tasks import generate_report
+from api.tests.factories import (BusinessFactory, CustomUserFactory, LocationFactory,
+                                 OrderFactory, PositionFactory, ReviewFactory, ServiceFactory)
+
+
+FixtureSize = namedtuple("FixtureSize", ["businesses", "specialists", "orders"])
+
+# Sizes are kept small to run with the rest of the tests, raise SCALED_FIXTURE
+# (e.g. to 50 businesses, 500 specialists and 50000 orders) to profile locally
+SMALL_FIXTURE = FixtureSize(businesses=2, specialists=2, orders=10)
+SCALED_FIXTURE = FixtureSize(businesses=10, specialists=20, orders=200)
+
+SMALL_PAGE = 5
+BIG_PAGE = 50
+
+# Modules of the views which belong to the project, other routes are third party
+PROJECT_MODULES = ("api.", "beauty.", "social_login.")
+
+TOP_OFFENDERS = 10
+
+WORKING_TIME = {
+    **{day: ["08:00", "18:00"] for day in ("Mon", "Tue", "Wed", "Thu", "Fri")},
+    "Sat": [],
+    "Sun": [],
+}
+
+RouteRequest = namedtuple("RouteRequest", ["user", "kwargs", "params", "status_code"])
+Measurement = namedtuple("Measurement", ["route", "budget", "small", "scaled", "big_page"])
+
+
+def iter_routes(patterns=None, namespace=None, prefix=""):
+    """Yield name, pattern and callback of every route of the project.
+
+    Routes with format suffix duplicate routes without it, so they are skipped.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_routes(
+                pattern.url_patterns,
+                pattern.namespace or namespace,
+                prefix + str(pattern.pattern),
+            )
+        elif isinstance(pattern, URLPattern) and "format" not in pattern.pattern.regex.groupindex:
+            route = prefix + str(pattern.pattern)
+            name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+            yield name or f"/{route}", route, pattern.callback
+
+
+def get_view_class(callback):
+    """Return class of the view or None for function views."""
+    return getattr(callback, "view_class", None) or getattr(callback, "cls", None)
+
+
+def is_project_get_route(callback):
+    """Return whether the route is handled by a project view with GET method."""
+    if not callback.__module__.startswith(PROJECT_MODULES):
+        return False
+
+    actions = getattr(callback, "actions", None)
+    if actions:
+        return "get" in actions
+
+    view_class = get_view_class(callback)
+    return view_class is not None and hasattr(view_class, "get")
+
+
+def get_query_budget(callback):
+    """Return query budget declared next to the view of the route."""
+    return getattr(
+        get_view_class(callback), "query_budget", getattr(callback, "query_budget", None),
+    )
+
+
+def get_schedule_day():
+    """Return monday of the week after the next one."""
+    today = timezone.localdate()
+    return today + timedelta(days=14 - today.weekday())
+
+
+class TestQueryBudgets(TestCase):
+    """TestCase for query budgets of all endpoints."""
+
+    def setUp(self) -> None:
+        """Set up objects of the small fixture."""
+        self.media_root = tempfile.mkdtemp()
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        groups = {
+            name: Group.objects.get_or_create(name=name)[0]
+            for name in ("Admin", "Customer", "Owner", "Specialist")
+        }
+        self.specialist_group = groups["Specialist"]
+        self.customer_group = groups["Customer"]
+
+        self.day = get_schedule_day()
+        self.admin = CustomUserFactory.create(is_admin=True, password=None)
+        self.owner = CustomUserFactory.create(groups=[groups["Owner"]], password=None)
+        self.customer = CustomUserFactory.create(groups=[self.customer_group], password=None)
+
+        self.business = BusinessFactory.create(owner=self.owner, working_time=WORKING_TIME)
+        self.position = PositionFactory.create(business=self.business, working_time=WORKING_TIME)
+        self.service = ServiceFactory.create(position=self.position, duration=timedelta(hours=1))
+        self.specialist = self.create_specialist()
+        self.order = self.create_order(self.specialist, 0)
+        self.review = ReviewFactory.create(from_user=self.customer, to_user=self.specialist)
+        self.invitation = Invitation.objects.create(
+            email=self.specialist.email, position=self.position,
+        )
+
+        self.report_job, _ = ReportJob.objects.get_or_create_job(
+            self.owner, ReportJob.KindChoices.ORDERS, self.business, {},
+        )
+        generate_report.apply(args=[self.report_job.id])
+
+        self.businesses = 1
+        self.specialists = 1
+        self.orders = 1
+        self.grow_fixture(SMALL_FIXTURE)
+
+    def create_specialist(self):
+        """Create specialist of the position."""
+        specialist = CustomUserFactory.create(groups=[self.specialist_group], password=None)
+        self.position.specialist.add(specialist)
+        return specialist
+
+    def create_order(self, specialist, number):
+        """Create order of the customer, orders of a specialist are in different days."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(
+                datetime.combine(self.day + timedelta(days=number), time(12)),
+            ),
+            specialist=specialist,
+            customer=self.customer,
+            service=self.service,
+        )
+
+    def grow_fixture(self, size):
+        """Add businesses, specialists and orders up to the size of the fixture.
+
+        New businesses belong to the same owner and are located near the
+        business, new specialists hold the position, new orders are made by
+        the customer and are spread between the specialists.
+        """
+        location = self.business.location
+
+        for _ in range(self.businesses, size.businesses):
+            BusinessFactory.create(
+                owner=self.owner,
+                location=LocationFactory.create(
+                    latitude=location.latitude, longitude=location.longitude,
+                ),
+            )
+            ServiceFactory.create(position=self.position)
+
+        specialists = [self.specialist]
+        for _ in range(self.specialists, size.specialists):
+            specialist = self.create_specialist()
+            specialists.append(specialist)
+            ReviewFactory.create(from_user=self.customer, to_user=self.specialist)
+
+        for number in range(self.orders, size.orders):
+            self.create_order(specialists[number % len(specialists)], number // len(specialists))
+            if number % 10 == 0:
+                ReportJob.objects.create(
+                    requested_by=self.owner,
+                    kind=ReportJob.KindChoices.ORDERS,
+                    business=self.business,
+                    params={"number": number},
+                    status=ReportJob.StatusChoices.DONE,
+                )
+
+        self.businesses, self.specialists, self.orders = size
+
+    def get_route_requests(self):
+        """Return requests of every GET endpoint with objects of the fixture."""
+        location = self.business.location
+        position_kwargs = {
+            "position_id": self.position.id,
+            "specialist_id": self.specialist.id,
+            "service_id": self.service.id,
+        }
+        day = self.day.isoformat()
+        day_start = timezone.make_aware(datetime.combine(self.day, time.min))
+
+        return {
+            "/": RouteRequest(None, {}, {}, 200),
+            "user-activation": RouteRequest(
+                None, {"uidb64": encode_uid(self.customer.id), "token": "token"}, {}, 302,
+            ),
+            "api:user-list-create": RouteRequest(self.admin, {}, {}, 200),
+            "api:user-detail": RouteRequest(self.customer, {"pk": self.customer.id}, {}, 200),
+            "api:specialist-detail": RouteRequest(
+                self.customer, {"pk": self.specialist.id}, {}, 200,
+            ),
+            "api:user-order-detail": RouteRequest(
+                self.customer, {"user": self.customer.id, "pk": self.order.id}, {}, 200,
+            ),
+            "api:customer-orders-list": RouteRequest(
+                self.customer, {"pk": self.customer.id}, {}, 200,
+            ),
+            "api:specialist-orders-list": RouteRequest(
+                self.specialist, {"pk": self.specialist.id}, {}, 200,
+            ),
+            "api:order-detail": RouteRequest(self.customer, {"pk": self.order.id}, {}, 200),
+            "api:order-approving": RouteRequest(
+                None,
+                {
+                    "uid": encode_uid(self.order.id),
+                    "token": "token",
+                    "status": urlsafe_base64_encode(force_bytes("approved")),
+                },
+                {},
+                302,
+            ),
+            "api:businesses-list-create": RouteRequest(self.owner, {}, {}, 200),
+            "api:businesses-list-active": RouteRequest(None, {}, {}, 200),
+            "api:businesses-list-nearest": RouteRequest(
+                None,
+                {
+                    "lat": round(location.latitude, 4),
+                    "lon": round(location.longitude, 4),
+                    "delta": 0.1,
+                },
+                {},
+                200,
+            ),
+            "api:business-detail": RouteRequest(self.owner, {"pk": self.business.id}, {}, 200),
+            "api:location-detail": RouteRequest(self.owner, {"pk": location.id}, {}, 200),
+            "api:position-list": RouteRequest(self.owner, {}, {}, 200),
+            "api:position-detail-list": RouteRequest(
+                self.owner, {"pk": self.position.id}, {}, 200,
+            ),
+            "api:position-approve": RouteRequest(
+                self.specialist,
+                {
+                    "email": urlsafe_base64_encode(force_bytes(self.specialist.email)),
+                    "position": encode_uid(self.position.id),
+                    "token": "token",
+                    "answer": urlsafe_base64_encode(force_bytes("decline")),
+                },
+                {},
+                400,
+            ),
+            "api:review-get": RouteRequest(None, {"to_user": self.specialist.id}, {}, 200),
+            "api:review-detail": RouteRequest(self.customer, {"pk": self.review.id}, {}, 200),
+            "api:service-list-create": RouteRequest(None, {}, {}, 200),
+            "api:service-detail": RouteRequest(self.owner, {"pk": self.service.id}, {}, 200),
+            "api:specialist-schedule": RouteRequest(
+                self.customer, {**position_kwargs, "order_date": day}, {}, 200,
+            ),
+            "api:specialist-schedule-range": RouteRequest(
+                self.customer,
+                position_kwargs,
+                {"from": day, "to": (self.day + timedelta(days=6)).isoformat()},
+                200,
+            ),
+            "api:specialist-next-available": RouteRequest(
+                self.customer, position_kwargs, {}, 200,
+            ),
+            "api:service-free-specialists": RouteRequest(
+                self.customer,
+                {"service_id": self.service.id},
+                {
+                    "start": day_start.isoformat(),
+                    "end": (day_start + timedelta(days=1)).isoformat(),
+                },
+                200,
+            ),
+            "api:business-heatmap": RouteRequest(
+                self.owner, {"business_id": self.business.id}, {"week": day}, 200,
+            ),
+            "api:owner-business-schedule": RouteRequest(
+                self.owner, {"business_id": self.business.id, "order_date": day}, {}, 200,
+            ),
+            "api:owner-specialist-schedule": RouteRequest(
+                self.owner,
+                {
+                    "position_id": self.position.id,
+                    "specialist_id": self.specialist.id,
+                    "order_date": day,
+                },
+                {},
+                200,
+            ),
+            "api:service-by-business": RouteRequest(None, {"pk": self.business.id}, {}, 200),
+            "api:service-by-specialist": RouteRequest(
+                None, {"pk": self.specialist.id}, {}, 200,
+            ),
+            "api:platform-statistic": RouteRequest(self.admin, {}, {}, 200),
+            "api:statistic-of-business": RouteRequest(
+                self.owner,
+                {"business_id": self.business.id},
+                {"timeInterval": "currentMonth"},
+                200,
+            ),
+            "api:business-orders-export": RouteRequest(
+                self.owner, {"business_id": self.business.id}, {}, 200,
+            ),
+            "api:report-job-list-create": RouteRequest(self.owner, {}, {}, 200),
+            "api:report-job-detail": RouteRequest(
+                self.owner, {"pk": self.report_job.id}, {}, 200,
+            ),
+            "api:report-job-download": RouteRequest(
+                self.owner, {"pk": self.report_job.id}, {}, 200,
+            ),
+            "customuser-list": RouteRequest(self.admin, {}, {}, 200),
+            "customuser-me": RouteRequest(self.customer, {}, {}, 200),
+            "customuser-detail": RouteRequest(self.customer, {"id": self.customer.id}, {}, 200),
+        }
+
+    def count_queries(self, route, request, page_size):
+        """Return amount of queries of the request to the endpoint."""
+        client = APIClient()
+        if request.user:
+            # Roles are cached on the user, a new request loads them again
+            request.user.forget_roles()
+            client.force_authenticate(user=request.user)
+            # Views with TokenLoginRequiredMixin accept requests with JWT header
+            client.credentials(HTTP_AUTHORIZATION="JWT token")
+        url = route if route.startswith("/") else reverse(route, kwargs=request.kwargs)
+
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, {"limit": page_size, **request.params})
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        self.assertEqual(
+            response.status_code,
+            request.status_code,
+            msg=f"{route}: {getattr(response, 'data', response)}",
+        )
+
+        return len(context)
+
+    def print_report(self, measurements):
+        """Print endpoints running most queries."""
+        offenders = sorted(
+            measurements,
+            key=lambda measurement: max(
+                measurement.small, measurement.scaled, measurement.big_page,
+            ),
+            reverse=True,
+        )[:TOP_OFFENDERS]
+
+        lines = [f"{'Endpoint':<40}{'Budget':>8}{'Small':>8}{'Scaled':>8}{'Big page':>10}"]
+        lines.extend(
+            f"{measurement.route:<40}{measurement.budget:>8}{measurement.small:>8}"
+            f"{measurement.scaled:>8}{measurement.big_page:>10}"
+            for measurement in offenders
+        )
+        print("\nTop endpoints by amount of queries:", *lines, sep="\n")
+
+    def test_query_budgets(self):
+        """Amount of queries fits the budget and doesn't grow with fixture or page size."""
+        routes = {
+            name: get_query_budget(callback)
+            for name, _, callback in iter_routes()
+            if is_project_get_route(callback)
+        }
+        requests = self.get_route_requests()
+
+        self.assertEqual(
+            [name for name, budget in routes.items() if budget is None], [],
+            msg="Endpoints without query budget",
+        )
+        self.assertEqual(sorted(routes), sorted(requests), msg="Endpoints without requests")
+
+        small = {
+            route: self.count_queries(route, requests[route], SMALL_PAGE) for route in routes
+        }
+        self.grow_fixture(SCALED_FIXTURE)
+        scaled = {
+            route: self.count_queries(route, requests[route], SMALL_PAGE) for route in routes
+        }
+        big_page = {
+            route: self.count_queries(route, requests[route], BIG_PAGE) for route in routes
+        }
+
+        measurements = [
+            Measurement(route, budget, small[route], scaled[route], big_page[route])
+            for route, budget in routes.items()
+        ]
+        self.print_report(measurements)
+
+        for measurement in measurements:
+            with self.subTest(route=measurement.route):
+                self.assertLessEqual(measurement.small, measurement.budget)
+                self.assertLessEqual(measurement.scaled, measurement.small)
+                self.assertLessEqual(measurement.big_page, measurement.small)
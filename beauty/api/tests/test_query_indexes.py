@@ -0,0 +1,99 @@
+"""This module is for testing that hot queries use indexes.
+
+Tests for query plans:
+- Set up all required objects for the tests;
+- Schedule orders of a specialist use specialist, status and start time index;
+- Active orders of a service use the partial service index;
+- Orders of a customer ordered by start time use customer index;
+- Reviews of a specialist use to_user and publication date index;
+- Nearest active businesses use coordinates index;
+- Active businesses ordered by type use the partial business index.
+"""
+
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+
+from api.models import Business, Order, Review
+from api.tests.factories import (CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from api.views.schedule import get_orders_for_date_range
+
+
+class TestQueryIndexes(TestCase):
+    """TestCase for plans of the hottest queries."""
+
+    def setUp(self) -> None:
+        """Set up specialist with an order."""
+        self.position = PositionFactory.create()
+        self.service = ServiceFactory.create(position=self.position)
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+        self.order = OrderFactory.create(specialist=self.specialist, service=self.service)
+
+    def assertUsesIndex(self, queryset, index_name):
+        """Assert that plan of the queryset uses the index.
+
+        Sequential scans are disabled on PostgreSQL, so small test tables
+        don't hide a missing index.
+        """
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, msg=plan)
+
+    def test_specialist_schedule_orders(self):
+        """Schedule orders of a specialist use specialist, status and start time index."""
+        day = date(2030, 7, 1)
+
+        self.assertUsesIndex(
+            get_orders_for_date_range(self.specialist, day, day),
+            "order_specialist_status_idx",
+        )
+        self.assertUsesIndex(
+            get_orders_for_date_range(self.specialist, day, day + timedelta(days=6)),
+            "order_specialist_status_idx",
+        )
+
+    def test_service_active_orders(self):
+        """Active orders of a service use the partial service index."""
+        self.assertUsesIndex(
+            Order.objects.filter(service=self.service.id, status=0),
+            "order_service_active_idx",
+        )
+
+    def test_customer_orders(self):
+        """Orders of a customer ordered by start time use customer index."""
+        self.assertUsesIndex(
+            self.order.customer.customer_orders.order_by("start_time"),
+            "order_customer_start_idx",
+        )
+
+    def test_specialist_reviews(self):
+        """Reviews of a specialist use to_user and publication date index."""
+        self.assertUsesIndex(
+            Review.objects.filter(to_user=self.specialist).order_by("-date_of_publication"),
+            "review_to_user_published_idx",
+        )
+
+    def test_nearest_businesses(self):
+        """Nearest active businesses use coordinates index."""
+        self.assertUsesIndex(
+            Business.objects.filter(
+                is_active=True,
+                location__latitude__gt=49.8,
+                location__latitude__lt=49.9,
+                location__longitude__gt=24.0,
+                location__longitude__lt=24.1,
+            ),
+            "location_coordinates_idx",
+        )
+
+    def test_active_businesses(self):
+        """Active businesses ordered by type use the partial business index."""
+        self.assertUsesIndex(
+            Business.objects.filter(is_active=True), "business_active_type_idx",
+        )
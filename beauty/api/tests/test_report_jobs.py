@@ -0,0 +1,258 @@
+"""This module is for testing asynchronous generation of reports.
+
+Tests for report jobs:
+- Set up all required objects for the tests;
+- Test if requested report job is created and its task is started;
+- Test if identical in-flight job is returned instead of a new one;
+- Test if stale in-flight job is failed and doesn't block a new one;
+- Test if job which waited in the queue is not stale while running;
+- Test if job failed as stale is not finished by its task;
+- Test if reports are available only for owners and admins;
+- Test if orders report is generated and downloaded;
+- Test if progress is saved after every chunk;
+- Test if specialists report contains monthly statistic;
+- Test if formula values are escaped in reports;
+- Test if failed job saves its error;
+- Test if report can't be downloaded before it is done.
+"""
+
+import csv
+import gzip
+import io
+import shutil
+import tempfile
+from datetime import datetime, time, date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api.models import Order, ReportJob
+from api.tasks import generate_report
+from api.tests.factories import (BusinessFactory, CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+
+
+DAY = date(2030, 7, 1)
+
+
+@patch("api.views.report_views.generate_report.delay")
+class TestReportJobs(TestCase):
+    """TestCase for report jobs API and celery task."""
+
+    def setUp(self) -> None:
+        """Set up business of the owner with one specialist."""
+        self.media_root = tempfile.mkdtemp()
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        self.owner = CustomUserFactory.create()
+        self.business = BusinessFactory.create(owner=self.owner)
+        self.position = PositionFactory.create(business=self.business)
+        self.service = ServiceFactory.create(position=self.position, price=Decimal("10"))
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse("api:report-job-list-create")
+
+    def order(self, hour, order_status=Order.StatusChoices.ACTIVE):
+        """Create order of the specialist on DAY."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(datetime.combine(DAY, time(hour))),
+            specialist=self.specialist,
+            service=self.service,
+            status=order_status,
+        )
+
+    def request_report(self, **data):
+        """Request report about the business and run on commit callbacks."""
+        data = {"kind": "orders", "business": self.business.id, **data}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(self.url, data, format="json")
+
+    def read_report(self, response):
+        """Return rows of downloaded gzip compressed CSV report."""
+        content = b"".join(response.streaming_content)
+        return list(csv.DictReader(io.StringIO(gzip.decompress(content).decode())))
+
+    def test_create_job(self, delay):
+        """Test if requested report job is created and its task is started."""
+        response = self.request_report(date_from="2030-07-01", statuses=["completed"])
+        job = ReportJob.objects.get()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], ReportJob.StatusChoices.PENDING)
+        self.assertIsNone(response.data["download_url"])
+        self.assertEqual(job.requested_by, self.owner)
+        self.assertEqual(
+            job.params, {"date_from": "2030-07-01", "statuses": [Order.StatusChoices.COMPLETED]},
+        )
+        delay.assert_called_once_with(job.id)
+
+    def test_in_flight_deduplication(self, delay):
+        """Test if identical in-flight job is returned instead of a new one."""
+        first = self.request_report(date_from="2030-07-01")
+        second = self.request_report(date_from="2030-07-01")
+        other = self.request_report(date_from="2030-07-02")
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data["id"], first.data["id"])
+        self.assertNotEqual(other.data["id"], first.data["id"])
+
+        generate_report.apply(args=[first.data["id"]])
+        after_done = self.request_report(date_from="2030-07-01")
+
+        self.assertEqual(after_done.status_code, 201)
+        self.assertEqual(delay.call_count, 3)
+
+    def test_stale_in_flight_job(self, delay):
+        """Test if stale in-flight job is failed and doesn't block a new one."""
+        first = self.request_report()
+        ReportJob.objects.filter(id=first.data["id"]).update(
+            status=ReportJob.StatusChoices.RUNNING,
+            created_at=timezone.now() - timedelta(hours=2),
+            started_at=timezone.now() - timedelta(hours=1),
+        )
+
+        second = self.request_report()
+        stale = ReportJob.objects.get(id=first.data["id"])
+
+        self.assertEqual(second.status_code, 201)
+        self.assertNotEqual(second.data["id"], first.data["id"])
+        self.assertEqual(stale.status, ReportJob.StatusChoices.FAILED)
+        self.assertEqual(stale.error, "Report job timed out")
+
+    def test_queued_job_not_stale(self, delay):
+        """Test if job which waited in the queue is not stale while running."""
+        first = self.request_report()
+        ReportJob.objects.filter(id=first.data["id"]).update(
+            created_at=timezone.now() - timedelta(hours=1),
+        )
+        ReportJob.objects.get(id=first.data["id"]).start()
+
+        second = self.request_report()
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data["id"], first.data["id"])
+        self.assertEqual(second.data["status"], ReportJob.StatusChoices.RUNNING)
+
+    def test_stale_job_not_finished(self, delay):
+        """Test if job failed as stale is not finished by its task."""
+        job_id = self.request_report().data["id"]
+
+        def fail_as_stale(job):
+            ReportJob.objects.filter(id=job.id).update(
+                started_at=timezone.now() - timedelta(hours=1),
+            )
+            ReportJob.objects.fail_stale_jobs()
+
+        with patch("api.tasks.build_report", side_effect=fail_as_stale):
+            generate_report.apply(args=[job_id])
+
+        job = ReportJob.objects.get(id=job_id)
+        self.assertEqual(job.status, ReportJob.StatusChoices.FAILED)
+        self.assertEqual(job.error, "Report job timed out")
+
+    def test_permissions(self, delay):
+        """Test if reports are available only for owners and admins."""
+        self.client.force_authenticate(user=self.specialist)
+
+        self.assertEqual(self.request_report().status_code, 400)
+        self.assertEqual(self.request_report(kind="businesses").status_code, 400)
+
+        self.specialist.is_admin = True
+        self.specialist.save()
+
+        self.assertEqual(self.request_report(kind="businesses").status_code, 201)
+        self.assertEqual(self.request_report().status_code, 201)
+
+    def test_orders_report(self, delay):
+        """Test if orders report is generated and downloaded."""
+        orders = [self.order(hour) for hour in (10, 11)]
+        job_id = self.request_report().data["id"]
+
+        generate_report.apply(args=[job_id])
+        status_response = self.client.get(
+            reverse("api:report-job-detail", kwargs={"pk": job_id}),
+        )
+        download_response = self.client.get(status_response.data["download_url"])
+        rows = self.read_report(download_response)
+
+        self.assertEqual(status_response.data["status"], ReportJob.StatusChoices.DONE)
+        self.assertEqual(status_response.data["progress"], 100)
+        self.assertEqual(download_response.status_code, 200)
+        self.assertEqual([int(row["id"]) for row in rows], [order.id for order in orders])
+        self.assertEqual(rows[0]["service"], self.service.name)
+
+    def test_progress(self, delay):
+        """Test if progress is saved after every chunk."""
+        for hour in range(10, 15):
+            self.order(hour)
+        job_id = self.request_report().data["id"]
+
+        with patch("api.reports.REPORT_CHUNK_SIZE", 2), \
+                patch.object(ReportJob, "set_progress", autospec=True) as set_progress:
+            generate_report.apply(args=[job_id])
+
+        self.assertEqual([call.args[1] for call in set_progress.call_args_list], [40, 80])
+
+    def test_specialists_report(self, delay):
+        """Test if specialists report contains monthly statistic."""
+        self.order(10, Order.StatusChoices.COMPLETED)
+        self.order(11, Order.StatusChoices.CANCELLED)
+        job_id = self.request_report(kind="specialists").data["id"]
+
+        generate_report.apply(args=[job_id])
+        rows = self.read_report(
+            self.client.get(reverse("api:report-job-download", kwargs={"pk": job_id})),
+        )
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["specialist"], str(self.specialist.id))
+        self.assertEqual(rows[0]["month"], "2030-07-01")
+        self.assertEqual(rows[0]["total_orders"], "2")
+        self.assertEqual(rows[0]["completed"], "1")
+        self.assertEqual(rows[0]["cancelled"], "1")
+        self.assertEqual(Decimal(rows[0]["profit"]), Decimal("10"))
+
+    def test_formula_values(self, delay):
+        """Test if formula values are escaped in reports."""
+        self.specialist.first_name = "@SUM(1)"
+        self.specialist.save()
+        self.order(10, Order.StatusChoices.COMPLETED)
+        job_id = self.request_report(kind="specialists").data["id"]
+
+        generate_report.apply(args=[job_id])
+        rows = self.read_report(
+            self.client.get(reverse("api:report-job-download", kwargs={"pk": job_id})),
+        )
+
+        self.assertEqual(rows[0]["specialist__first_name"], "'@SUM(1)")
+
+    def test_failed_job(self, delay):
+        """Test if failed job saves its error."""
+        job_id = self.request_report().data["id"]
+
+        with patch("api.tasks.build_report", side_effect=OSError("Disk is full")):
+            generate_report.apply(args=[job_id])
+
+        job = ReportJob.objects.get(id=job_id)
+        self.assertEqual(job.status, ReportJob.StatusChoices.FAILED)
+        self.assertEqual(job.error, "Disk is full")
+        self.assertIsNotNone(job.finished_at)
+
+    def test_download_not_ready(self, delay):
+        """Test if report can't be downloaded before it is done."""
+        job_id = self.request_report().data["id"]
+
+        response = self.client.get(reverse("api:report-job-download", kwargs={"pk": job_id}))
+
+        self.assertEqual(response.status_code, 400)
@@ -8,6 +8,8 @@ Tests for OwnerSpecialistScheduleView:
 - Get schedule if there is order in the begining
 - Get schedule if there is order in the midle
 - Get schedule if there is order in the end
+- Get schedule if orders follow each other
+- Amount of queries doesn't depend on amount of orders
 
 """
 
@@ -15,7 +17,9 @@ from django.utils import timezone, dateformat
 from datetime import datetime, timedelta
 import pytz
 from rest_framework.reverse import reverse
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from beauty.utils import string_to_time
 from beauty.utils import generate_working_time
@@ -94,7 +98,7 @@ class TestOwnerSpecialistScheduleView(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response.data,
-            [[string_to_time(self.start_time), string_to_time(self.end_time)]],
+            [{"free": [string_to_time(self.start_time), string_to_time(self.end_time)]}],
         )
 
     def test_get_schedule_as_not_owner(self):
@@ -167,9 +171,9 @@ class TestOwnerSpecialistScheduleView(TestCase):
             context={"request": response.wsgi_request}).data["url"]
 
         result = [
-            order_serialized,
-            [order.end_time.time(),
-             string_to_time(self.end_time)],
+            {"order": order_serialized},
+            {"free": [timezone.localtime(order.end_time).time(),
+                      string_to_time(self.end_time)]},
         ]
 
         self.assertEqual(response.status_code, 200)
@@ -198,9 +202,11 @@ class TestOwnerSpecialistScheduleView(TestCase):
             context={"request": response.wsgi_request}).data["url"]
 
         result = [
-            [string_to_time(self.start_time), order.start_time.time()],
-            order_serialized,
-            [order.end_time.time(), string_to_time(self.end_time)],
+            {"free": [string_to_time(self.start_time),
+                      timezone.localtime(order.start_time).time()]},
+            {"order": order_serialized},
+            {"free": [timezone.localtime(order.end_time).time(),
+                      string_to_time(self.end_time)]},
         ]
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, result)
@@ -228,8 +234,57 @@ class TestOwnerSpecialistScheduleView(TestCase):
             context={"request": response.wsgi_request}).data["url"]
 
         result = [
-            [string_to_time(self.start_time), order.start_time.time()],
-            order_serialized,
+            {"free": [string_to_time(self.start_time),
+                      timezone.localtime(order.start_time).time()]},
+            {"order": order_serialized},
         ]
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, result)
+
+    def create_order(self, start):
+        """Create order of the specialist starting at the given time of the day."""
+        return OrderFactory.create(
+            start_time=timezone.make_aware(datetime.combine(self.date, start)),
+            service=self.service,
+            specialist=self.specialist,
+        )
+
+    def test_get_schedule_orders_one_by_one(self):
+        """Test if orders follow each other without free time between them."""
+        start = datetime.combine(self.date, string_to_time(self.start_time))
+        first = self.create_order((start + self.duration).time())
+        second = self.create_order((start + self.duration * 2).time())
+
+        response = self.client.get(path=self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [list(entry) for entry in response.data],
+            [["free"], ["order"], ["order"], ["free"]],
+        )
+        self.assertEqual(
+            [entry["order"] for entry in response.data[1:3]],
+            [OrderSerializer(order, context={"request": response.wsgi_request}).data["url"]
+             for order in (first, second)],
+        )
+
+    def test_get_schedule_queries_count(self):
+        """Test if amount of queries doesn't depend on amount of orders."""
+        start = datetime.combine(self.date, string_to_time(self.start_time))
+        self.create_order(start.time())
+
+        with CaptureQueriesContext(connection) as one_order:
+            self.client.get(path=self.url)
+
+        for index in range(2, 12):
+            self.create_order((start + self.duration * index).time())
+
+        # Roles cached by the first request are loaded again by a new request
+        self.owner.forget_roles()
+        with CaptureQueriesContext(connection) as many_orders:
+            response = self.client.get(path=self.url)
+
+        self.assertEqual(
+            len([entry for entry in response.data if "order" in entry]), 11,
+        )
+        self.assertEqual(len(one_order), len(many_orders))
@@ -0,0 +1,134 @@
+"""This module is for testing schedule of specialist for a range of days.
+
+Tests for SpecialistRangeScheduleView:
+- Set up all required objects for the tests;
+- Test if endpoint returns schedule for every day of the range;
+- Test if orders are excluded from the days they belong to;
+- Test if endpoint returns 400 response for missing or invalid dates;
+- Test if endpoint returns 400 response for past days;
+- Test if endpoint returns 400 response for too long range;
+- Test if amount of queries doesn't depend on amount of days.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from api.tests.factories import (CustomUserFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from api.tests.test_customer_schedule import get_next_desired_day
+from api.views.schedule import MAX_SCHEDULE_DAYS
+
+
+class TestSpecialistRangeSchedule(TestCase):
+    """TestCase for SpecialistRangeScheduleView."""
+
+    position_schedule = {
+        "Mon": ["10:00", "12:00"],
+        "Tue": ["10:00", "12:00"],
+        "Wed": ["10:00", "12:00"],
+        "Thu": ["10:00", "12:00"],
+        "Fri": ["10:00", "12:00"],
+        "Sat": ["10:00", "11:00"],
+        "Sun": [],
+    }
+
+    def setUp(self) -> None:
+        """Set up all required objects for the tests."""
+        self.position = PositionFactory.create(
+            working_time=self.position_schedule,
+        )
+        self.service = ServiceFactory.create(
+            position=self.position, duration=timedelta(minutes=30),
+        )
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+        self.monday = get_next_desired_day(0) + timedelta(days=7)
+        self.url = reverse(
+            "api:specialist-schedule-range",
+            kwargs={
+                "position_id": self.position.id,
+                "specialist_id": self.specialist.id,
+                "service_id": self.service.id,
+            },
+        )
+
+    def get_schedule(self, date_from, date_to):
+        """Return response for the given range."""
+        return self.client.get(self.url, {"from": date_from, "to": date_to})
+
+    def test_schedule_for_week(self):
+        """Test if endpoint returns schedule for every day of the range."""
+        sunday = self.monday + timedelta(days=6)
+        response = self.get_schedule(self.monday, sunday)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 7)
+        self.assertEqual(
+            response.data[self.monday.isoformat()],
+            [[time(10, 0), time(10, 15), time(10, 30), time(10, 45),
+              time(11, 0), time(11, 15), time(11, 30)]],
+        )
+        self.assertEqual(
+            response.data[(self.monday + timedelta(days=5)).isoformat()],
+            [[time(10, 0), time(10, 15), time(10, 30)]],
+        )
+        self.assertEqual(response.data[sunday.isoformat()], [])
+
+    def test_orders_are_excluded(self):
+        """Test if orders are excluded from the days they belong to."""
+        tuesday = self.monday + timedelta(days=1)
+        OrderFactory.create(
+            start_time=timezone.make_aware(datetime.combine(tuesday, time(10, 30))),
+            specialist=self.specialist,
+            service=self.service,
+        )
+
+        response = self.get_schedule(self.monday, tuesday)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data[self.monday.isoformat()][0]), 7)
+        self.assertEqual(
+            response.data[tuesday.isoformat()],
+            [[time(10, 0)], [time(11, 0), time(11, 15), time(11, 30)]],
+        )
+
+    def test_invalid_dates(self):
+        """Test if endpoint returns 400 response for missing or invalid dates."""
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.get_schedule("wrong", self.monday).status_code, 400)
+
+    def test_past_days(self):
+        """Test if endpoint returns 400 response for past days."""
+        response = self.get_schedule("2022-06-22", self.monday)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data,
+            {"detail": "You can't see schedule of the past days"},
+        )
+
+    def test_too_long_range(self):
+        """Test if endpoint returns 400 response for too long or reversed range."""
+        response = self.get_schedule(
+            self.monday, self.monday + timedelta(days=MAX_SCHEDULE_DAYS),
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self.get_schedule(self.monday, self.monday - timedelta(days=1))
+        self.assertEqual(response.status_code, 400)
+
+    def test_queries_count(self):
+        """Test if amount of queries doesn't depend on amount of days."""
+        with CaptureQueriesContext(connection) as one_day:
+            self.get_schedule(self.monday, self.monday)
+
+        with CaptureQueriesContext(connection) as many_days:
+            self.get_schedule(self.monday, self.monday + timedelta(days=27))
+
+        self.assertEqual(len(one_day), len(many_days))
@@ -0,0 +1,142 @@
+"""This module is for testing availability engine.
+
+Tests for engine:
+- Merge overlapping and touching intervals
+- Subtract touching orders from working hours
+- Subtract overlapping orders from working hours
+- Subtract orders which are outside of working hours
+- Intersect working hours with a time window
+- Find ranges of start moments for a service
+- Split interval by 15 minutes, also passing midnight
+- Clip datetime range by the day boundaries
+- Convert datetime range to wall-clock minutes on DST change days
+- Round datetime up to 5 minutes
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from api.scheduling import engine
+
+
+class TestSchedulingEngine(SimpleTestCase):
+    """TestCase for interval arithmetic of the availability engine."""
+
+    def test_merge_intervals(self):
+        """Overlapping and touching intervals are merged, empty dropped."""
+        self.assertEqual(
+            engine.merge_intervals([(60, 90), (0, 30), (30, 45), (80, 120), (200, 200)]),
+            [(0, 45), (60, 120)],
+        )
+
+    def test_subtract_touching_orders(self):
+        """Touching orders make a single busy block."""
+        self.assertEqual(
+            engine.subtract_intervals([(540, 780)], [(600, 630), (630, 660)]),
+            [(540, 600), (660, 780)],
+        )
+
+    def test_subtract_overlapping_orders(self):
+        """Overlapping orders make a single busy block."""
+        self.assertEqual(
+            engine.subtract_intervals([(540, 780)], [(600, 650), (620, 640), (645, 700)]),
+            [(540, 600), (700, 780)],
+        )
+
+    def test_subtract_orders_outside_working_hours(self):
+        """Orders outside of working hours are ignored or clipped."""
+        self.assertEqual(
+            engine.subtract_intervals(
+                [(540, 780)], [(480, 560), (760, 800), (900, 960)],
+            ),
+            [(560, 760)],
+        )
+        self.assertEqual(engine.subtract_intervals([(540, 780)], [(500, 800)]), [])
+        self.assertEqual(engine.subtract_intervals([], [(500, 800)]), [])
+
+    def test_intersect_intervals(self):
+        """Only time covered by both lists is returned."""
+        self.assertEqual(
+            engine.intersect_intervals([(540, 780)], [(600, 660), (700, 900)]),
+            [(600, 660), (700, 780)],
+        )
+        self.assertEqual(engine.intersect_intervals([(540, 780)], [(0, 540)]), [])
+
+    def test_fit_intervals(self):
+        """Only blocks long enough for a service are kept."""
+        self.assertEqual(
+            engine.fit_intervals([(540, 560), (600, 700)], 30),
+            [(600, 670)],
+        )
+
+    def test_split_interval(self):
+        """Range is divided by 15 minutes including both ends."""
+        self.assertEqual(engine.split_interval(540, 585), [540, 555, 570, 585])
+        self.assertEqual(engine.split_interval(1410, 15), [1410, 1425, 0, 15])
+
+    def test_datetime_range_to_interval(self):
+        """Parts of the range outside of the day are clipped."""
+        midnight = timezone.make_aware(datetime(2022, 7, 4))
+
+        self.assertEqual(
+            engine.datetime_range_to_interval(
+                midnight + timedelta(hours=9), midnight + timedelta(hours=9, minutes=30),
+                midnight,
+            ),
+            (540, 570),
+        )
+        self.assertEqual(
+            engine.datetime_range_to_interval(
+                midnight - timedelta(hours=1), midnight + timedelta(hours=1), midnight,
+            ),
+            (0, 60),
+        )
+        self.assertEqual(
+            engine.datetime_range_to_interval(
+                midnight + timedelta(days=1), midnight + timedelta(days=1, hours=1),
+                midnight,
+            ),
+            (engine.MINUTES_IN_DAY, engine.MINUTES_IN_DAY),
+        )
+
+    def test_datetime_range_to_interval_dst(self):
+        """Minutes are wall-clock time on days when clocks are changed."""
+        for day in (datetime(2030, 3, 31), datetime(2030, 10, 27)):
+            midnight = timezone.make_aware(day)
+
+            # Orders are read from database with UTC time zone
+            start, end = (
+                timezone.make_aware(day.replace(hour=hour, minute=minute)).astimezone(
+                    timezone.utc,
+                )
+                for hour, minute in ((10, 0), (11, 30))
+            )
+
+            self.assertEqual(
+                engine.datetime_range_to_interval(start, end, midnight), (600, 690),
+            )
+            self.assertEqual(
+                timezone.localtime(midnight + timedelta(minutes=600)).time(), time(10),
+            )
+
+    def test_minutes_time_conversion(self):
+        """Minutes are converted to time and back."""
+        self.assertEqual(engine.time_to_minutes(time(13, 10)), 790)
+        self.assertEqual(engine.minutes_to_time(790), time(13, 10))
+        self.assertEqual(engine.minutes_to_time(engine.MINUTES_IN_DAY), time(23, 59))
+
+    def test_round_up_datetime(self):
+        """Datetime is rounded up to minutes multiple of 5."""
+        moment = timezone.make_aware(datetime(2022, 7, 4, 9, 55))
+
+        self.assertEqual(engine.round_up_datetime(moment), moment)
+        self.assertEqual(
+            engine.round_up_datetime(moment + timedelta(seconds=1)),
+            moment + timedelta(minutes=5),
+        )
+        self.assertEqual(
+            engine.round_up_datetime(moment + timedelta(minutes=2)),
+            moment + timedelta(minutes=5),
+        )
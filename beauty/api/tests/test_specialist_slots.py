@@ -0,0 +1,203 @@
+"""This module is for testing reservation of specialists' slots.
+
+Tests for SpecialistSlot:
+- Set up all required objects for the tests;
+- Overlapping order can't reserve slots, touching one can;
+- Orders of different specialists don't conflict;
+- Cancelled order releases its slots;
+- Overlapping order can't be created with API;
+- Order without slots can't be overlapped with API;
+- Slots of past orders are pruned when the specialist is booked;
+- Slots of unfinished orders are rebuilt by command;
+- Concurrent bookings of the same slot, only one of them succeeds;
+- Concurrent bookings of different slots all succeed.
+"""
+
+from datetime import datetime, time, timedelta
+from io import StringIO
+from threading import Barrier, Thread
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.utils import timezone
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from api.models import Order, SpecialistSlot
+from api.tests.factories import (CustomUserFactory, GroupFactory, OrderFactory,
+                                 PositionFactory, ServiceFactory)
+from beauty.utils import generate_working_time
+
+
+class SlotsSetUpMixin:
+    """Mixin with objects required for booking tests."""
+
+    def setUp(self) -> None:
+        """Set up all required objects for the tests."""
+        self.groups = GroupFactory.groups_for_test()
+        self.position = PositionFactory(working_time=generate_working_time("08:00", "20:00"))
+        self.service = ServiceFactory(position=self.position, duration=timedelta(minutes=30))
+        self.specialist = CustomUserFactory()
+        self.groups.specialist.user_set.add(self.specialist)
+        self.position.specialist.add(self.specialist)
+
+        self.day = timezone.localdate() + timedelta(days=1)
+
+    def at(self, hour, minute=0):
+        """Return aware datetime of the next day."""
+        return timezone.make_aware(datetime.combine(self.day, time(hour, minute)))
+
+    def create_order(self, start_time, specialist=None):
+        """Create order without reserving its slots."""
+        return OrderFactory(
+            start_time=start_time,
+            specialist=specialist or self.specialist,
+            service=self.service,
+        )
+
+    def book(self, start_time):
+        """Book order with API as a new customer."""
+        customer = CustomUserFactory()
+        client = APIClient()
+        client.force_authenticate(user=customer)
+
+        return client.post(
+            path=reverse("api:order-create"),
+            data=[{"start_time": start_time,
+                   "specialist": self.specialist.id,
+                   "service": self.service.id}],
+            format="json",
+        )
+
+
+@patch("api.views.order_views.change_order_status_to_decline.apply_async")
+@patch("api.views.order_views.send_message_for_specialist_consideration.delay")
+class TestSpecialistSlot(SlotsSetUpMixin, TestCase):
+    """TestCase for reservation of specialists' slots."""
+
+    def test_overlapping_order(self, *mocks):
+        """Overlapping order can't reserve slots, touching one can."""
+        self.assertTrue(SpecialistSlot.objects.reserve(self.create_order(self.at(10))))
+
+        overlapping_order = self.create_order(self.at(10, 15))
+        self.assertFalse(SpecialistSlot.objects.reserve(overlapping_order))
+        # Rejected order is rolled back by OrderSerializer
+        overlapping_order.delete()
+
+        self.assertTrue(
+            SpecialistSlot.objects.reserve(self.create_order(self.at(10, 30))),
+        )
+        self.assertEqual(SpecialistSlot.objects.count(), 12)
+
+    def test_different_specialists(self, *mocks):
+        """Orders of different specialists don't conflict."""
+        self.assertTrue(SpecialistSlot.objects.reserve(self.create_order(self.at(10))))
+        self.assertTrue(SpecialistSlot.objects.reserve(
+            self.create_order(self.at(10), CustomUserFactory()),
+        ))
+
+    def test_cancelled_order_releases_slots(self, *mocks):
+        """Cancelled order releases its slots."""
+        order = self.create_order(self.at(10))
+        SpecialistSlot.objects.reserve(order)
+        order.mark_as_cancelled()
+
+        self.assertFalse(order.slots.exists())
+        self.assertTrue(SpecialistSlot.objects.reserve(self.create_order(self.at(10))))
+
+    def test_book_overlapping_order(self, *mocks):
+        """Overlapping order can't be created with API."""
+        self.assertEqual(self.book(self.at(10)).status_code, 201)
+
+        response = self.book(self.at(10, 15))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("start_time", response.data)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_book_over_order_without_slots(self, *mocks):
+        """Order without slots can't be overlapped with API."""
+        self.create_order(self.at(10))
+
+        self.assertEqual(self.book(self.at(10)).status_code, 400)
+        self.assertEqual(self.book(self.at(10, 30)).status_code, 201)
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_past_slots_pruned(self, *mocks):
+        """Slots of past orders are pruned when the specialist is booked."""
+        past_order = self.create_order(self.at(10) - timedelta(days=3))
+        SpecialistSlot.objects.reserve(past_order)
+        other_past_order = self.create_order(self.at(10) - timedelta(days=3), CustomUserFactory())
+        SpecialistSlot.objects.reserve(other_past_order)
+
+        SpecialistSlot.objects.reserve(self.create_order(self.at(10)))
+
+        self.assertFalse(past_order.slots.exists())
+        self.assertEqual(other_past_order.slots.count(), 6)
+        self.assertEqual(SpecialistSlot.objects.filter(specialist=self.specialist).count(), 6)
+
+    def test_rebuild_command(self, *mocks):
+        """Slots of unfinished orders are rebuilt by command."""
+        order = self.create_order(self.at(10))
+        self.create_order(self.at(12)).mark_as_cancelled()
+        self.create_order(self.at(14), CustomUserFactory())
+        past_order = self.create_order(self.at(10) - timedelta(days=3))
+        SpecialistSlot.objects.reserve(past_order)
+
+        call_command("rebuild_slots", stdout=StringIO())
+
+        self.assertEqual(SpecialistSlot.objects.count(), 12)
+        self.assertEqual(order.slots.count(), 6)
+        self.assertFalse(past_order.slots.exists())
+        self.assertFalse(SpecialistSlot.objects.reserve(self.create_order(self.at(10, 15))))
+
+
+@skipUnlessDBFeature("test_db_allows_multiple_connections")
+@patch("api.views.order_views.change_order_status_to_decline.apply_async")
+@patch("api.views.order_views.send_message_for_specialist_consideration.delay")
+class TestConcurrentBooking(SlotsSetUpMixin, TransactionTestCase):
+    """TestCase for bookings made from many threads at once."""
+
+    threads_amount = 8
+
+    def book_concurrently(self, start_times):
+        """Book orders from separate threads, return status codes."""
+        barrier = Barrier(len(start_times))
+        status_codes = []
+
+        def book(start_time):
+            try:
+                barrier.wait()
+                status_codes.append(self.book(start_time).status_code)
+            finally:
+                connection.close()
+
+        threads = [Thread(target=book, args=(start_time,)) for start_time in start_times]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return sorted(status_codes)
+
+    def test_same_slot(self, *mocks):
+        """Concurrent bookings of the same slot, only one of them succeeds."""
+        status_codes = self.book_concurrently([self.at(10)] * self.threads_amount)
+
+        self.assertEqual(status_codes, [201] + [400] * (self.threads_amount - 1))
+        self.assertEqual(Order.objects.count(), 1)
+        self.assertEqual(SpecialistSlot.objects.count(), 6)
+
+    def test_different_slots(self, *mocks):
+        """Concurrent bookings of different slots all succeed."""
+        start_times = [
+            self.at(10) + timedelta(minutes=30 * index)
+            for index in range(self.threads_amount)
+        ]
+
+        status_codes = self.book_concurrently(start_times)
+
+        self.assertEqual(status_codes, [201] * self.threads_amount)
+        self.assertEqual(SpecialistSlot.objects.count(), 6 * self.threads_amount)
@@ -8,11 +8,26 @@ Tests for StatisticView:
 - Statistic for lastSevenDays.
 - Statistic for currentMonth.
 - Statistic for lastThreeMonthes.
+- General statistic values and amount of its queries.
+- Orders are counted by days with one query, midnight belongs to one day.
+- Orders are counted by months across the end of a year.
+- Specialists' statistic values and amount of its queries.
+- Orders are counted by weeks, quarters and years of a custom period.
+- Statistic for a custom period with from, to and granularity values.
+- Invalid from, to or granularity values.
+- Amount of queries for a custom period doesn't depend on amount of orders.
 """
 
+from decimal import Decimal
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from django.urls import reverse
+from api.models import Order
+from api.views.statistic import (Granularity, StatisticView, TimeIntervals,
+                                 count_orders_by_granularity,
+                                 count_orders_by_time_interval)
 from api.tests.factories import (
     CustomUserFactory, BusinessFactory, GroupFactory, OrderFactory,
     PositionFactory, ServiceFactory,
@@ -268,3 +283,224 @@ class StatisticTest(TestCase):
 
         data3 = response3.data
         self.assertEqual(data2, data3)
+
+    def test_general_statistic_queries(self):
+        """Test general statistic values and that they need two queries."""
+        start_time = CET.localize(datetime.combine(date.today(), time(hour=11)))
+        other_service = ServiceFactory.create(position=self.position, price=Decimal("20"))
+        self.service.price = Decimal("10")
+        self.service.save()
+
+        for order_status, service in (
+            (Order.StatusChoices.COMPLETED, self.service),
+            (Order.StatusChoices.COMPLETED, self.service),
+            (Order.StatusChoices.COMPLETED, other_service),
+            (Order.StatusChoices.CANCELLED, self.service),
+        ):
+            OrderFactory.create(
+                customer=self.customer, specialist=self.specialist,
+                service=service, start_time=start_time, status=order_status,
+            )
+
+        stats = self.business.get_daily_stats(date.today() - timedelta(days=1))
+
+        with self.assertNumQueries(2):
+            general_statistic = StatisticView()._general_statistic(stats)
+
+        self.assertEqual(
+            general_statistic,
+            [
+                {
+                    "business_orders_count": 4,
+                    "business_profit": Decimal("40"),
+                    "business_average_order": Decimal("12.5"),
+                    "most_popular_service": self.service.name,
+                    "least_popular_service": other_service.name,
+                    "active": 0,
+                    "completed": 3,
+                    "cancelled": 1,
+                    "approved": 0,
+                    "declined": 0,
+                },
+            ],
+        )
+
+    def create_order(self, start_time):
+        """Create order of the business starting at the given local time."""
+        return OrderFactory.create(
+            customer=self.customer, specialist=self.specialist,
+            service=self.service, start_time=CET.localize(start_time),
+        )
+
+    def test_count_orders_by_days(self):
+        """Test if orders are counted by days with one query."""
+        self.create_order(datetime(2022, 7, 2, 0, 0))
+        self.create_order(datetime(2022, 7, 2, 23, 55))
+        self.create_order(datetime(2022, 7, 4, 10, 0))
+
+        stats = self.business.get_daily_stats(date(2022, 7, 1))
+
+        with self.assertNumQueries(1):
+            counters = count_orders_by_time_interval(
+                stats, TimeIntervals.CURRENT_WEEK.value,
+                date(2022, 7, 1), today=date(2022, 7, 4),
+            )
+
+        self.assertEqual(counters, {"1 Jul": 0, "2 Jul": 2, "3 Jul": 0, "4 Jul": 1})
+
+    def test_count_orders_by_months_year_rollover(self):
+        """Test if orders are counted by months across the end of a year."""
+        self.create_order(datetime(2021, 12, 31, 23, 30))
+        self.create_order(datetime(2022, 1, 1, 0, 0))
+        self.create_order(datetime(2022, 1, 10, 12, 0))
+
+        stats = self.business.get_daily_stats(date(2021, 10, 10))
+
+        with self.assertNumQueries(1):
+            counters = count_orders_by_time_interval(
+                stats, TimeIntervals.LAST_THREE_MONTHES.value,
+                datetime(2021, 10, 10), today=date(2022, 1, 10),
+            )
+
+        self.assertEqual(
+            counters, {"October": 0, "November": 0, "December": 1, "January": 2},
+        )
+
+    def test_detailed_statistic_queries(self):
+        """Test specialists' statistic values and that they need three queries."""
+        start_time = CET.localize(datetime.combine(date.today(), time(hour=11)))
+        other_service = ServiceFactory.create(position=self.position, price=Decimal("20"))
+        self.service.price = Decimal("10")
+        self.service.save()
+
+        idle_specialists = CustomUserFactory.create_batch(5)
+        self.position.specialist.add(*idle_specialists)
+
+        for order_status, service in (
+            (Order.StatusChoices.COMPLETED, self.service),
+            (Order.StatusChoices.COMPLETED, other_service),
+            (Order.StatusChoices.APPROVED, self.service),
+        ):
+            OrderFactory.create(
+                customer=self.customer, specialist=self.specialist,
+                service=service, start_time=start_time, status=order_status,
+            )
+
+        stats = self.business.get_daily_stats(date.today() - timedelta(days=1))
+
+        with self.assertNumQueries(3):
+            detailed_statistic = StatisticView()._detailed_statistic(
+                stats, self.business.get_all_specialists().order_by("id"),
+            )
+
+        self.assertEqual(len(detailed_statistic), 6)
+        self.assertEqual(
+            detailed_statistic[0],
+            {
+                "specialist_name": self.specialist.get_full_name(),
+                "most_pop_service": self.service.name,
+                "least_pop_service": other_service.name,
+                "specialist_orders_count": 3,
+                "specialist_orders_profit": Decimal("30"),
+                "active": 0,
+                "completed": 2,
+                "cancelled": 0,
+                "approved": 1,
+                "declined": 0,
+            },
+        )
+        self.assertEqual(
+            detailed_statistic[1],
+            {
+                "specialist_name": idle_specialists[0].get_full_name(),
+                "most_pop_service": "No orders",
+                "least_pop_service": "No orders",
+                "specialist_orders_count": 0,
+                "specialist_orders_profit": 0,
+                "active": 0,
+                "completed": 0,
+                "cancelled": 0,
+                "approved": 0,
+                "declined": 0,
+            },
+        )
+
+    def test_count_orders_by_granularity(self):
+        """Test if orders are counted by weeks, quarters and years of a period."""
+        self.create_order(datetime(2021, 12, 31, 23, 30))
+        self.create_order(datetime(2022, 1, 3, 0, 0))
+        self.create_order(datetime(2022, 4, 1, 12, 0))
+
+        stats = self.business.get_daily_stats(date(2021, 12, 29), date(2022, 4, 1))
+
+        self.assertEqual(
+            count_orders_by_granularity(
+                stats, Granularity.WEEK, date(2021, 12, 29), date(2022, 1, 10),
+            ),
+            {"2021-12-27": 1, "2022-01-03": 1, "2022-01-10": 0},
+        )
+        self.assertEqual(
+            count_orders_by_granularity(
+                stats, Granularity.QUARTER, date(2021, 12, 29), date(2022, 4, 1),
+            ),
+            {"2021-Q4": 1, "2022-Q1": 1, "2022-Q2": 1},
+        )
+        self.assertEqual(
+            count_orders_by_granularity(
+                stats, Granularity.YEAR, date(2021, 12, 29), date(2022, 4, 1),
+            ),
+            {"2021": 1, "2022": 2},
+        )
+
+    def get_period_statistic(self, **params):
+        """Return response of the view for the custom period."""
+        return self.client.get(
+            reverse("api:statistic-of-business", kwargs={"business_id": self.business.id}),
+            params,
+        )
+
+    def test_custom_period(self):
+        """Test statistic for a custom period with from, to and granularity values."""
+        self.create_order(datetime(2021, 3, 10, 10, 0))
+        self.create_order(datetime(2022, 3, 10, 10, 0))
+        self.create_order(datetime(2022, 5, 10, 10, 0))
+        self.create_order(datetime(2023, 1, 1, 10, 0))
+
+        response = self.get_period_statistic(
+            **{"from": "2021-01-01", "to": "2022-12-31", "granularity": "year"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["line_chart_data"]["labels"], ["2021", "2022"])
+        self.assertEqual(response.data["line_chart_data"]["data"], [1, 2])
+        self.assertEqual(response.data["general_statistic"][0]["business_orders_count"], 3)
+
+    def test_invalid_custom_period(self):
+        """Test invalid from, to or granularity values."""
+        for params in (
+            {"from": "yesterday"},
+            {"from": "2022-01-02", "to": "2022-01-01"},
+            {"from": "2000-01-01", "to": "2022-01-01"},
+            {"from": "2022-01-01", "granularity": "decade"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.get_period_statistic(**params).status_code, 400)
+
+    def test_custom_period_queries(self):
+        """Test if amount of queries for a period doesn't depend on amount of orders."""
+        params = {"from": "2021-01-01", "to": "2022-12-31", "granularity": "month"}
+
+        with CaptureQueriesContext(connection) as few_orders:
+            self.get_period_statistic(**params)
+
+        for month in range(1, 13):
+            for hour in (10, 11, 12):
+                self.create_order(datetime(2022, month, 1, hour, 0))
+
+        # Roles cached by the first request are loaded again by a new request
+        self.owner.forget_roles()
+        with CaptureQueriesContext(connection) as many_orders:
+            response = self.get_period_statistic(**params)
+
+        self.assertEqual(response.data["line_chart_data"]["data"][12:], [3] * 12)
+        self.assertEqual(len(few_orders), len(many_orders))
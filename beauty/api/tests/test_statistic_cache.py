@@ -0,0 +1,171 @@
+"""This module is for testing statistic cache.
+
+Tests for statistic cache:
+- Set up all required objects for the tests;
+- Test if repeated statistic request is served from cache;
+- Test if age of cached statistic is returned in Age header;
+- Test if order change invalidates cached statistic of its business only;
+- Test if service price change invalidates cached statistic;
+- Test if specialists of positions invalidate cached statistic;
+- Test if specialist name change invalidates cached statistic;
+- Test if different periods are cached separately.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from api import statistic_cache
+from api.tests.factories import (BusinessFactory, CustomUserFactory, GroupFactory,
+                                 OrderFactory, PositionFactory, ServiceFactory)
+
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "statistic-tests",
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestStatisticCache(TestCase):
+    """TestCase for statistic cache and its invalidation."""
+
+    def setUp(self) -> None:
+        """Set up business of the owner with one specialist."""
+        cache.clear()
+
+        self.groups = GroupFactory.groups_for_test()
+        self.owner = CustomUserFactory.create()
+        self.groups.owner.user_set.add(self.owner)
+
+        self.business = BusinessFactory.create(owner=self.owner)
+        self.position = PositionFactory.create(business=self.business)
+        self.service = ServiceFactory.create(position=self.position, price=Decimal("10"))
+        self.specialist = CustomUserFactory.create()
+        self.position.specialist.add(self.specialist)
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse(
+            "api:statistic-of-business", kwargs={"business_id": self.business.id},
+        )
+
+    def create_order(self, service=None):
+        """Create order of the specialist for today and commit it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return OrderFactory.create(
+                start_time=timezone.make_aware(datetime.combine(date.today(), time(10))),
+                specialist=self.specialist,
+                service=service or self.service,
+            )
+
+    def get_statistic(self, time_interval="lastSevenDays"):
+        """Return response of the view and amount of queries it made."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"timeInterval": time_interval})
+
+        return response, len(queries)
+
+    def orders_count(self, response):
+        """Return amount of orders from the response."""
+        return response.data["general_statistic"][0]["business_orders_count"]
+
+    def test_repeated_request_is_cached(self):
+        """Test if repeated statistic request is served from cache."""
+        self.create_order()
+
+        first, first_queries = self.get_statistic()
+        second, second_queries = self.get_statistic()
+
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(self.orders_count(second), 1)
+        self.assertLess(second_queries, first_queries)
+
+    def test_age_header(self):
+        """Test if age of cached statistic is returned in Age header."""
+        now = 1_000_000.0
+
+        with patch("api.statistic_cache.time.time", return_value=now):
+            first, _ = self.get_statistic()
+        with patch("api.statistic_cache.time.time", return_value=now + 42):
+            second, _ = self.get_statistic()
+
+        self.assertEqual(first["Age"], "0")
+        self.assertEqual(second["Age"], "42")
+
+    def test_order_invalidates_business(self):
+        """Test if order change invalidates cached statistic of its business only."""
+        other_business = BusinessFactory.create(owner=self.owner)
+        other_version = statistic_cache.get_version(other_business.id)
+
+        self.get_statistic()
+        order = self.create_order()
+
+        self.assertEqual(self.orders_count(self.get_statistic()[0]), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            order.mark_as_cancelled()
+        response, _ = self.get_statistic()
+
+        self.assertEqual(response.data["general_statistic"][0]["cancelled"], 1)
+        self.assertEqual(statistic_cache.get_version(other_business.id), other_version)
+
+    def test_service_invalidates_business(self):
+        """Test if service price change invalidates cached statistic."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_order().mark_as_completed()
+        self.get_statistic()
+
+        self.service.price = Decimal("15")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.save()
+        response, _ = self.get_statistic()
+
+        self.assertEqual(response.data["general_statistic"][0]["business_profit"], 15)
+
+    def test_specialists_invalidate_business(self):
+        """Test if specialists of positions invalidate cached statistic."""
+        specialist = CustomUserFactory.create()
+
+        for change in (
+            lambda: self.position.specialist.add(specialist),
+            lambda: specialist.position_set.remove(self.position),
+            lambda: self.position.specialist.clear(),
+        ):
+            version = statistic_cache.get_version(self.business.id)
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+            self.assertNotEqual(statistic_cache.get_version(self.business.id), version)
+
+    def test_specialist_name_invalidates_business(self):
+        """Test if specialist name change invalidates cached statistic."""
+        version = statistic_cache.get_version(self.business.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.specialist.save(update_fields=["last_login"])
+
+        self.assertEqual(statistic_cache.get_version(self.business.id), version)
+
+        self.specialist.first_name = "Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.specialist.save()
+
+        self.assertNotEqual(statistic_cache.get_version(self.business.id), version)
+
+    def test_periods_are_cached_separately(self):
+        """Test if different periods are cached separately."""
+        week, _ = self.get_statistic("lastSevenDays")
+        month, _ = self.get_statistic("currentMonth")
+
+        self.assertNotEqual(
+            week.data["line_chart_data"]["labels"], month.data["line_chart_data"]["labels"],
+        )
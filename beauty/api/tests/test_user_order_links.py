@@ -0,0 +1,171 @@
+"""This module is for testing order links of user profiles.
+
+Tests for order links:
+- Set up customer with orders of every status;
+- Test if profile contains amounts of orders and URLs of their lists;
+- Test if existing orders are filtered by the list URL;
+- Test if order links are expanded with expand and limit query params;
+- Test if specialist gets approving links of expanded orders;
+- Test if approving links are built without checking tokens;
+- Test if orders with expired tokens don't have approving links;
+- Test if amount of queries of users list doesn't depend on amount of orders.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from djoser.utils import encode_uid
+from rest_framework.test import APIClient
+
+from api.models import Order
+from api.tests.factories import CustomUserFactory, GroupFactory, OrderFactory
+
+
+class TestUserOrderLinks(TestCase):
+    """TestCase for order links of user profiles."""
+
+    def setUp(self) -> None:
+        """Set up customer with orders of every status."""
+        self.groups = GroupFactory.groups_for_test()
+        self.customer = CustomUserFactory.create(groups=[self.groups.customer])
+        self.specialist = CustomUserFactory.create(groups=[self.groups.specialist])
+        self.orders = [
+            OrderFactory.create(
+                customer=self.customer, specialist=self.specialist, status=order_status,
+            )
+            for order_status in Order.StatusChoices
+        ]
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.customer)
+        self.url = reverse("api:user-detail", args=[self.customer.id])
+
+    def test_counts_and_urls(self):
+        """Test if profile contains amounts of orders and URLs of their lists."""
+        response = self.client.get(self.url)
+        orders_url = reverse("api:customer-orders-list", args=[self.customer.id])
+
+        self.assertEqual(
+            response.data["customer_exist_orders"],
+            {"count": 3, "url": f"http://testserver{orders_url}?exist=true"},
+        )
+
+        response = self.client.get(reverse("api:user-list-create"))
+        customer = next(user for user in response.data["results"] if user["id"] == self.customer.id)
+
+        self.assertEqual(
+            customer["customer_orders"],
+            {"count": 5, "url": f"http://testserver{orders_url}"},
+        )
+
+    def test_exist_filter(self):
+        """Test if existing orders are filtered by the list URL."""
+        url = self.client.get(self.url).data["customer_exist_orders"]["url"]
+
+        response = self.client.get(url)
+
+        self.assertEqual(
+            [order["status"] for order in response.data["results"]],
+            [
+                Order.StatusChoices.ACTIVE,
+                Order.StatusChoices.COMPLETED,
+                Order.StatusChoices.APPROVED,
+            ],
+        )
+
+    def test_expand_orders(self):
+        """Test if order links are expanded with expand and limit query params."""
+        response = self.client.get(self.url, {"expand": "orders", "limit": 2})
+        orders = response.data["customer_exist_orders"]
+
+        self.assertEqual(orders["count"], 3)
+        self.assertEqual(
+            orders["results"],
+            [
+                "http://testserver" + reverse(
+                    "api:user-order-detail",
+                    kwargs={"user": self.customer.id, "pk": order.id},
+                )
+                for order in self.orders[:2]
+            ],
+        )
+
+    def test_expand_specialist_orders(self):
+        """Test if specialist gets approving links of expanded orders."""
+        self.client.force_authenticate(user=self.specialist)
+
+        response = self.client.get(
+            reverse("api:user-detail", args=[self.specialist.id]), {"expand": "orders"},
+        )
+        links = response.data["specialist_exist_orders"]["results"]
+
+        self.assertEqual(len(links), 3)
+        self.assertEqual(set(links[0]), {"url", "url_for_approve", "url_for_decline"})
+
+    @patch("beauty.tokens.OrderApprovingTokenGenerator.check_token")
+    def test_approving_links(self, mock_check_token):
+        """Test if approving links are built without checking tokens."""
+        self.client.force_authenticate(user=self.specialist)
+        order = self.orders[0]
+
+        response = self.client.get(
+            reverse("api:user-detail", args=[self.specialist.id]), {"expand": "orders"},
+        )
+        links = response.data["specialist_exist_orders"]["results"][0]
+
+        mock_check_token.assert_not_called()
+        for name, order_status in (("url_for_approve", "approved"),
+                                   ("url_for_decline", "declined")):
+            self.assertEqual(
+                links[name],
+                "http://testserver" + reverse(
+                    "api:order-approving",
+                    kwargs={
+                        "uid": encode_uid(order.pk),
+                        "token": order.token,
+                        "status": encode_uid(order_status),
+                    },
+                ),
+            )
+
+    def test_expired_token(self):
+        """Test if orders with expired tokens don't have approving links."""
+        self.client.force_authenticate(user=self.specialist)
+        Order.objects.filter(id=self.orders[0].id).update(
+            token_expires_at=timezone.now() - timedelta(minutes=1),
+        )
+
+        response = self.client.get(
+            reverse("api:user-detail", args=[self.specialist.id]), {"expand": "orders"},
+        )
+        links = response.data["specialist_exist_orders"]["results"]
+
+        self.assertEqual(
+            links[0],
+            "http://testserver" + reverse(
+                "api:user-order-detail",
+                kwargs={"user": self.specialist.id, "pk": self.orders[0].id},
+            ),
+        )
+
+    def test_queries_count(self):
+        """Test if amount of queries of users list doesn't depend on amount of orders."""
+        url = reverse("api:user-list-create")
+
+        with CaptureQueriesContext(connection) as few_orders:
+            self.client.get(url)
+
+        for _ in range(10):
+            OrderFactory.create(customer=self.customer, specialist=self.specialist)
+
+        with CaptureQueriesContext(connection) as many_orders:
+            response = self.client.get(url)
+
+        customer = next(user for user in response.data["results"] if user["id"] == self.customer.id)
+        self.assertEqual(customer["customer_orders"]["count"], 15)
+        self.assertEqual(len(few_orders), len(many_orders))
@@ -0,0 +1,62 @@
+"""This module is for testing roles of users.
+
+Tests for CustomUser roles:
+- Set up user with owner group;
+- All role checks of the user run one query;
+- Prefetched groups are used without queries;
+- Roles are forgotten when groups of the user are changed;
+- Roles are reloaded with the user from database.
+"""
+
+from django.contrib.auth.models import Group
+from django.test import TestCase
+
+from api.models import CustomUser
+from api.tests.factories import CustomUserFactory
+
+
+class TestUserRoles(TestCase):
+    """TestCase for roles of CustomUser."""
+
+    def setUp(self) -> None:
+        """Set up user with owner group."""
+        self.owner_group = Group.objects.create(name="Owner")
+        self.specialist_group = Group.objects.create(name="Specialist")
+        self.user = CustomUserFactory.create(groups=[self.owner_group])
+        self.user = CustomUser.objects.get(id=self.user.id)
+
+    def test_one_query(self):
+        """All role checks of the user run one query."""
+        with self.assertNumQueries(1):
+            self.assertTrue(self.user.is_owner)
+            self.assertFalse(self.user.is_specialist)
+            self.assertFalse(self.user.is_customer)
+            self.assertTrue(self.user.is_owner)
+
+        self.assertEqual(self.user.roles, frozenset({"Owner"}))
+
+    def test_prefetched_groups(self):
+        """Prefetched groups are used without queries."""
+        users = list(CustomUser.objects.prefetch_related("groups"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual([user.is_owner for user in users], [True])
+
+    def test_groups_changed(self):
+        """Roles are forgotten when groups of the user are changed."""
+        self.assertFalse(self.user.is_specialist)
+
+        self.user.groups.add(self.specialist_group)
+        self.assertTrue(self.user.is_specialist)
+
+        self.user.groups.remove(self.owner_group)
+        self.assertFalse(self.user.is_owner)
+
+    def test_refresh_from_db(self):
+        """Roles are reloaded with the user from database."""
+        self.assertFalse(self.user.is_specialist)
+
+        self.specialist_group.user_set.add(self.user)
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.is_specialist)
@@ -0,0 +1,98 @@
+"""This module is for testing compiled working time.
+
+Tests for WeeklyHours:
+- Compile days, days off and missing days of working time JSON
+- Equal working times share compiled value
+- Compiled working time is immutable
+- Check if working time was reduced
+- Check if order fits working time
+- Check if position time is within business time
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from api.models import Order
+from api.serializers.position_serializer import is_valid_position_time
+from beauty.utils import (WeeklyHours, generate_working_time,
+                          is_order_fit_working_time, is_working_time_reduced)
+
+
+class TestWeeklyHours(SimpleTestCase):
+    """TestCase for WeeklyHours and working hours checks built on it."""
+
+    def setUp(self) -> None:
+        """Set up working time for the tests."""
+        self.working_time = generate_working_time("09:00", "18:00")
+        self.working_time["Sun"] = []
+        del self.working_time["Sat"]
+
+    def test_compile(self):
+        """Days, days off and missing days are compiled."""
+        weekly_hours = WeeklyHours.compile(self.working_time)
+
+        self.assertEqual(weekly_hours.day(0), (540, 1080))
+        self.assertEqual(weekly_hours.day(1), (540, 1080))
+        self.assertEqual(weekly_hours.day_times(4), (time(9), time(18)))
+        self.assertIsNone(weekly_hours.day(5))
+        self.assertFalse(weekly_hours.has_day(5))
+        self.assertIsNone(weekly_hours.day(6))
+        self.assertTrue(weekly_hours.has_day(6))
+        self.assertEqual(weekly_hours.intervals[1], (1440 + 540, 1440 + 1080))
+
+    def test_compile_is_shared(self):
+        """Equal working times share compiled value."""
+        weekly_hours = WeeklyHours.compile(self.working_time)
+
+        self.assertIs(weekly_hours, WeeklyHours.compile(dict(self.working_time)))
+        self.assertIs(weekly_hours, WeeklyHours.compile(weekly_hours))
+        self.assertNotEqual(
+            weekly_hours, WeeklyHours.compile(generate_working_time("09:00", "18:00")),
+        )
+
+    def test_immutable(self):
+        """Compiled working time can't be changed."""
+        weekly_hours = WeeklyHours.compile(self.working_time)
+
+        with self.assertRaises(AttributeError):
+            weekly_hours._days = ()
+
+    def test_is_working_time_reduced(self):
+        """Only days present in both working times are compared."""
+        self.assertFalse(is_working_time_reduced(self.working_time, {}))
+        self.assertFalse(
+            is_working_time_reduced(self.working_time, {"Mon": ["08:00", "19:00"]}),
+        )
+        self.assertFalse(is_working_time_reduced(self.working_time, {"Sun": ["10:00", "12:00"]}))
+        self.assertTrue(is_working_time_reduced(self.working_time, {"Mon": ["10:00", "18:00"]}))
+        self.assertTrue(is_working_time_reduced(self.working_time, {"Mon": ["08:00", "17:00"]}))
+        self.assertTrue(is_working_time_reduced(self.working_time, {"Mon": []}))
+
+    def test_is_order_fit_working_time(self):
+        """Order fits working time of its day, missing days are not checked."""
+        monday = timezone.make_aware(datetime(2022, 7, 4, 10))
+        order = Order(start_time=monday, end_time=monday + timedelta(hours=1))
+
+        self.assertTrue(is_order_fit_working_time(order, self.working_time))
+        self.assertTrue(is_order_fit_working_time(order, {"Tue": []}))
+        self.assertTrue(is_order_fit_working_time(order, {"Mon": ["10:00", "11:00"]}))
+        self.assertFalse(is_order_fit_working_time(order, {"Mon": ["10:15", "18:00"]}))
+        self.assertFalse(is_order_fit_working_time(order, {"Mon": []}))
+
+    def test_is_valid_position_time(self):
+        """Position time must be within business time."""
+        business_time = generate_working_time("09:00", "18:00")
+        business_time["Sun"] = []
+        position_time = generate_working_time("10:00", "17:00")
+        position_time["Sun"] = []
+
+        self.assertTrue(is_valid_position_time(business_time, position_time))
+        position_time["Sat"] = []
+        self.assertTrue(is_valid_position_time(business_time, position_time))
+        position_time["Mon"] = ["08:00", "17:00"]
+        self.assertFalse(is_valid_position_time(business_time, position_time))
+        position_time["Mon"] = []
+        position_time["Sun"] = ["10:00", "12:00"]
+        self.assertFalse(is_valid_position_time(business_time, position_time))
@@ -11,7 +11,9 @@ from api.views.location_views import LocationRUDView, LocationCreateView
 from api.views.order_views import (CustomerOrdersViews, OrderApprovingView, SpecialistOrdersViews,
                                    OrderCreateView, OrderRetrieveCancelView)
 
-from api.views.schedule import OwnerSpecialistScheduleView, SpecialistScheduleView
+from api.views.schedule import (BusinessHeatmapView, FreeSpecialistsView, NextAvailableSlotView,
+                                OwnerBusinessScheduleView, OwnerSpecialistScheduleView,
+                                SpecialistScheduleView, SpecialistRangeScheduleView)
 
 from api.views.review_views import (ReviewDisplayView,
                                     ReviewRUDView,
@@ -21,7 +23,10 @@ from api.views.position_views import (InviteSpecialistToPosition,
                                       InviteSpecialistApprove)
 
 from api.views.customuser_views import InviteRegisterView
-from api.views.statistic import StatisticView
+from api.views.statistic import PlatformStatisticView, StatisticView
+from api.views.export_views import BusinessOrdersExportView
+from api.views.report_views import (ReportJobDetailView, ReportJobDownloadView,
+                                    ReportJobListCreateView)
 from api.views.contact_views import ContactFormView
 
 from .views_api import (AllServicesListCreateView, BusinessesListCreateAPIView,
@@ -205,6 +210,31 @@ urlpatterns = [
         SpecialistScheduleView.as_view(),
         name="specialist-schedule",
     ),
+    path(
+        "schedule/<int:position_id>/<int:specialist_id>/<int:service_id>/",
+        SpecialistRangeScheduleView.as_view(),
+        name="specialist-schedule-range",
+    ),
+    path(
+        "schedule/<int:position_id>/<int:specialist_id>/<int:service_id>/next_available/",
+        NextAvailableSlotView.as_view(),
+        name="specialist-next-available",
+    ),
+    path(
+        "service/<int:service_id>/free_specialists/",
+        FreeSpecialistsView.as_view(),
+        name="service-free-specialists",
+    ),
+    path(
+        "business/<int:business_id>/heatmap/",
+        BusinessHeatmapView.as_view(),
+        name="business-heatmap",
+    ),
+    path(
+        "owner_schedule/<int:business_id>/<date:order_date>/",
+        OwnerBusinessScheduleView.as_view(),
+        name="owner-business-schedule",
+    ),
     path(
         "owner_schedule/<int:position_id>/<int:specialist_id>/<date:order_date>/",
         OwnerSpecialistScheduleView.as_view(),
@@ -220,11 +250,36 @@ urlpatterns = [
         SpecialistsServicesView.as_view(),
         name="service-by-specialist"),
 
+    path(
+        "statistic/platform/",
+        PlatformStatisticView.as_view(),
+        name="platform-statistic",
+    ),
     path(
         "statistic/<int:business_id>/",
         StatisticView.as_view(),
         name="statistic-of-business",
     ),
+    path(
+        "export/<int:business_id>/orders/",
+        BusinessOrdersExportView.as_view(),
+        name="business-orders-export",
+    ),
+    path(
+        "reports/",
+        ReportJobListCreateView.as_view(),
+        name="report-job-list-create",
+    ),
+    path(
+        "reports/<int:pk>/",
+        ReportJobDetailView.as_view(),
+        name="report-job-detail",
+    ),
+    path(
+        "reports/<int:pk>/download/",
+        ReportJobDownloadView.as_view(),
+        name="report-job-download",
+    ),
     path(
         "contact/",
         ContactFormView.as_view(),
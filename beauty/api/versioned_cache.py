@@ -0,0 +1,52 @@
+"""Versions of cached values.
+
+A version is stored by its own key and cached values include versions of
+their source data in their keys. Bumping a version is a single atomic
+increment, stale values are never deleted explicitly, they are just not
+read anymore and expire by timeout.
+"""
+
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def bump(key):
+    """Change version stored by key when the current transaction is committed.
+
+    A value computed from data read before the commit would be cached under
+    the new version otherwise and never invalidated again.
+    """
+    transaction.on_commit(partial(_bump, key))
+
+
+def _bump(key):
+    """Change version stored by key.
+
+    Missing version is initialized with current time, so it never matches
+    versions of values cached before the key was evicted.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def get_versions(keys):
+    """Return dict with versions for all the keys, missing ones are initialized."""
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+
+    if missing:
+        for key in missing:
+            cache.add(key, time.time_ns(), timeout=None)
+        versions.update(cache.get_many(missing))
+
+    return versions
+
+
+def get_version(key):
+    """Return version stored by key, initialize it if it is missing."""
+    return get_versions([key]).get(key)
@@ -0,0 +1,64 @@
+"""This module provides views for exporting business data."""
+
+import logging
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+from api.exports import EXPORT_FORMATS, get_orders_for_export, parse_export_filters
+from api.models import Business
+from api.permissions import IsAdminOrThisBusinessOwner, IsOwner
+
+
+logger = logging.getLogger(__name__)
+
+
+class BusinessOrdersExportView(GenericAPIView):
+    """Stream all orders of the business as CSV or NDJSON file.
+
+    Rows are read by chunks and sent as soon as they are formatted, so
+    memory usage doesn't depend on amount of orders.
+    """
+
+    query_budget = 4
+
+    permission_classes = (IsOwner & IsAdminOrThisBusinessOwner,)
+    queryset = Business.objects.all()
+    lookup_url_kwarg = "business_id"
+
+    def get(self, request, business_id):
+        """Return streaming response with orders of the business.
+
+        Query parameters: file_format (csv or ndjson, csv by default), from
+        and to local dates and status names, status may be repeated.
+        """
+        business = self.get_object()
+
+        file_format = request.GET.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"file_format should be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            filters = parse_export_filters(request.GET)
+        except ValueError as error:
+            return Response(
+                {"detail": str(error)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        iter_lines, content_type = EXPORT_FORMATS[file_format]
+        response = StreamingHttpResponse(
+            iter_lines(get_orders_for_export([business.id], **filters)),
+            content_type=content_type,
+        )
+        filename = f"orders_{business.id}_{timezone.localdate().isoformat()}.{file_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+        logger.info(f"Orders of business {business} are exported as {file_format}")
+        return response
@@ -23,5 +23,7 @@ class LocationRUDView(RetrieveUpdateDestroyAPIView):
     RUD - Retrieve, Update, Destroy.
     """
 
+    query_budget = 1
+
     queryset = Location.objects.all()
     serializer_class = LocationSerializer
@@ -4,11 +4,13 @@ import logging
 
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import redirect
 from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.http import urlsafe_base64_decode
+from django_filters.rest_framework import DjangoFilterBackend
 from djoser.utils import encode_uid
 from rest_framework import (filters, status)
 from rest_framework.generics import (CreateAPIView,
@@ -17,6 +19,7 @@ from rest_framework.generics import (CreateAPIView,
 from rest_framework.permissions import (IsAuthenticated)
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
+from api.filters import OrderFilter
 from api.models import (CustomUser, Order)
 from api.permissions import (IsOrderUser, IsCustomerOrIsAdmin, IsOwnerOfSpecialist)
 from api.serializers.order_serializers import (OrderDeleteSerializer, OrderSerializer)
@@ -59,7 +62,11 @@ class OrderCreateView(CreateAPIView):
         """Create an order and add an authenticated customer to it."""
         serializer = self.get_serializer(data=request.data, many=True)
         serializer.is_valid(raise_exception=True)
-        orders = serializer.save(customer=request.user)
+
+        # All orders of the request are created or none of them
+        with transaction.atomic():
+            orders = serializer.save(customer=request.user)
+
         for order in orders:
             logger.info(f"{order} with {order.service.name} was created")
 
@@ -81,6 +88,8 @@ class OrderRetrieveCancelView(TokenLoginRequiredMixin, RetrieveUpdateDestroyAPIV
     RUD - Retrieve, Update, Destroy.
     """
 
+    query_budget = 6
+
     login_url = settings.LOGIN_URL
     redirect_field_name = "redirect_to"
 
@@ -130,6 +139,8 @@ class OrderRetrieveCancelView(TokenLoginRequiredMixin, RetrieveUpdateDestroyAPIV
 class OrderApprovingView(RetrieveAPIView):
     """Approving orders custom GET method."""
 
+    query_budget = 2
+
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
 
@@ -211,9 +222,12 @@ class OrderApprovingView(RetrieveAPIView):
 class CustomerOrdersViews(ListAPIView):
     """Show all orders concrete customer."""
 
+    query_budget = 3
+
     serializer_class = OrderSerializer
     permission_classes = (IsAuthenticated, IsCustomerOrIsAdmin)
-    filter_backends = [filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = OrderFilter
     ordering_fields = ["status", "specialist", "service", "start_time", "end_time"]
 
     def get_queryset(self):
@@ -228,9 +242,12 @@ class CustomerOrdersViews(ListAPIView):
 class SpecialistOrdersViews(ListAPIView):
     """Show all orders of concrete specialist."""
 
+    query_budget = 3
+
     serializer_class = OrderSerializer
     permission_classes = (IsAuthenticated, IsCustomerOrIsAdmin | IsOwnerOfSpecialist)
-    filter_backends = [filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = OrderFilter
     ordering_fields = ["status", "specialist", "service", "start_time", "end_time"]
 
     def get_queryset(self):
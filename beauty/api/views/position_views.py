@@ -100,6 +100,8 @@ class InviteSpecialistToPosition(GenericAPIView):
 class InviteSpecialistApprove(GenericAPIView):
     """This view is used to accept an offer for a Position."""
 
+    query_budget = 1
+
     permission_classes = (IsAuthenticated,)
 
     def get(self, request, email, position, token, answer):
@@ -0,0 +1,85 @@
+"""This module provides views for report jobs."""
+
+import logging
+
+from django.db import transaction
+from django.http import FileResponse
+from rest_framework import status
+from rest_framework.generics import GenericAPIView, ListCreateAPIView, RetrieveAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from api.models import ReportJob
+from api.serializers.report_serializers import ReportJobSerializer
+from api.tasks import generate_report
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReportJobQuerysetMixin:
+    """Mixin which limits report jobs with jobs of the current user."""
+
+    permission_classes = (IsAuthenticated,)
+    serializer_class = ReportJobSerializer
+
+    def get_queryset(self):
+        """Return report jobs requested by the current user."""
+        return ReportJob.objects.filter(requested_by=self.request.user)
+
+
+class ReportJobListCreateView(ReportJobQuerysetMixin, ListCreateAPIView):
+    """List report jobs of the user or request a new report.
+
+    Report is generated by a celery task. If the same report of the user is
+    pending or running, its job is returned instead of creating a new one.
+    """
+
+    query_budget = 2
+
+    def create(self, request, *args, **kwargs):
+        """Create a job and start generating the report."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            job = serializer.save()
+
+            if serializer.created:
+                transaction.on_commit(lambda: generate_report.delay(job.id))
+                logger.info(f"{job} was requested by {request.user}")
+
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if serializer.created else status.HTTP_200_OK,
+        )
+
+
+class ReportJobDetailView(ReportJobQuerysetMixin, RetrieveAPIView):
+    """Return status and progress of the report job."""
+
+    query_budget = 1
+
+
+class ReportJobDownloadView(ReportJobQuerysetMixin, GenericAPIView):
+    """Download file of the generated report."""
+
+    query_budget = 1
+
+    def get(self, request, *args, **kwargs):
+        """Return report file or 400 response if the report is not ready."""
+        job = self.get_object()
+
+        if job.status != ReportJob.StatusChoices.DONE:
+            return Response(
+                {"detail": f"Report is {job.get_status_display().lower()}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        logger.info(f"{job} was downloaded by {request.user}")
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=job.file.name.rsplit("/", 1)[-1],
+            content_type="application/gzip",
+        )
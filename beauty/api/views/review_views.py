@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 
 class ReviewDisplayView(GenericAPIView):
     """Generic API for custom GET method."""
+    query_budget = 1
     queryset = Review.objects.all()
     serializer_class = ReviewDisplaySerializer
     filter_backends = (filters.OrderingFilter, )
@@ -44,6 +45,7 @@ class ReviewDisplayView(GenericAPIView):
 
 class ReviewRUDView(RetrieveUpdateDestroyAPIView):
     """View for retrieving specific review."""
+    query_budget = 2
     queryset = Review.objects
     serializer_class = ReviewDisplaySerializer
     permission_classes = (IsAdminOrCurrentReviewOwner, )
@@ -1,163 +1,554 @@
 """Module with SpecialistScheduleView."""
 
-from api.models import Order, Position, CustomUser, Service
+import numpy as np
+from api.models import Business, Order, Position, CustomUser, Service
+from api.scheduling import cache as availability_cache
+from api.scheduling import engine, heatmap
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework import status
 from django.shortcuts import get_object_or_404
-from datetime import timedelta, datetime, date
-from api.serializers.order_serializers import OrderSerializer
-from beauty.utils import string_to_time
-from django.utils.timezone import localtime
+from collections import defaultdict
+from datetime import timedelta, date, datetime
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.timezone import is_naive, localtime, make_aware
 
 
-def get_orders_for_specific_date(specialist, position, order_date):
-    """Return active or approved orders.
+VALID_ORDER_STATUSES = (
+    Order.StatusChoices.ACTIVE,
+    Order.StatusChoices.APPROVED,
+)
 
-    Filter them by certain specialist and specific date.
-    """
-    valid_order_statuses = [
-        Order.StatusChoices.ACTIVE,
-        Order.StatusChoices.APPROVED,
-    ]
+MAX_SCHEDULE_DAYS = 31
+MAX_NEXT_AVAILABLE_DAYS = 92
+
+
+def get_orders_for_date_range(specialist, date_from, date_to):
+    """Return active or approved orders which intersect given days.
 
+    Orders of all positions of the specialist are returned, so free time
+    matches slots reserved by SpecialistSlot.
+
+    Args:
+        specialist (CustomUser): specialist of orders
+        date_from (date): first day of range
+        date_to (date): last day of range, inclusive
+
+    Returns:
+        QuerySet[Order]: orders ordered by start time
+    """
     return Order.objects.filter(
         specialist=specialist,
-        status__in=valid_order_statuses,
-        service__position=position,
-        start_time__range=(order_date, order_date + timedelta(days=1)),
-    )
+        status__in=VALID_ORDER_STATUSES,
+        end_time__gt=engine.day_start(date_from),
+        start_time__lt=engine.day_start(date_to + timedelta(days=1)),
+    ).order_by("start_time")
 
 
-def get_working_day(position, order_date):
-    """Return working time of a position, according to the order_date day."""
-    weekdays = {
-        0: "Mon", 1: "Tue", 2: "Wed", 3: "Thu",
-        4: "Fri", 5: "Sat", 6: "Sun",
-    }
+def group_orders_by_day(orders):
+    """Return dict with local dates as keys and lists of orders as values.
 
-    order_day = order_date.weekday()
-    return position.working_time[weekdays[order_day]]
+    Order which passes midnight is added to every day it intersects.
+    """
+    orders_by_day = defaultdict(list)
 
+    for order in orders:
+        day = localtime(order.start_time).date()
+        last_day = localtime(order.end_time - timedelta(microseconds=1)).date()
 
-def get_free_time(specialist, position, order_date, working_day):
-    """Return list of time moments."""
-    free_time = [
-        string_to_time(time) for time in working_day
-    ]
-    orders = get_orders_for_specific_date(specialist, position, order_date)
+        while day <= last_day:
+            orders_by_day[day].append(order)
+            day += timedelta(days=1)
 
-    # Adds all time moments from orders (start and end) to free_time list.
-    orders_time = [
-        order_time
-        for order in orders
-        for order_time in (
-            localtime(order.start_time).time(),
-            localtime(order.end_time).time(),
-        )
-    ]
+    return orders_by_day
 
-    free_time.extend(orders_time)
 
-    # Remove values that are dublicated, including origin of dublicated value.
-    # [1, 1, 2, 3, 4] then remove elements at 0 and 1 index.
-    free_time = [time for time in free_time if free_time.count(time) == 1]
-    free_time.sort()
+def get_free_intervals(working_day, orders, order_date):
+    """Return free intervals of the day in minutes.
 
-    return free_time
+    Args:
+        working_day (tuple): working hours in minutes, None for a day off
+        orders: orders of the day
+        order_date (date): day of the schedule
+
+    Returns:
+        list: sorted non-overlapping (start, end) pairs in minutes
+    """
+    return engine.subtract_intervals(
+        [working_day] if working_day else [],
+        engine.orders_to_intervals(orders, engine.day_start(order_date)),
+    )
+
+
+def get_free_time(specialist, position, order_date, working_day):
+    """Return list of free time blocks.
+
+    Each block is a [start, end] pair of time objects. Orders of the day are
+    subtracted from working hours, so touching or overlapping orders are
+    handled correctly. Free intervals are taken from availability cache,
+    orders are fetched for the local day like for ranges of days, so the
+    cached value doesn't depend on the view which computed it.
+    """
+    day = order_date.date()
+    free_intervals = availability_cache.get_free_intervals(
+        specialist.id, position.id, day,
+        lambda: get_free_intervals(
+            working_day, get_orders_for_date_range(specialist, day, day), day,
+        ),
+    )
+
+    return [
+        [engine.minutes_to_time(start), engine.minutes_to_time(end)]
+        for start, end in free_intervals
+    ]
 
 
 def get_time_intervals(start_time, end_time):
     """Divides given time range in blocks by 15 min."""
-    intervals = []
+    return [
+        engine.minutes_to_time(minutes)
+        for minutes in engine.split_interval(
+            engine.time_to_minutes(start_time),
+            engine.time_to_minutes(end_time),
+        )
+    ]
 
-    start_time = datetime.combine(date.today(), start_time)
-    end_time = datetime.combine(date.today(), end_time)
 
-    # If only one aviable block
-    if end_time >= start_time:
-        time_range = end_time - start_time
-    else:
-        time_range = (end_time + timedelta(hours=24)) - start_time
+def get_service_time_blocks(free_intervals, duration):
+    """Return lists of moments when the service can be started.
 
-    time_block = start_time
+    Args:
+        free_intervals (list): free intervals in minutes
+        duration (timedelta): service duration
 
-    for _ in range(time_range // timedelta(minutes=15) + 1):
-        intervals.append(time_block.time())
-        time_block += timedelta(minutes=15)
+    Returns:
+        list: list of time blocks, each of them is a list of time objects
+    """
+    fitting_intervals = engine.fit_intervals(
+        free_intervals, engine.duration_to_minutes(duration),
+    )
 
-    return intervals
+    return [
+        get_time_intervals(
+            engine.minutes_to_time(start), engine.minutes_to_time(end),
+        )
+        for start, end in fitting_intervals
+    ]
 
 
 def get_free_time_for_customer(specialist, service, order_date, working_day):
-    """Returns free time intervals."""
+    """Returns free time intervals.
+
+    Every interval is a list of moments when the service can be started.
+    """
     free_time = get_free_time(specialist, service.position, order_date, working_day)
 
-    new_free_time = []
+    return get_service_time_blocks(
+        [
+            (engine.time_to_minutes(start), engine.time_to_minutes(end))
+            for start, end in free_time
+        ],
+        service.duration,
+    )
+
 
-    for start, end in zip(free_time[::2], free_time[1::2]):
-        end = datetime.combine(datetime.today(), end)
+def get_free_time_for_customer_by_days(specialist, service, date_from, date_to):
+    """Return free time blocks for every day of the range.
 
-        if end - datetime.combine(
-            datetime.today(),
-            start,
-        ) >= service.duration:
-            new_free_time.extend((start, (end - service.duration).time()))
+    Free intervals are taken from availability cache, orders of the days
+    missing in cache are fetched with a single query and split by days in
+    memory.
 
-    # First value is start of free time block, and second is end of block.
-    free_time_blocks = [
-        get_time_intervals(start, end)
-        for start, end in
-        zip(new_free_time[::2], new_free_time[1::2])
+    Returns:
+        dict: ISO formatted dates as keys and time blocks as values, days off
+        have empty lists
+    """
+    position = service.position
+    weekly_hours = position.weekly_hours
+    days = [
+        date_from + timedelta(days=offset)
+        for offset in range((date_to - date_from).days + 1)
     ]
 
-    return free_time_blocks
+    def compute(missing_days):
+        orders_by_day = group_orders_by_day(
+            get_orders_for_date_range(specialist, missing_days[0], missing_days[-1]),
+        )
+        return {
+            day: get_free_intervals(
+                weekly_hours.day(day.weekday()), orders_by_day.get(day, ()), day,
+            )
+            for day in missing_days
+        }
 
+    free_intervals = availability_cache.get_many_free_intervals(
+        specialist.id, position.id, days, compute,
+    )
 
-def get_free_time_specialist_for_owner(specialist, position, order_date,
-                                       working_day, request):
-    """Return list of free time blocks and orders."""
-    specialist_schedule = get_free_time(specialist, position, order_date, working_day)
+    return {
+        day.isoformat(): get_service_time_blocks(free_intervals[day], service.duration)
+        for day in days
+    }
+
+
+def get_window_intervals(position, window_start, window_end):
+    """Return working intervals of the position inside of the time window.
+
+    Returns:
+        list: (midnight, intervals) pairs for every day of the window
+    """
+    window_days = []
+    weekly_hours = position.weekly_hours
+    day = localtime(window_start).date()
+    last_day = localtime(window_end).date()
+
+    while day <= last_day:
+        midnight = engine.day_start(day)
+        intervals = engine.intersect_intervals(
+            get_free_intervals(weekly_hours.day(day.weekday()), (), day),
+            [engine.datetime_range_to_interval(window_start, window_end, midnight)],
+        )
+        if intervals:
+            window_days.append((midnight, intervals))
+        day += timedelta(days=1)
+
+    return window_days
+
+
+def find_first_free_moment(window_days, orders, duration):
+    """Return the first moment when the service can be started or None.
+
+    Args:
+        window_days (list): (midnight, intervals) pairs of available time
+        orders (list): orders of the specialist
+        duration (timedelta): service duration
+    """
+    duration = engine.duration_to_minutes(duration)
+
+    for midnight, intervals in window_days:
+        fitting_intervals = engine.fit_intervals(
+            engine.subtract_intervals(
+                intervals, engine.orders_to_intervals(orders, midnight),
+            ),
+            duration,
+        )
+        if fitting_intervals:
+            return midnight + timedelta(minutes=fitting_intervals[0][0])
+
+
+def get_free_specialists(service, window_start, window_end):
+    """Return specialists of the service position who are free in the window.
+
+    Orders of all the specialists are fetched with one query and grouped
+    by specialist in memory.
 
-    specialist_schedule = [
-        [start, end]
-        for start, end in
-        zip(specialist_schedule[::2], specialist_schedule[1::2])
+    Returns:
+        list: dicts with specialist id, name and first possible start time
+    """
+    position = service.position
+    specialists = list(position.specialist.all())
+    window_days = get_window_intervals(position, window_start, window_end)
+
+    if not window_days:
+        return []
+
+    orders_by_specialist = defaultdict(list)
+    orders = Order.objects.filter(
+        specialist__in=specialists,
+        status__in=VALID_ORDER_STATUSES,
+        end_time__gt=window_start,
+        start_time__lt=window_end,
+    ).only("specialist_id", "start_time", "end_time")
+
+    for order in orders:
+        orders_by_specialist[order.specialist_id].append(order)
+
+    free_specialists = []
+    for specialist in specialists:
+        free_from = find_first_free_moment(
+            window_days, orders_by_specialist[specialist.id], service.duration,
+        )
+        if free_from:
+            free_specialists.append({
+                "id": specialist.id,
+                "name": specialist.get_full_name(),
+                "free_from": localtime(free_from),
+            })
+
+    return free_specialists
+
+
+def get_next_available_slot(specialist, service, start, horizon_days):
+    """Return the earliest moment the specialist can start the service or None.
+
+    Days are scanned forward from start in windows which double in size
+    (1, 2, 4, ... days), orders are fetched with one query per window and
+    the scan stops at the first window with a fitting slot. So amount of
+    queries grows logarithmically with the horizon and days after the first
+    free slot are never fetched.
+
+    Args:
+        specialist (CustomUser): specialist who provides the service
+        service (Service): service with position and duration
+        start (datetime): moment to search from
+        horizon_days (int): amount of days to search in
+
+    Returns:
+        datetime: start of the first free slot in local time or None
+    """
+    position = service.position
+    horizon_end = engine.day_start(localtime(start).date() + timedelta(days=horizon_days))
+    window_start = start
+    window_size = 1
+
+    while window_start < horizon_end:
+        # Windows end at midnight, so working hours of a day are never split
+        window_end = min(
+            engine.day_start(localtime(window_start).date() + timedelta(days=window_size)),
+            horizon_end,
+        )
+        window_days = get_window_intervals(position, window_start, window_end)
+
+        if window_days:
+            orders = Order.objects.filter(
+                specialist=specialist,
+                status__in=VALID_ORDER_STATUSES,
+                end_time__gt=window_start,
+                start_time__lt=window_end,
+            ).only("start_time", "end_time").order_by("start_time")
+
+            free_from = find_first_free_moment(window_days, list(orders), service.duration)
+            if free_from:
+                return localtime(free_from)
+
+        window_start = window_end
+        window_size *= 2
+
+
+def get_business_heatmap(business, week_start):
+    """Return heatmap of free specialists of the business for the week.
+
+    Positions with specialists and orders of all the specialists are
+    fetched with one query each, the rest is calculated with NumPy.
+
+    Args:
+        business (Business): business of specialists
+        week_start (date): first day of the week
+    """
+    positions = business.position_set.prefetch_related("specialist")
+    specialists = {}
+    masks = defaultdict(list)
+
+    for position in positions:
+        mask = heatmap.working_time_mask(position.weekly_hours)
+        for specialist in position.specialist.all():
+            specialists.setdefault(specialist.id, specialist)
+            masks[specialist.id].append(mask)
+
+    rows = {specialist_id: row for row, specialist_id in enumerate(specialists)}
+    working = np.zeros((len(rows), heatmap.BLOCKS_IN_WEEK), dtype=bool)
+    for specialist_id, specialist_masks in masks.items():
+        working[rows[specialist_id]] = np.logical_or.reduce(specialist_masks)
+
+    orders = Order.objects.filter(
+        specialist__in=list(rows),
+        status__in=VALID_ORDER_STATUSES,
+        end_time__gt=engine.day_start(week_start),
+        start_time__lt=engine.day_start(week_start + timedelta(days=heatmap.DAYS_IN_WEEK)),
+    ).values_list("specialist_id", "start_time", "end_time")
+
+    result = heatmap.build_heatmap(
+        working,
+        heatmap.busy_matrix(
+            len(rows),
+            [(rows[specialist_id], start, end) for specialist_id, start, end in orders],
+            week_start,
+        ),
+        week_start,
+    )
+    result["utilisation_by_specialist"] = [
+        {
+            "id": specialist.id,
+            "name": specialist.get_full_name(),
+            "utilisation": utilisation,
+        }
+        for specialist, utilisation in zip(
+            specialists.values(), result["utilisation_by_specialist"],
+        )
     ]
 
-    orders = get_orders_for_specific_date(specialist, position, order_date)
+    return result
+
+
+def get_owner_timeline(free_intervals, orders, midnight, request):
+    """Merge free intervals and orders of the day into a single timeline.
 
-    # Needed of use insert method and access to list in same loop
-    new_specialist_schedule = specialist_schedule.copy()
+    Both free intervals and orders are already sorted by start, so they are
+    merged in one sweep. Every order url is reversed only once.
 
-    for time in specialist_schedule:
-        current_order = [
-            OrderSerializer(order, context={"request": request}).data["url"]
-            for order in orders
-            if localtime(order.start_time).time() == time[1]
-        ]
+    Args:
+        free_intervals (list): free intervals of the day in minutes
+        orders (list): orders of the day sorted by start time
+        midnight (datetime): start of the day
+        request (Request): request for building absolute urls
 
-        if current_order:
-            new_specialist_schedule.insert(
-                new_specialist_schedule.index(time) + 1,
-                current_order[0],
+    Returns:
+        list: {"free": [start, end]} and {"order": url} entries ordered by time
+    """
+    timeline = []
+    order_index = 0
+
+    for free_start, free_end in free_intervals:
+        while order_index < len(orders):
+            order = orders[order_index]
+            order_start, _ = engine.datetime_range_to_interval(
+                order.start_time, order.end_time, midnight,
             )
+            if order_start > free_start:
+                break
 
-    start_order = [
-        OrderSerializer(order, context={"request": request}).data["url"]
-        for order in orders
-        if localtime(order.end_time).time() == specialist_schedule[0][0]
-    ]
+            timeline.append(get_order_entry(order, request))
+            order_index += 1
 
-    if start_order:
-        new_specialist_schedule.insert(0, start_order[0])
+        timeline.append({
+            "free": [engine.minutes_to_time(free_start), engine.minutes_to_time(free_end)],
+        })
 
-    return new_specialist_schedule
+    timeline.extend(get_order_entry(order, request) for order in orders[order_index:])
+
+    return timeline
+
+
+def get_order_entry(order, request):
+    """Return timeline entry of the order."""
+    return {
+        "order": reverse("api:order-detail", kwargs={"pk": order.pk}, request=request),
+    }
+
+
+def get_free_time_specialist_for_owner(specialist, position, order_date,
+                                       working_day, request):
+    """Return timeline of free time blocks and orders.
+
+    Orders of the day are fetched once and used both for calculating free
+    time and for the timeline.
+    """
+    day = order_date.date()
+    orders = list(
+        get_orders_for_date_range(specialist, day, day)
+        .only("id", "start_time", "end_time"),
+    )
+
+    return get_owner_timeline(
+        get_free_intervals(working_day, orders, day),
+        orders,
+        engine.day_start(day),
+        request,
+    )
+
+
+def get_business_day_schedule(business, order_date, request):
+    """Return timelines of all specialists of all business positions for the day.
+
+    Positions with specialists and services are fetched with prefetching
+    and orders of all the specialists with one query, so amount of queries
+    doesn't depend on amount of positions and specialists. Orders of other
+    positions of a specialist are shown in every position they hold.
+
+    Returns:
+        list: positions with their services and specialists' timelines
+    """
+    day = order_date.date()
+    midnight = engine.day_start(day)
+    positions = list(business.position_set.prefetch_related("specialist", "service_set"))
+    specialist_ids = {
+        specialist.id for position in positions for specialist in position.specialist.all()
+    }
+
+    orders_by_specialist = defaultdict(list)
+    orders = Order.objects.filter(
+        specialist__in=specialist_ids,
+        status__in=VALID_ORDER_STATUSES,
+        end_time__gt=midnight,
+        start_time__lt=engine.day_start(day + timedelta(days=1)),
+    ).only("id", "specialist_id", "start_time", "end_time").order_by("start_time")
+
+    for order in orders:
+        orders_by_specialist[order.specialist_id].append(order)
+
+    schedule = []
+    for position in positions:
+        working_day = position.weekly_hours.day(day.weekday())
+        specialists = []
+
+        for specialist in position.specialist.all():
+            specialist_orders = orders_by_specialist[specialist.id]
+            specialists.append({
+                "id": specialist.id,
+                "name": specialist.get_full_name(),
+                "schedule": get_owner_timeline(
+                    get_free_intervals(working_day, specialist_orders, day),
+                    specialist_orders,
+                    midnight,
+                    request,
+                ),
+            })
+
+        schedule.append({
+            "id": position.id,
+            "name": position.name,
+            "services": [
+                {"id": service.id, "name": service.name, "duration": service.duration}
+                for service in position.service_set.all()
+            ],
+            "specialists": specialists,
+        })
+
+    return schedule
+
+
+def check_specialist_service(position, specialist, service):
+    """Return error response if specialist or service don't belong to position."""
+    if specialist not in position.specialist.all():
+        return Response(
+            {"detail": "Such specialist doesn't hold position"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if service not in position.service_set.all():
+        return Response(
+            {"detail": "Such specialist doesn't have such service"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+
+def parse_date_param(value):
+    """Return date from YYYY-MM-DD string or None if value is invalid."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_datetime_param(value):
+    """Return aware datetime from ISO 8601 string or None if value is invalid."""
+    try:
+        value = parse_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if value and is_naive(value):
+        value = make_aware(value)
+    return value
 
 
 class SpecialistScheduleView(APIView):
     """View for displaying specialist's schedule."""
 
+    query_budget = 7
+
     def get(self, request, position_id,
             specialist_id, service_id, order_date):
         """GET method for retrieving schedule."""
@@ -165,17 +556,9 @@ class SpecialistScheduleView(APIView):
         specialist = get_object_or_404(CustomUser, id=specialist_id)
         service = get_object_or_404(Service, id=service_id)
 
-        if specialist not in position.specialist.all():
-            return Response(
-                {"detail": "Such specialist doesn't hold position"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        if service not in position.service_set.all():
-            return Response(
-                {"detail": "Such specialist doesn't have such service"},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        error_response = check_specialist_service(position, specialist, service)
+        if error_response:
+            return error_response
 
         if order_date.date() < date.today():
             return Response(
@@ -183,7 +566,7 @@ class SpecialistScheduleView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        working_day = get_working_day(position, order_date)
+        working_day = position.weekly_hours.day(order_date.weekday())
 
         if not working_day:
             return Response(
@@ -199,9 +582,148 @@ class SpecialistScheduleView(APIView):
         )
 
 
+class SpecialistRangeScheduleView(APIView):
+    """View for displaying specialist's schedule for a range of days."""
+
+    query_budget = 7
+
+    def get(self, request, position_id, specialist_id, service_id):
+        """GET method for retrieving schedule for every day from `from` to `to`.
+
+        Both query params are dates in YYYY-MM-DD format, `to` is inclusive.
+        """
+        position = get_object_or_404(Position, id=position_id)
+        specialist = get_object_or_404(CustomUser, id=specialist_id)
+        service = get_object_or_404(Service, id=service_id)
+
+        error_response = check_specialist_service(position, specialist, service)
+        if error_response:
+            return error_response
+
+        date_from = parse_date_param(request.query_params.get("from"))
+        date_to = parse_date_param(request.query_params.get("to"))
+
+        if not (date_from and date_to):
+            return Response(
+                {"detail": "from and to values must be provided as YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if date_from < date.today():
+            return Response(
+                {"detail": "You can't see schedule of the past days"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if not 0 <= (date_to - date_from).days < MAX_SCHEDULE_DAYS:
+            return Response(
+                {"detail": f"Range must contain from 1 to {MAX_SCHEDULE_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            get_free_time_for_customer_by_days(
+                specialist, service, date_from, date_to,
+            ),
+            status=status.HTTP_200_OK,
+        )
+
+
+class FreeSpecialistsView(APIView):
+    """View for searching specialists who can provide a service in time window."""
+
+    query_budget = 3
+
+    def get(self, request, service_id):
+        """GET method for retrieving free specialists.
+
+        Query params `start` and `end` are ISO 8601 datetimes, naive values are
+        considered to be in the local time zone.
+        """
+        service = get_object_or_404(
+            Service.objects.select_related("position"), id=service_id,
+        )
+
+        window_start = parse_datetime_param(request.query_params.get("start"))
+        window_end = parse_datetime_param(request.query_params.get("end"))
+
+        if not (window_start and window_end):
+            return Response(
+                {"detail": "start and end values must be provided as ISO datetimes"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if window_start >= window_end or window_end <= timezone.now():
+            return Response(
+                {"detail": "Time window must end in the future and after its start"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if window_end - window_start > timedelta(days=MAX_SCHEDULE_DAYS):
+            return Response(
+                {"detail": f"Time window can't be longer than {MAX_SCHEDULE_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        window_start = engine.round_up_datetime(max(window_start, timezone.now()))
+
+        return Response(
+            get_free_specialists(service, window_start, window_end),
+            status=status.HTTP_200_OK,
+        )
+
+
+class NextAvailableSlotView(APIView):
+    """View for finding the earliest time the specialist can provide a service."""
+
+    query_budget = 7
+
+    def get(self, request, position_id, specialist_id, service_id):
+        """GET method for retrieving the first free slot.
+
+        Optional query param `horizon` limits amount of days to search in.
+        """
+        position = get_object_or_404(Position, id=position_id)
+        specialist = get_object_or_404(CustomUser, id=specialist_id)
+        service = get_object_or_404(Service, id=service_id)
+
+        error_response = check_specialist_service(position, specialist, service)
+        if error_response:
+            return error_response
+
+        horizon = request.query_params.get("horizon", MAX_SCHEDULE_DAYS)
+        try:
+            horizon = int(horizon)
+        except (TypeError, ValueError):
+            horizon = 0
+
+        if not 0 < horizon <= MAX_NEXT_AVAILABLE_DAYS:
+            return Response(
+                {"detail": f"horizon must be from 1 to {MAX_NEXT_AVAILABLE_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        start = get_next_available_slot(
+            specialist, service, engine.round_up_datetime(timezone.now()), horizon,
+        )
+
+        if not start:
+            return Response(
+                {"detail": f"Specialist has no free time in the next {horizon} days"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(
+            {"start": start, "end": start + service.duration},
+            status=status.HTTP_200_OK,
+        )
+
+
 class OwnerSpecialistScheduleView(APIView):
     """View for displaying specialist's schedule for owner."""
 
+    query_budget = 7
+
     def get(self, request, position_id, specialist_id, order_date):
         """GET method for retrieving schedule."""
         if not request.user.is_owner:
@@ -212,7 +734,7 @@ class OwnerSpecialistScheduleView(APIView):
 
         position = get_object_or_404(Position, id=position_id)
         specialist = get_object_or_404(CustomUser, id=specialist_id)
-        working_day = get_working_day(position, order_date)
+        working_day = position.weekly_hours.day(order_date.weekday())
 
         if request.user != position.business.owner:
             return Response(
@@ -241,3 +763,58 @@ class OwnerSpecialistScheduleView(APIView):
             {"detail": "Specialist is not working on this day"},
             status=status.HTTP_200_OK,
         )
+
+
+class BusinessHeatmapView(APIView):
+    """View for displaying amount of free specialists of a business during a week."""
+
+    query_budget = 5
+
+    def get(self, request, business_id):
+        """GET method for retrieving heatmap.
+
+        Optional query param `week` is any date of the week in YYYY-MM-DD
+        format, current week is used by default.
+        """
+        business = get_object_or_404(Business, id=business_id)
+
+        if request.user != business.owner:
+            return Response(
+                {"detail": "Your are not a business owner"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        week = request.query_params.get("week")
+        week_day = parse_date_param(week) if week else timezone.localdate()
+
+        if not week_day:
+            return Response(
+                {"detail": "week value must be provided as YYYY-MM-DD"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            get_business_heatmap(business, week_day - timedelta(days=week_day.weekday())),
+            status=status.HTTP_200_OK,
+        )
+
+
+class OwnerBusinessScheduleView(APIView):
+    """View for displaying schedules of all specialists of a business for owner."""
+
+    query_budget = 5
+
+    def get(self, request, business_id, order_date):
+        """GET method for retrieving schedules of the day."""
+        business = get_object_or_404(Business, id=business_id)
+
+        if request.user.id != business.owner_id:
+            return Response(
+                {"detail": "Your are not a business owner"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            get_business_day_schedule(business, order_date, request),
+            status=status.HTTP_200_OK,
+        )
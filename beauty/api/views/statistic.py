@@ -4,20 +4,23 @@
 from rest_framework.generics import GenericAPIView
 from rest_framework.response import Response
 from rest_framework import status
+from collections import defaultdict
+from api import statistic_cache
 from api.models import Business, Order
-from django.db.models import Avg, Sum, Count
+from django.db.models import F, Q, Sum
+from django.db.models.functions import (Coalesce, TruncMonth, TruncQuarter,
+                                        TruncWeek, TruncYear)
 from datetime import date, timedelta, datetime
-from beauty.settings import TIME_ZONE
-import pytz
 from dateutil.relativedelta import relativedelta
+from rest_framework.permissions import IsAdminUser
 from api.permissions import IsOwner, IsAdminOrThisBusinessOwner
+from api.platform_statistic import get_platform_statistic
 from beauty.utils import Chart
 from api.serializers.chart_serializers import ChartSerializer
 import logging
 from enum import Enum
 
 
-CET = pytz.timezone(TIME_ZONE)
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +31,57 @@ class TimeIntervals(Enum):
     LAST_THREE_MONTHES = "lastThreeMonthes"
 
 
+class Granularity(Enum):
+    """Enum class which provides sizes of chart buckets."""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+    YEAR = "year"
+
+
+# Expression grouping rollups into the bucket, start of the bucket of a date,
+# step between buckets and chart label of the bucket
+GRANULARITY_BUCKETS = {
+    Granularity.DAY: (
+        F("date"),
+        lambda day: day,
+        relativedelta(days=1),
+        lambda bucket: bucket.isoformat(),
+    ),
+    Granularity.WEEK: (
+        TruncWeek("date"),
+        lambda day: day - timedelta(days=day.weekday()),
+        relativedelta(weeks=1),
+        lambda bucket: bucket.isoformat(),
+    ),
+    Granularity.MONTH: (
+        TruncMonth("date"),
+        lambda day: day.replace(day=1),
+        relativedelta(months=1),
+        lambda bucket: bucket.strftime("%Y-%m"),
+    ),
+    Granularity.QUARTER: (
+        TruncQuarter("date"),
+        lambda day: day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1),
+        relativedelta(months=3),
+        lambda bucket: f"{bucket.year}-Q{(bucket.month - 1) // 3 + 1}",
+    ),
+    Granularity.YEAR: (
+        TruncYear("date"),
+        lambda day: day.replace(month=1, day=1),
+        relativedelta(years=1),
+        lambda bucket: str(bucket.year),
+    ),
+}
+
+MAX_STATISTIC_YEARS = 10
+
+PLATFORM_STATISTIC_DAYS = 30
+PLATFORM_STATISTIC_TOP = 5
+MAX_PLATFORM_STATISTIC_TOP = 50
+
+
 class StatisticView(GenericAPIView):
     """Return data with general statistic statistic of each specialist.
 
@@ -37,18 +91,59 @@ class StatisticView(GenericAPIView):
     get: return results of all mentioned above methods
     """
 
+    query_budget = 9
+
     permission_classes = (IsOwner & IsAdminOrThisBusinessOwner,)
     queryset = Business.objects.all()
     lookup_url_kwarg = "business_id"
 
     def get(self, request, business_id):
-        """Return statistic, according to the timeInterval value.
+        """Return statistic, according to the requested period.
 
-        Check if timeInterval value is provided and correct, return data for
-        chart, business table and specialists table.
+        Period is either from/to dates with optional granularity or a
+        timeInterval value. Check if they are provided and correct, return
+        data for chart, business table and specialists table. Statistic is
+        cached until orders of the business change, Age header contains
+        amount of seconds since it was calculated.
         """
         business = self.get_object()
 
+        try:
+            interval, business_stats, count_orders = self._get_period(request, business)
+        except ValueError as error:
+            return Response(
+                {"detail": str(error)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        statistic, age = statistic_cache.get_statistic(
+            business.id, interval,
+            lambda: self._statistic(business, business_stats, count_orders),
+        )
+
+        logger.info(f"Statstic about business {business} was fetched.")
+        response = Response(statistic, status=status.HTTP_200_OK)
+        response["Age"] = age
+        return response
+
+    def _get_period(self, request, business):
+        """Return period key, rollups of the period and counter of orders for chart.
+
+        Raises:
+            ValueError: if period parameters are not provided or invalid
+        """
+        if "from" in request.GET:
+            date_from, date_to, granularity = parse_statistic_range(request.GET)
+            business_stats = business.get_daily_stats(date_from, date_to)
+
+            return (
+                f"{date_from}:{date_to}:{granularity.value}",
+                business_stats,
+                lambda: count_orders_by_granularity(
+                    business_stats, granularity, date_from, date_to,
+                ),
+            )
+
         time_interval = request.GET.get("timeInterval")
         if time_interval == TimeIntervals.CURRENT_WEEK.value:
             orders_date = date.today() - timedelta(days=6)
@@ -61,225 +156,402 @@ class StatisticView(GenericAPIView):
             orders_date = today - relativedelta(months=3)
 
         else:
-            return Response(
-                {"detail": "timeInterval value is not provided or invalid"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            raise ValueError("timeInterval value is not provided or invalid")
 
-        specialists = business.get_all_specialists()
-        business_orders = business.get_orders_by_date(
-            orders_date,
-        )
+        business_stats = business.get_daily_stats(orders_date)
 
-        orders_count_by_time = count_orders_by_time_interval(
-            business_orders, time_interval, orders_date,
+        return (
+            f"{time_interval}:{date.today()}",
+            business_stats,
+            lambda: count_orders_by_time_interval(
+                business_stats, time_interval, orders_date,
+            ),
         )
 
+    def _statistic(self, business, business_stats, count_orders):
+        """Return data for chart, business table and specialists table."""
+        orders_count_by_time = count_orders()
+
         labels = [label for label in orders_count_by_time]
         data = [el for el in orders_count_by_time.values()]
 
         line_chart_data = self._line_chart(labels, data)
 
-        genaral_business_stat = self._general_statistic(business_orders)
+        genaral_business_stat = self._general_statistic(business_stats)
         detailed_statistic = self._detailed_statistic(
-            business_orders, specialists,
+            business_stats, business.get_all_specialists(),
         )
 
-        statistic = {
+        return {
             "line_chart_data": line_chart_data,
             "general_statistic": genaral_business_stat,
             "business_specialists": detailed_statistic,
         }
 
-        logger.info(f"Statstic about business {business} was fetched.")
-        return Response(statistic, status=status.HTTP_200_OK)
-
     def _line_chart(self, labels, data):
         line_chart = Chart(labels, data)
         logger.info("Got labels and data for chart.")
         return ChartSerializer(line_chart).data
 
-    def _general_statistic(self, business_orders):
+    def _general_statistic(self, business_stats):
         """Return general statistic about business.
 
         This data is used for building business table on a FrontEnd statistic
-        page.
+        page. Counters, profit and average price are calculated with a single
+        aggregate query over daily rollups, services popularity with one
+        grouped query.
         """
-        business_profit = calc_sum_orders_price(business_orders)
-
-        business_orders_count = business_orders.count()
-        detailed_count = count_orders_by_status(business_orders)
+        statistic = aggregate_orders_statistic(business_stats)
 
-        business_average_order = business_orders.aggregate(
-            avg_price=Avg("service__price"),
-        )["avg_price"]
-
-        if not business_average_order:
-            business_average_order = 0
-
-        business_average_order = round(business_average_order, 2)
-
-        most_pop_service, least_pop_service = get_most_least_pop_service(
-            business_orders,
+        most_pop_service, least_pop_service = pick_most_least_pop_service(
+            count_orders_by_service(business_stats),
+            statistic["business_orders_count"],
         )
 
         result = {
-            "business_orders_count": business_orders_count,
-            "business_profit": business_profit,
-            "business_average_order": business_average_order,
+            "business_orders_count": statistic.pop("business_orders_count"),
+            "business_profit": statistic.pop("business_profit"),
+            "business_average_order": statistic.pop("business_average_order"),
             "most_popular_service": most_pop_service,
             "least_popular_service": least_pop_service,
         }
 
-        result.update(detailed_count)
+        result.update(statistic)
 
         logger.info("Got general statistic about business.")
         return [result]
 
-    def _detailed_statistic(self, business_orders, specialists):
+    def _detailed_statistic(self, business_stats, specialists):
         """Return detailed statistic about businesses' specialists.
 
         This data is used for building specialist table on a FrontEnd statistic
-        page.
+        page. Counters and profit of all specialists are calculated with one
+        grouped query over daily rollups, services popularity with another one.
         """
-        business_specialists = []
+        statistic_by_specialist = {
+            statistic.pop("specialist"): statistic
+            for statistic in business_stats.order_by().values("specialist").annotate(
+                specialist_orders_count=Sum("orders_count"),
+                specialist_orders_profit=Sum(
+                    "revenue", filter=Q(status=Order.StatusChoices.COMPLETED),
+                ),
+                **get_status_counters(),
+            )
+        }
 
-        for specialist in specialists.iterator():
+        services_by_specialist = defaultdict(list)
+        for service in business_stats.order_by().values(
+            "specialist", "service__name",
+        ).annotate(total=Sum("orders_count")):
+            services_by_specialist[service.pop("specialist")].append(service)
 
-            specialist_orders = business_orders.filter(specialist=specialist)
-            specialist_orders_count = specialist_orders.count()
-            orders_count_status = count_orders_by_status(
-                specialist_orders,
-            )
-            specialist_orders_profit = calc_sum_orders_price(
-                specialist_orders,
-            )
+        empty_statistic = {
+            "specialist_orders_count": 0,
+            "specialist_orders_profit": 0,
+            **{status_str.lower(): 0 for status_str in Order.StatusChoices.names},
+        }
+
+        business_specialists = []
 
-            most_pop_serv, least_pop_serv = get_most_least_pop_service(
-                specialist_orders,
+        for specialist in specialists:
+            statistic = statistic_by_specialist.get(specialist.id, empty_statistic)
+            most_pop_serv, least_pop_serv = pick_most_least_pop_service(
+                services_by_specialist[specialist.id],
+                statistic["specialist_orders_count"],
             )
 
             specialist_stat = {
                 "specialist_name": specialist.get_full_name(),
                 "most_pop_service": most_pop_serv,
                 "least_pop_service": least_pop_serv,
-                "specialist_orders_count": specialist_orders_count,
-                "specialist_orders_profit": specialist_orders_profit,
+                "specialist_orders_count": statistic["specialist_orders_count"],
+                "specialist_orders_profit": round(
+                    statistic["specialist_orders_profit"] or 0, 2,
+                ),
             }
 
-            specialist_stat.update(orders_count_status)
+            specialist_stat.update(
+                (status_str.lower(), statistic[status_str.lower()])
+                for status_str in Order.StatusChoices.names
+            )
             business_specialists.append(specialist_stat)
 
         logger.info("Got detailed statistic about each specilalist.")
         return business_specialists
 
 
-def calc_sum_orders_price(orders_queryset):
-    """Return sum of order's prices.
-
-    Args:
-        orders_queryset (QuerySet[Order])
+class PlatformStatisticView(GenericAPIView):
+    """Return statistic of all businesses of the platform for admins.
 
-    Returns:
-        int: total of order's prices
+    Totals and top businesses are merged from per-business partitions,
+    durations of computation stages are returned in timings and
+    Server-Timing header.
     """
-    orders_queryset = orders_queryset.filter(
-        status=Order.StatusChoices.COMPLETED,
-    )
-    sum_price = orders_queryset.aggregate(
-        total_price_orders=Sum("service__price"))["total_price_orders"]
 
-    if sum_price is None:
-        sum_price = 0
+    query_budget = 2
 
-    return round(sum_price, 2)
+    permission_classes = (IsAdminUser,)
 
+    def get(self, request):
+        """Return platform statistic of the period, the last 30 days by default.
 
-def count_orders_by_status(orders):
-    """Return dict with amount of orders depending on their status.
+        Query parameters: from and to dates and top - amount of businesses
+        in rankings.
+        """
+        date_to = date.today()
+        date_from = date_to - timedelta(days=PLATFORM_STATISTIC_DAYS - 1)
+
+        try:
+            if "from" in request.GET:
+                date_from, date_to, _ = parse_statistic_range(request.GET)
+            top = parse_top(request.GET)
+        except ValueError as error:
+            return Response(
+                {"detail": str(error)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-    Args:
-        orders (QuerySet[Order])
+        statistic, timer = get_platform_statistic(date_from, date_to, top)
+        statistic["period"] = {"from": date_from, "to": date_to}
+        statistic["timings"] = timer.timings
 
-    Returns:
-        dict: dict with orders amount, counted by its statuses
+        logger.info(f"Platform statistic was fetched by {request.user}.")
+        response = Response(statistic, status=status.HTTP_200_OK)
+        response["Server-Timing"] = timer.as_header()
+        return response
+
+
+def parse_top(params):
+    """Return amount of businesses in rankings from request parameters.
+
+    Raises:
+        ValueError: if top value is not a number from 1 to MAX_PLATFORM_STATISTIC_TOP
     """
+    message = f"top value should be from 1 to {MAX_PLATFORM_STATISTIC_TOP}"
+
+    try:
+        top = int(params.get("top", PLATFORM_STATISTIC_TOP))
+    except ValueError:
+        raise ValueError(message)
+
+    if not 1 <= top <= MAX_PLATFORM_STATISTIC_TOP:
+        raise ValueError(message)
+
+    return top
+
+
+def get_status_counters():
+    """Return dict with Sum of rollups' counters for every order status."""
     return {
-        status_str.lower(): orders.filter(status=status_int).count()
+        status_str.lower(): Coalesce(
+            Sum("orders_count", filter=Q(status=status_int)), 0,
+        )
         for status_str, status_int in
         Order.StatusChoices.__members__.items()
     }
 
 
-def count_orders_by_time_interval(orders, time_interval,
-                                  orders_date):
+def aggregate_orders_statistic(stats):
+    """Return orders amount, profit, average price and amount of every status.
+
+    All values are calculated with a single aggregate query.
+
+    Args:
+        stats (QuerySet[OrderDailyStat])
+
+    Returns:
+        dict: business_orders_count, business_profit, business_average_order
+        and amount of orders of every status
+    """
+    statistic = stats.aggregate(
+        business_orders_count=Coalesce(Sum("orders_count"), 0),
+        business_profit=Sum(
+            "revenue", filter=Q(status=Order.StatusChoices.COMPLETED),
+        ),
+        business_revenue=Sum("revenue"),
+        **get_status_counters(),
+    )
+
+    revenue = statistic.pop("business_revenue") or 0
+    orders_count = statistic["business_orders_count"]
+
+    statistic["business_profit"] = round(statistic["business_profit"] or 0, 2)
+    statistic["business_average_order"] = round(
+        revenue / orders_count if orders_count else 0, 2,
+    )
+
+    return statistic
+
+
+def count_orders_by_time_interval(stats, time_interval,
+                                  orders_date, today=None):
     """Return amount of orders starting from certain date.
 
+    Orders are counted by days or by months of the business time zone with
+    a single grouped query, buckets without orders are filled with zeros.
+
     Args:
-        orders (QuerySet[Order])
+        stats (QuerySet[OrderDailyStat])
         time_interval (str): time from which it is needed to count orders
         orders_date (date)
+        today (date, optional): last day of the chart, today by default
 
     Returns:
         dict: keys - time stamps and value - count of orders
     """
-    date_dict = {}
+    today = today or date.today()
+    if isinstance(orders_date, datetime):
+        orders_date = orders_date.date()
+
     time_with_date = [
         time_interval == TimeIntervals.CURRENT_WEEK.value,
         time_interval == TimeIntervals.CURRENT_MONTH.value,
     ]
 
     if any(time_with_date):
-        orders_date = datetime.combine(orders_date, datetime.min.time())
-        new_date = CET.localize(orders_date)
+        bucket_expression, step = F("date"), relativedelta(days=1)
+        first_bucket, last_bucket = orders_date, today
 
-        while new_date.date() != date.today() + timedelta(days=1):
-            orders_for_date = orders.filter(
-                start_time__range=(new_date, new_date + timedelta(days=1)),
-            ).count()
-            date_str = str(new_date.day) + " " + new_date.strftime("%B")[:3]
-            date_dict[date_str] = orders_for_date
-            new_date += timedelta(days=1)
+        def get_label(bucket):
+            return str(bucket.day) + " " + bucket.strftime("%B")[:3]
 
     else:
-        new_date = orders_date
-        current_month = date.today().month
+        bucket_expression, step = TruncMonth("date"), relativedelta(months=1)
+        first_bucket, last_bucket = orders_date.replace(day=1), today.replace(day=1)
+
+        def get_label(bucket):
+            return bucket.strftime("%B")
 
-        while new_date.month != current_month + 1:
-            orders_for_date = orders.filter(
-                start_time__month=new_date.month,
-            ).count()
-            date_dict[new_date.strftime("%B")] = orders_for_date
-            new_date += relativedelta(months=1)
+    counters = count_orders_by_buckets(stats, bucket_expression)
+
+    date_dict = {}
+    bucket = first_bucket
+    while bucket <= last_bucket:
+        date_dict[get_label(bucket)] = counters.get(bucket, 0)
+        bucket += step
 
     return date_dict
 
 
-def get_most_least_pop_service(orders):
-    """Return most and least popular service according to the orders.
+def parse_statistic_range(params):
+    """Return period and granularity of statistic from request parameters.
 
     Args:
-        orders (QuerySet[Order])
+        params (QueryDict): from and optional to dates in ISO format and
+            granularity, today and day by default
 
     Returns:
-        tuple: tuple of two elements: most and least popular service
+        tuple: first date, last date and Granularity
+
+    Raises:
+        ValueError: if parameters are invalid
+    """
+    try:
+        date_from = date.fromisoformat(params["from"])
+        date_to = date.fromisoformat(params.get("to") or date.today().isoformat())
+    except ValueError:
+        raise ValueError("from and to values should be dates in YYYY-MM-DD format")
+
+    if date_from > date_to:
+        raise ValueError("from value should not be later than to value")
+
+    if date_from + relativedelta(years=MAX_STATISTIC_YEARS) < date_to:
+        raise ValueError(f"Period should not be longer than {MAX_STATISTIC_YEARS} years")
+
+    try:
+        granularity = Granularity(params.get("granularity", Granularity.DAY.value))
+    except ValueError:
+        choices = ", ".join(granularity.value for granularity in Granularity)
+        raise ValueError(f"granularity value should be one of: {choices}")
+
+    return date_from, date_to, granularity
+
+
+def count_orders_by_granularity(stats, granularity, date_from, date_to):
+    """Return amount of orders for every bucket of the period.
+
+    Rollups are grouped into buckets with a single query, so its cost
+    depends on amount of days in the period, not on amount of orders.
+    Buckets without orders are filled with zeros.
+
+    Args:
+        stats (QuerySet[OrderDailyStat])
+        granularity (Granularity): size of buckets
+        date_from (date): first day of the period
+        date_to (date): last day of the period
+
+    Returns:
+        dict: keys - labels of buckets and value - count of orders
+    """
+    bucket_expression, get_bucket, step, get_label = GRANULARITY_BUCKETS[granularity]
+
+    counters = count_orders_by_buckets(stats, bucket_expression)
+
+    date_dict = {}
+    bucket = get_bucket(date_from)
+    while bucket <= date_to:
+        date_dict[get_label(bucket)] = counters.get(bucket, 0)
+        bucket += step
+
+    return date_dict
+
+
+def count_orders_by_buckets(stats, bucket_expression):
+    """Return amount of orders for every day or month in the business time zone.
+
+    Args:
+        stats (QuerySet[OrderDailyStat])
+        bucket_expression (Expression): date of rollup or its month
+
+    Returns:
+        dict: dates of buckets as keys and amount of orders as values
     """
-    count_services = orders.values("service__name").annotate(
-        total=Count("service__name"),
+    buckets = stats.order_by().annotate(
+        bucket=bucket_expression,
+    ).values("bucket").annotate(total=Sum("orders_count"))
+
+    return {
+        bucket["bucket"].date() if isinstance(bucket["bucket"], datetime)
+        else bucket["bucket"]: bucket["total"]
+        for bucket in buckets
+    }
+
+
+def count_orders_by_service(stats):
+    """Return amount of orders of every service with one grouped query.
+
+    Args:
+        stats (QuerySet[OrderDailyStat])
+
+    Returns:
+        list: dicts with service__name and total keys
+    """
+    return list(
+        stats.order_by().values("service__name").annotate(total=Sum("orders_count")),
     )
 
-    if count_services:
-        most_pop_service = max(
-            count_services, key=lambda x: x["total"])["service__name"]
-        least_pop_service = min(
-            count_services, key=lambda x: x["total"])["service__name"]
 
-        if len(orders) < 3:
-            message = "Not enought data"
-            most_pop_service, least_pop_service = (message,) * 2
+def pick_most_least_pop_service(count_services, orders_count):
+    """Return most and least popular service according to services' counters.
 
-    else:
+    Args:
+        count_services (list): dicts with service__name and total keys
+        orders_count (int): amount of orders
+
+    Returns:
+        tuple: tuple of two elements: most and least popular service
+    """
+    if not count_services:
         message = "No orders"
-        most_pop_service, least_pop_service = (message,) * 2
+        return (message,) * 2
+
+    if orders_count < 3:
+        message = "Not enought data"
+        return (message,) * 2
+
+    most_pop_service = max(
+        count_services, key=lambda x: x["total"])["service__name"]
+    least_pop_service = min(
+        count_services, key=lambda x: x["total"])["service__name"]
 
     return most_pop_service, least_pop_service
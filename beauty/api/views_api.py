@@ -28,6 +28,7 @@ from djoser.views import UserViewSet as DjoserUserViewSet
 from beauty.settings import EMAIL_HOST_USER
 
 from .filters import ServiceFilter
+from .scheduling import cache as availability_cache
 
 from .models import (Business, CustomUser, Order, Position, Service)
 
@@ -48,7 +49,7 @@ from .serializers.customuser_serializers import (CustomUserDetailSerializer,
                                                  SpecialistDetailSerializer)
 from .serializers.position_serializer import PositionGetSerializer, PositionSerializer
 from .serializers.service_serializers import ServiceSerializer
-from beauty.utils import (get_working_time_from_dict,
+from beauty.utils import (WeeklyHours, get_working_time_from_dict,
                           is_order_fit_working_time,
                           is_working_time_reduced,
                           update_position_time_by_business)
@@ -60,13 +61,17 @@ logger = logging.getLogger(__name__)
 class CustomUserListCreateView(ListCreateAPIView):
     """Generic API for users custom POST methods."""
 
-    queryset = CustomUser.objects.all()
+    query_budget = 3
+
+    queryset = CustomUser.objects.with_orders_count().prefetch_related("groups")
     serializer_class = CustomUserSerializer
 
 
 class UserActivationView(GenericAPIView):
     """Generic view for user account activation."""
 
+    query_budget = 2
+
     def get(self, request: object, uidb64: str, token: str):
         """Activate use account and redirect to personal page.
 
@@ -79,7 +84,7 @@ class UserActivationView(GenericAPIView):
 
         user = get_object_or_404(CustomUser, id=user_id)
         user.is_active = True
-        user.save()
+        user.save(update_fields=["is_active"])
 
         logger.info(f"User {user} was activated")
 
@@ -117,9 +122,11 @@ class CustomUserDetailRUDView(RetrieveUpdateDestroyAPIView):
     RUD - Retrieve, Update, Destroy.
     """
 
+    query_budget = 4
+
     permission_classes = [IsProfileOwner]
 
-    queryset = CustomUser.objects.all()
+    queryset = CustomUser.objects.with_orders_count().prefetch_related("groups")
 
     def get_serializer_class(self):
         """Return a needed serializer_class for specific object.
@@ -160,6 +167,8 @@ class CustomUserDetailRUDView(RetrieveUpdateDestroyAPIView):
 class SpecialistDetailView(RetrieveAPIView):
     """Generic API for specialists custom GET method."""
 
+    query_budget = 1
+
     queryset = CustomUser.objects.filter(groups__name__icontains="specialist")
     serializer_class = SpecialistDetailSerializer
 
@@ -167,6 +176,8 @@ class SpecialistDetailView(RetrieveAPIView):
 class PositionListCreateView(ListCreateAPIView):
     """Generic API for position POST methods."""
 
+    query_budget = 3
+
     permission_classes = (IsAuthenticated, IsPositionOwner)
 
     def get_serializer_class(self):
@@ -190,6 +201,8 @@ class PositionListCreateView(ListCreateAPIView):
 class PositionRetrieveUpdateDestroyView(RetrieveUpdateDestroyAPIView):
     """Generic API for position PUT, GET, DELTE methods."""
 
+    query_budget = 5
+
     queryset = Position.objects.all()
     serializer_class = PositionSerializer
     permission_classes = (IsAuthenticated, IsPositionOwner)
@@ -221,6 +234,8 @@ class RemoveSpecialistFromPosition(DestroyAPIView):
 class BusinessesListCreateAPIView(ListCreateAPIView):
     """List View for all businesses of current user & new business creation."""
 
+    query_budget = 4
+
     permission_classes = (IsAdminOrThisBusinessOwner & IsOwner,)
 
     def get_serializer_class(self):
@@ -239,7 +254,7 @@ class BusinessesListCreateAPIView(ListCreateAPIView):
 
         logger.info(f"Got businesses from owner {owner}")
 
-        return owner.businesses.all()
+        return owner.businesses.select_related("owner", "location")
 
     def post(self, request, *args, **kwargs):
         """Creates a business.
@@ -257,7 +272,9 @@ class BusinessesListCreateAPIView(ListCreateAPIView):
 class ActiveBusinessesListAPIView(ListAPIView):
     """List all active businesses for users."""
 
-    queryset = Business.objects.filter(is_active=True)
+    query_budget = 2
+
+    queryset = Business.objects.filter(is_active=True).select_related("owner", "location")
     serializer_class = BusinessInfoSerializer
 
     filter_backends = (SearchFilter, OrderingFilter)
@@ -271,8 +288,10 @@ class BusinessDetailRUDView(RetrieveUpdateDestroyAPIView):
     RUD - Retrieve, Update, Destroy.
     """
 
+    query_budget = 3
+
     permission_classes = (AllowAny,)
-    queryset = Business.objects.all()
+    queryset = Business.objects.select_related("owner", "location")
 
     def get_serializer_class(self):
         """Gets different serializers depending on current user roles.
@@ -371,9 +390,10 @@ class BusinessDetailRUDView(RetrieveUpdateDestroyAPIView):
         ):
             return super().put(request, *args, **kwargs)
 
+        request_weekly_hours = WeeklyHours.compile(request_working_time)
         orders = Order.objects.filter(service__position__business=business)
         for order in orders:
-            if is_order_fit_working_time(order, request_working_time):
+            if is_order_fit_working_time(order, request_weekly_hours):
                 continue
             specialist = order.specialist.email
             customer = order.customer.email
@@ -387,6 +407,8 @@ class BusinessDetailRUDView(RetrieveUpdateDestroyAPIView):
                 [customer, specialist],
             )
 
+        availability_cache.invalidate_positions(positions.values_list("id", flat=True))
+
         return super().put(request, *args, **kwargs)
 
     def patch(self, request, *args, **kwargs):
@@ -430,8 +452,9 @@ class BusinessDetailRUDView(RetrieveUpdateDestroyAPIView):
             status__in=valid_order_statuses,
         )
 
+        request_weekly_hours = WeeklyHours.compile(request_working_time)
         for order in orders:
-            if is_order_fit_working_time(order, request_working_time):
+            if is_order_fit_working_time(order, request_weekly_hours):
                 continue
 
             order.status = Order.StatusChoices.CANCELLED
@@ -445,12 +468,19 @@ class BusinessDetailRUDView(RetrieveUpdateDestroyAPIView):
                 EMAIL_HOST_USER,
                 [customer, specialist],
             )
+
+        availability_cache.invalidate_positions(
+            Position.objects.filter(business=business).values_list("id", flat=True),
+        )
+
         return super().patch(request, *args, **kwargs)
 
 
 class AllServicesListCreateView(ListCreateAPIView):
     """ListView to display all services or service creation."""
 
+    query_budget = 2
+
     permission_classes = [IsOwner | ReadOnly]
 
     queryset = Service.objects.all()
@@ -467,6 +497,8 @@ class AllServicesListCreateView(ListCreateAPIView):
 class ServiceUpdateView(RetrieveUpdateDestroyAPIView):
     """View for retrieving, updating or deleting service info."""
 
+    query_budget = 1
+
     permission_classes = [IsServiceOwner]
 
     queryset = Service.objects.all()
@@ -491,6 +523,8 @@ class ServiceUpdateView(RetrieveUpdateDestroyAPIView):
 class BusinessServicesView(ListAPIView):
     """View for retrieving all services providing by specific business."""
 
+    query_budget = 4
+
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
 
@@ -507,6 +541,8 @@ class BusinessServicesView(ListAPIView):
 class SpecialistsServicesView(ListAPIView):
     """View for retrieving all services providing by specific specialist."""
 
+    query_budget = 4
+
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
 
@@ -523,6 +559,10 @@ class SpecialistsServicesView(ListAPIView):
 class UserViewSet(DjoserUserViewSet):
     """This class is implemented to disable djoser DELETE method."""
 
+    query_budget = 3
+
+    queryset = CustomUser.objects.with_orders_count().prefetch_related("groups")
+
     @action(["get", "put", "patch"], detail=False)
     def me(self, request, *args, **kwargs):
         """Delete is now forbidden for this method."""
@@ -532,6 +572,8 @@ class UserViewSet(DjoserUserViewSet):
 class BusinessesListAPIView(ListAPIView):
     """List View for all nearest businesses next to current user or marker."""
 
+    query_budget = 2
+
     permission_classes = (AllowAny,)
     serializer_class = NearestBusinessesSerializer
 
@@ -553,6 +595,6 @@ class BusinessesListAPIView(ListAPIView):
             location__latitude__lt=target_latitude + delta,
             location__longitude__gt=target_longitude - delta,
             location__longitude__lt=target_longitude + delta,
-        )
+        ).select_related("owner", "location")
 
         return queryset
@@ -14,7 +14,9 @@ from decouple import config, Csv
 import sys
 import logging
 
-if len(sys.argv) > 1 and sys.argv[1] == "test":
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
+if TESTING:
     logging.disable(logging.CRITICAL)
 
 ACCOUNT_AUTHENTICATION_METHOD = "email"
@@ -179,6 +181,44 @@ DATABASES = {
     },
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+# Cached availability and statistic are invalidated by every gunicorn and
+# celery worker, so the cache must be shared between processes. Redis of
+# the celery broker is used by default, locmem is only for local development.
+if DEBUG:
+    DEFAULT_CACHE_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+    DEFAULT_CACHE_LOCATION = "beauty"
+else:
+    DEFAULT_CACHE_BACKEND = "django.core.cache.backends.redis.RedisCache"
+    DEFAULT_CACHE_LOCATION = config("BROKER_URL")
+
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default=DEFAULT_CACHE_BACKEND),
+        "LOCATION": config("CACHE_LOCATION", default=DEFAULT_CACHE_LOCATION),
+        "KEY_PREFIX": "beauty",
+    },
+}
+
+if TESTING:
+    # Cached data must not leak between tests, cache tests override it.
+    CACHES["default"] = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+
+AVAILABILITY_CACHE_TIMEOUT = config(
+    "AVAILABILITY_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int,
+)
+
+STATISTIC_CACHE_TIMEOUT = config(
+    "STATISTIC_CACHE_TIMEOUT", default=60 * 60, cast=int,
+)
+
+PLATFORM_STATISTIC_WORKERS = config("PLATFORM_STATISTIC_WORKERS", default=4, cast=int)
+
+# Pending or running report jobs older than this are considered lost
+REPORT_JOB_TIMEOUT = config("REPORT_JOB_TIMEOUT", default=60 * 30, cast=int)
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
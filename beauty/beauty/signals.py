@@ -2,11 +2,14 @@
 
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models.signals import (m2m_changed, post_delete, post_save, pre_delete,
+                                      pre_save)
 from django.dispatch import Signal, receiver
 from rest_framework.reverse import reverse
 
-from api.models import (Order, Invitation)
+from api.models import (CustomUser, Order, OrderDailyStat, Invitation, Position, Service)
+from api import statistic_cache
+from api.scheduling import cache as availability_cache
 from beauty.tokens import OrderApprovingTokenGenerator, SpecialistInviteTokenGenerator
 from beauty.utils import StatusOrderEmail
 
@@ -20,10 +23,112 @@ order_status_changed = Signal()
 def create_token_for_order(sender, instance, created, **kwargs):
     """Create order token."""
     if created:
-        instance.token = OrderApprovingTokenGenerator().make_token(instance)
+        token_generator = OrderApprovingTokenGenerator()
+        instance.token = token_generator.make_token(instance)
+        instance.token_expires_at = token_generator.get_expiration_time()
         instance.save()
 
 
+@receiver(post_save, sender=Order, dispatch_uid="invalidate_availability_for_order")
+@receiver(post_delete, sender=Order, dispatch_uid="invalidate_availability_for_deleted_order")
+def invalidate_availability_for_order(sender, instance, **kwargs):
+    """Invalidate cached free time of the days the order takes."""
+    availability_cache.invalidate_order(instance)
+
+
+@receiver(pre_save, sender=Order, dispatch_uid="remember_order_rollup_state")
+@receiver(pre_delete, sender=Order, dispatch_uid="remember_deleted_order_rollup_state")
+def remember_order_rollup_state(sender, instance, **kwargs):
+    """Remember stored rollup state of the order which wasn't fully loaded from database."""
+    if instance._state.adding or getattr(instance, "rollup_state", None):
+        return
+
+    instance.rollup_state = instance.get_stored_rollup_state()
+
+
+@receiver(post_save, sender=Order, dispatch_uid="update_rollup_for_order")
+def update_rollup_for_order(sender, instance, created, **kwargs):
+    """Move the order to the daily rollup row of its current state."""
+    previous_state = None if created else getattr(instance, "rollup_state", None)
+    state = instance.get_rollup_state() or instance.get_stored_rollup_state()
+
+    OrderDailyStat.objects.apply_order_change(previous_state, state)
+    instance.rollup_state = state
+
+
+@receiver(post_delete, sender=Order, dispatch_uid="update_rollup_for_deleted_order")
+def update_rollup_for_deleted_order(sender, instance, **kwargs):
+    """Remove the deleted order from its daily rollup row."""
+    OrderDailyStat.objects.apply_order_change(instance.rollup_state, None)
+
+
+@receiver(post_save, sender=Service, dispatch_uid="update_rollup_for_service")
+def update_rollup_for_service(sender, instance, created, **kwargs):
+    """Recalculate revenue of the service rollups with its current price."""
+    if not created:
+        OrderDailyStat.objects.update_service_revenue(instance)
+
+
+@receiver(post_save, sender=Order, dispatch_uid="invalidate_statistic_for_order")
+@receiver(post_delete, sender=Order, dispatch_uid="invalidate_statistic_for_deleted_order")
+def invalidate_statistic_for_order(sender, instance, **kwargs):
+    """Invalidate cached statistic of the order business."""
+    statistic_cache.invalidate_business(instance.service.position.business_id)
+
+
+@receiver(post_save, sender=Service, dispatch_uid="invalidate_statistic_for_service")
+def invalidate_statistic_for_service(sender, instance, **kwargs):
+    """Invalidate cached statistic of the service business."""
+    statistic_cache.invalidate_business(instance.position.business_id)
+
+
+@receiver(m2m_changed, sender=Position.specialist.through,
+          dispatch_uid="invalidate_statistic_for_specialists")
+def invalidate_statistic_for_specialists(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate cached statistic of businesses whose positions got or lost specialists."""
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if not reverse:
+        business_ids = [instance.business_id]
+    else:
+        positions = Position.objects.filter(specialist=instance)
+        if pk_set is not None:
+            positions = Position.objects.filter(id__in=pk_set)
+        business_ids = positions.values_list("business_id", flat=True).distinct()
+
+    for business_id in business_ids:
+        statistic_cache.invalidate_business(business_id)
+
+
+@receiver(post_save, sender=CustomUser, dispatch_uid="invalidate_statistic_for_specialist")
+def invalidate_statistic_for_specialist(sender, instance, created, update_fields, **kwargs):
+    """Invalidate cached statistic of businesses showing name of the specialist."""
+    name_fields = {"first_name", "last_name"}
+    if created or (update_fields is not None and not name_fields & set(update_fields)):
+        return
+
+    business_ids = Position.objects.filter(specialist=instance).values_list(
+        "business_id", flat=True,
+    ).distinct()
+
+    for business_id in business_ids:
+        statistic_cache.invalidate_business(business_id)
+
+
+@receiver(post_save, sender=Position, dispatch_uid="invalidate_availability_for_position")
+def invalidate_availability_for_position(sender, instance, **kwargs):
+    """Invalidate cached free time of all specialists of the position."""
+    availability_cache.invalidate_position(instance.id)
+
+
+@receiver(m2m_changed, sender=CustomUser.groups.through, dispatch_uid="forget_roles_of_user")
+def forget_roles_of_user(sender, instance, reverse, **kwargs):
+    """Forget cached roles of the user whose groups were changed."""
+    if not reverse:
+        instance.forget_roles()
+
+
 @receiver(post_save, sender=Invitation, dispatch_uid="")
 def create_token_for_invite(sender, instance, created, **kwargs):
     """Signal that creates token for an Invitation."""
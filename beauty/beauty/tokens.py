@@ -1,6 +1,10 @@
 """Module for all custom project tokens."""
 
+from datetime import datetime, timedelta
+
+from django.conf import settings
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.utils import timezone
 import logging
 
 
@@ -36,6 +40,13 @@ class OrderApprovingTokenGenerator(PasswordResetTokenGenerator):
 
         return f"{order.pk}{order.status}{update_at_timestamp}{timestamp}"
 
+    def get_expiration_time(self) -> datetime:
+        """Get time when a token made now stops being valid.
+
+        Returns (datetime): expiration time of the token
+        """
+        return timezone.now() + timedelta(seconds=settings.PASSWORD_RESET_TIMEOUT)
+
 
 class SpecialistInviteTokenGenerator(PasswordResetTokenGenerator):
     """This is a token for approving Position."""
@@ -43,6 +43,9 @@ def api_root(request, reverse_format=None):
     )
 
 
+api_root.query_budget = 0
+
+
 router = DefaultRouter()
 router.register("auth/users", UserViewSet)
 
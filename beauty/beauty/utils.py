@@ -3,7 +3,7 @@
 import os
 from datetime import timedelta, datetime, time
 from typing import Tuple, Sequence
-from functools import partial
+from functools import lru_cache, partial
 from geopy.geocoders import Nominatim
 from django.forms import ValidationError
 import pytz
@@ -11,6 +11,7 @@ from rest_framework.reverse import reverse
 from templated_mail.mail import BaseEmailMessage
 from faker import Faker
 from django.utils import timezone
+from django.utils.http import urlsafe_base64_encode
 from random import choice, randint
 import calendar
 
@@ -94,8 +95,48 @@ class CancelOrderEmail(BaseEmailMessage):
     template_name = "email/order_cancel.html"
 
 
+ORDER_APPROVING_URL_FIELDS = ("uid", "token", "status")
+ORDER_APPROVED_STATUS = urlsafe_base64_encode(b"approved")
+ORDER_DECLINED_STATUS = urlsafe_base64_encode(b"declined")
+
+
+@lru_cache
+def get_order_approving_path() -> str:
+    """Get path of the order approving view with placeholders instead of params.
+
+    The path is reversed only once, placeholders are `__<param>__` so they
+    aren't quoted by reverse.
+
+    Returns:
+        path(str): path with placeholders
+    """
+    return reverse(
+        "api:order-approving",
+        kwargs={field: f"__{field}__" for field in ORDER_APPROVING_URL_FIELDS},
+    )
+
+
+def get_order_approving_url_template(request=None) -> str:
+    """Get template of order approving URLs for `str.format`.
+
+    Args:
+        request: request data, the template is absolute if it's given
+
+    Returns:
+        template(str): URL with `{uid}`, `{token}` and `{status}` fields
+    """
+    template = get_order_approving_path()
+    if request is not None:
+        template = request.build_absolute_uri(template)
+
+    for field in ORDER_APPROVING_URL_FIELDS:
+        template = template.replace(f"__{field}__", f"{{{field}}}")
+    return template
+
+
 def order_approve_decline_urls(order: object, approve_name="url_for_approve",
-                               decline_name="url_for_decline", request=None) -> dict:
+                               decline_name="url_for_decline", request=None,
+                               url_template=None) -> dict:
     """Get URLs for approving and declining orders.
 
     Args:
@@ -103,23 +144,26 @@ def order_approve_decline_urls(order: object, approve_name="url_for_approve",
         decline_name (str): key name for declining URL
         request: request data
         order (Order): Order instance
+        url_template (str, optional): result of get_order_approving_url_template
+            to reuse it for many orders
 
     Returns:
         urls(dict): dict with URLs
     """
     from djoser.utils import encode_uid
 
-    urls = {}
-    params = {"uid": encode_uid(order.pk), "token": order.token}
+    if url_template is None:
+        url_template = get_order_approving_url_template(request)
 
-    url_approved_params = params | {"status": encode_uid("approved")}
-    urls[approve_name] = reverse("api:order-approving",
-                                 kwargs=url_approved_params, request=request)
-
-    url_declined_params = params | {"status": encode_uid("declined")}
-    urls[decline_name] = reverse("api:order-approving",
-                                 kwargs=url_declined_params, request=request)
-    return urls
+    uid = encode_uid(order.pk)
+    return {
+        approve_name: url_template.format(
+            uid=uid, token=order.token, status=ORDER_APPROVED_STATUS,
+        ),
+        decline_name: url_template.format(
+            uid=uid, token=order.token, status=ORDER_DECLINED_STATUS,
+        ),
+    }
 
 
 def validate_rounded_minutes_seconds(time_value):
@@ -164,6 +208,131 @@ def string_to_time(string):
     return datetime.strptime(string, "%H:%M").time()
 
 
+@lru_cache(maxsize=None)
+def string_to_minutes(string):
+    """Cast string HH:MM to amount of minutes since midnight.
+
+    Amount of distinct values is small, so every string is parsed only once.
+    """
+    value = string_to_time(string)
+    return value.hour * 60 + value.minute
+
+
+def minutes_to_time(minutes):
+    """Cast amount of minutes since midnight to time."""
+    return time(hour=minutes // 60, minute=minutes % 60)
+
+
+class WeeklyHours:
+    """Compiled working time of a week.
+
+    Working time JSON like {"Mon": ["09:00", "18:00"], "Sun": [], ...} is
+    parsed once into minute-of-week intervals, so working hours checks are
+    integer comparisons. Instances are immutable.
+
+    Every day is stored as None if it is missing in JSON, as empty tuple if it
+    is a day off or as (start, end) pair of minutes since week beginning.
+    """
+
+    DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    MINUTES_IN_DAY = 24 * 60
+
+    __slots__ = ("_days",)
+
+    def __init__(self, days):
+        """Initialize instance with a sequence of seven compiled days."""
+        object.__setattr__(self, "_days", tuple(days))
+
+    def __setattr__(self, name, value):
+        """Forbid changing of the instance."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        """Forbid changing of the instance."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __eq__(self, other):
+        """Compare compiled days of instances."""
+        if not isinstance(other, WeeklyHours):
+            return NotImplemented
+        return self._days == other._days
+
+    def __hash__(self):
+        """Return hash of compiled days."""
+        return hash(self._days)
+
+    def __repr__(self):
+        """Return string representation with compiled days."""
+        return f"{self.__class__.__name__}({self._days!r})"
+
+    @classmethod
+    def from_json(cls, working_time):
+        """Compile working time JSON."""
+        working_time = working_time or {}
+        days = []
+
+        for index, name in enumerate(cls.DAYS):
+            hours = working_time.get(name)
+
+            if hours is None:
+                days.append(None)
+            elif not hours:
+                days.append(())
+            else:
+                offset = index * cls.MINUTES_IN_DAY
+                days.append((
+                    offset + string_to_minutes(hours[0]),
+                    offset + string_to_minutes(hours[1]),
+                ))
+
+        return cls(days)
+
+    @classmethod
+    def compile(cls, working_time):
+        """Return working time as WeeklyHours, compile it if it is JSON.
+
+        Compiled values are shared between equal working times, so
+        compiling the same JSON again is just a lookup.
+        """
+        if isinstance(working_time, cls):
+            return working_time
+        return _compile_frozen_working_time(cls, freeze_working_time(working_time))
+
+    @property
+    def intervals(self):
+        """tuple: Minute-of-week intervals of all working days."""
+        return tuple(day for day in self._days if day)
+
+    def has_day(self, weekday):
+        """Return True if the day was present in working time JSON."""
+        return self._days[weekday] is not None
+
+    def day(self, weekday):
+        """Return (start, end) minutes since midnight or None for a day off.
+
+        Args:
+            weekday (int): number of day, for Monday is 0
+        """
+        hours = self._days[weekday]
+        if not hours:
+            return None
+
+        offset = weekday * self.MINUTES_IN_DAY
+        return hours[0] - offset, hours[1] - offset
+
+    def day_times(self, weekday):
+        """Return (start, end) time objects or None for a day off."""
+        hours = self.day(weekday)
+        if hours is None:
+            return None
+        return minutes_to_time(hours[0]), minutes_to_time(hours[1])
+
+    def contains(self, weekday, start, end):
+        """Return True if interval of the day in minutes is within working hours."""
+        hours = self.day(weekday)
+        return hours is not None and hours[0] <= start and end <= hours[1]
+
+
 class PositionAcceptEmail(BaseEmailMessage):
     """This is an email for confirming Position."""
 
@@ -226,6 +395,20 @@ class SpecialistAnswerEmail(BaseEmailMessage):
     template_name = "email/specialist_decision.html"
 
 
+def freeze_working_time(working_time):
+    """Return hashable copy of working time JSON."""
+    return tuple(
+        (day, tuple(hours) if hours is not None else None)
+        for day, hours in (working_time or {}).items()
+    )
+
+
+@lru_cache(maxsize=1024)
+def _compile_frozen_working_time(cls, frozen):
+    """Compile working time from its hashable copy."""
+    return cls.from_json({day: hours for day, hours in frozen})
+
+
 def generate_working_time(start_time: str, end_time: str):
     """Generates working time."""
     week_days = [day.capitalize()
@@ -295,51 +478,48 @@ def is_inside_interval(main_interval: tuple, inner_interval: tuple):
 
 
 def is_working_time_reduced(working_time, new_working_time):
-    """Returns true, if any day hours was reduced."""
-    changed_days = set(working_time).intersection(new_working_time)
-    for day in changed_days:
+    """Returns true, if any day hours was reduced.
 
-        if working_time[day] == new_working_time[day]:
-            continue
-        if len(working_time[day]) < len(new_working_time[day]):
-            continue
-        if len(working_time[day]) > len(new_working_time[day]):
-            return True
+    Only days present in both working times are compared.
+    """
+    working_time = WeeklyHours.compile(working_time)
+    new_working_time = WeeklyHours.compile(new_working_time)
 
-        new_interval = string_interval_to_time_interval(
-            new_working_time[day],
-        )
+    for weekday in range(len(WeeklyHours.DAYS)):
+        if not (working_time.has_day(weekday) and new_working_time.has_day(weekday)):
+            continue
 
-        old_interval = string_interval_to_time_interval(
-            working_time[day],
-        )
-        if is_inside_interval(old_interval, new_interval):
+        hours = working_time.day(weekday)
+        if hours is None:
+            continue
+        if not new_working_time.contains(weekday, *hours):
             return True
     return False
 
 
-def is_order_fit_working_time(order, working_time: dict):
-    """Returns True if order fit working_time."""
-    week_days = [day.capitalize()
-                 for day in calendar.HTMLCalendar.cssclasses]
+def is_order_fit_working_time(order, working_time):
+    """Returns True if order fit working_time.
 
-    order_day = timezone.localtime(order.start_time).weekday()
-    # If day became weekend
-    if working_time[week_days[order_day]] == []:
-        return False
+    Args:
+        order (Order): order instance
+        working_time (dict or WeeklyHours): working time, compile it once
+            when checking many orders
+    """
+    working_time = WeeklyHours.compile(working_time)
+
+    start_time = timezone.localtime(order.start_time)
+    end_time = timezone.localtime(order.end_time)
+    order_day = start_time.weekday()
 
-    order_interval = [
-        timezone.localtime(order.start_time).time(),
-        timezone.localtime(order.end_time).time(),
-    ]
     # If working day not changed (missing field in patch)
-    try:
-        working_interval = string_interval_to_time_interval(
-            working_time[week_days[order_day]],
-        )
-    except KeyError:
+    if not working_time.has_day(order_day):
         return True
-    return is_inside_interval(working_interval, order_interval)
+
+    return working_time.contains(
+        order_day,
+        start_time.hour * 60 + start_time.minute,
+        end_time.hour * 60 + end_time.minute,
+    )
 
 
 def get_working_time_from_dict(data) -> dict:
@@ -384,6 +564,9 @@ def get_working_time_from_dict(data) -> dict:
 
 def update_position_time_by_business(position_time, business_time):
     """Updates position working time based on business working_time."""
+    position_hours = WeeklyHours.compile(position_time)
+    business_hours = WeeklyHours.compile(business_time)
+
     for day, value in position_time.items():
         if business_time[day] == []:
             position_time[day] = []
@@ -392,9 +575,13 @@ def update_position_time_by_business(position_time, business_time):
             position_time[day] = business_time[day]
             continue
 
-        if string_to_time(business_time[day][0]) > string_to_time(value[0]):
+        weekday = WeeklyHours.DAYS.index(day)
+        business_start, business_end = business_hours.day(weekday)
+        position_start, position_end = position_hours.day(weekday)
+
+        if business_start > position_start:
             position_time[day][0] = business_time[day][0]
-        if string_to_time(business_time[day][1]) < string_to_time(value[1]):
+        if business_end < position_end:
             position_time[day][1] = business_time[day][1]
 
     return position_time
@@ -411,19 +598,17 @@ def get_order_expiration_time(order, date_time, time_delta_hours=3):
     Returns: date time expired order
 
     """
-    from api.views.schedule import get_working_day
-
-    working_day = get_working_day(order.service.position, date_time)
+    working_day = order.service.position.weekly_hours.day_times(date_time.weekday())
     eta = date_time + timedelta(hours=time_delta_hours)
     last_week_day = (order.created_at + timedelta(days=7)).date()
     if last_week_day == date_time.date():
         return None
     if working_day:
-        start_working_datetime, end_working_datetime = [datetime.strptime(t, "%H:%M")
-                                                        for t in working_day]
-        if start_working_datetime.time() < eta.time() < end_working_datetime.time():
+        start_working_time, end_working_time = working_day
+        if start_working_time < eta.time() < end_working_time:
             return eta
-        elif start_working_datetime.time() > eta.time():
+        elif start_working_time > eta.time():
+            start_working_datetime = datetime.combine(eta.date(), start_working_time)
             naive_datetime = timezone.datetime.combine(
                 eta.date(), (start_working_datetime + timedelta(hours=time_delta_hours)).time())
             return timezone.make_aware(naive_datetime)
@@ -12,6 +12,8 @@ cd beauty
 
 python3.9 manage.py makemigrations
 python3.9 manage.py migrate
+python3.9 manage.py rebuild_slots
+python3.9 manage.py rebuild_rollups
 python3.9 manage.py collectstatic --noinput
 
 sudo chmod -R 777 /home/ec2-user/Beauty